@@ -62,13 +62,13 @@ agv_fork_structure.add_support(n10.id, [0,1,2,3,4,5])
 agv_fork_structure.add_load(n1.id, [0, 1800, 0, 0, 0, 0])
 agv_fork_structure.add_load(n6.id, [0, 1800, 0, 0, 0, 0])
 
-visualize_structure(agv_fork_structure, scale = 10)
+visualize_structure(agv_fork_structure, scale = 10, name = "agvForkUndeformed")
 
 U = agv_fork_structure.solve()
 
 export_nodal_displacements(agv_fork_structure, U)
 
-visualize_structure(agv_fork_structure, U, scale = 10)
+visualize_structure(agv_fork_structure, U, scale = 10, name = "agvFork")
 # # plot_bending_shear_diagrams(agv_fork_structure, U)
 # animate_deformation(agv_fork_structure, U, scale = 10)
 
@@ -1,20 +1,37 @@
 import os
 from core.structure import Structure
+from core.compact_structure import CompactStructure
 from core.beamProperties import BeamProperties
 from core.visualise_structure import visualize_structure
 from core.evaluate_stress import calculate_stress
 from core.export_nodal_diaplacements import export_nodal_displacements
 from core.visualise_stress import plot_stress_distribution
 from core.report_generator import EngineeringReportGenerator
+from core.factorization_cache import FactorizationCache
+from core.results import LoadCaseResults
+from core.results_store import ResultsWriter
+from core.render_pipeline import RenderPipeline, STRESS_PLOTS
+from core.export_vtu import write_vtu_series
+from core.export_html import write_html_viewer
 
 class FEA_wrapper():
-    def __init__(self):
-        
+    def __init__(self, compact = False):
+        """
+        compact: store the frame as contiguous arrays (CompactStructure)
+        """
+        self.compact = compact
         self.beamPropertiesList = []
+        self.beamPropertiesIndex = {}  # name: BeamProperties, kept in sync by defineBeamProperty
         self.frameStructure = None
+        self.factorizationCache = None
+        self.lowRankUpdates = False
+        self.results = {}  # load case name: LoadCaseResults
+        self.resultsStore = None
+        self.images = {}  # load case name: [image paths]
+        self.renderPipeline = None
 
     def getBeamPropertyByName(self, name):
-        return next((item for item in self.beamPropertiesList if item.name == name))
+        return self.beamPropertiesIndex[name]
     
     def clearBCs(self, lists = []):
         self.frameStructure.loads.clear()
@@ -22,14 +39,36 @@ class FEA_wrapper():
         for mylist in lists:
             mylist.clear()
 
+    def enableFactorizationCache(self, max_entries = 8, cache_dir = None):
+        """
+        Reuse stiffness factorizations between solves of an unchanged frame.
+        cache_dir: optional directory to persist the factors between sessions
+        """
+        self.factorizationCache = FactorizationCache(max_entries, cache_dir)
+        if self.frameStructure is not None:
+            self.frameStructure.factorization_cache = self.factorizationCache
+            self.frameStructure.low_rank_update = self.lowRankUpdates
+
+    def enableLowRankUpdates(self):
+        """
+        Apply spring and other small stiffness edits as low-rank updates of the
+        previous factorization instead of refactorizing.
+        """
+        self.lowRankUpdates = True
+        if self.frameStructure is not None:
+            self.frameStructure.low_rank_update = True
+
     def defineBeamProperty(self, E, G, A, Iy, Iz, b = None, h = None, r = None, t = None, name = None):
         
         beamProp = BeamProperties(E, G, A, Iy, Iz, b, h, r, t, name)
         self.beamPropertiesList.append(beamProp)
+        self.beamPropertiesIndex.setdefault(name, beamProp)
 
     def loadFrameNodes(self):
 
-        self.frameStructure = Structure()
+        self.frameStructure = CompactStructure() if self.compact else Structure()
+        self.frameStructure.factorization_cache = self.factorizationCache
+        self.frameStructure.low_rank_update = self.lowRankUpdates
 
         # Add all frame nodes
         self.frameStructure.add_node(0, 0, 0)
@@ -254,24 +293,112 @@ class FEA_wrapper():
     def solve(self):
         self.U = self.frameStructure.solve()
 
-    def exportResults(self, name, scale = 2):
+    def getResults(self, name):
+        """
+        LoadCaseResults of the current solution, kept under the load case name.
+        """
+        results = self.results.get(name)
+        if results is None or results.U is not self.U:
+            results = LoadCaseResults(self.frameStructure, self.U, name)
+            self.results[name] = results
+        return results
+
+    def enableResultsStore(self, path = "results.fea"):
+        """
+        Write the results of every exported load case to one binary,
+        memory-mappable file (see core.results_store.ResultsReader).
+        """
+        self.closeResultsStore()
+        self.resultsStore = ResultsWriter(path)
+
+    def closeResultsStore(self):
+        if self.resultsStore is not None:
+            self.resultsStore.close()
+            self.resultsStore = None
+
+    def exportVTU(self, path = "results.pvd"):
+        """
+        Writes the exported load cases as binary .vtu files plus a .pvd index
+        for ParaView and other VTK viewers.
+        Returns: the .vtu file paths
+        """
+        return write_vtu_series(path, self.results.values())
+
+    def exportViewer(self, path = "results.html", scale = 2):
+        """
+        Writes the exported load cases to one interactive HTML viewer.
+        """
+        return write_html_viewer(path, self.results.values(), scale)
+
+    def enableParallelRendering(self, max_workers = None, start_method = "forkserver"):
+        """
+        Render the figures of exported load cases in worker processes.
+        Call renderFigures() (createReport does) to wait for them.
+        Scripts using it need an if __name__ == "__main__": guard unless
+        start_method is "fork".
+        """
+        self.closeParallelRendering()
+        self.renderPipeline = RenderPipeline(max_workers, start_method)
+
+    def closeParallelRendering(self):
+        """
+        Collects the figures still queued and stops parallel rendering.
+        """
+        if self.renderPipeline is not None:
+            self.renderFigures()
+            self.renderPipeline = None
+
+    def renderFigures(self):
+        """
+        Waits for the figures queued on the render pipeline, then shuts its
+        worker pool down; later exports start a new pool.
+        """
+        if self.renderPipeline is not None:
+            try:
+                for name, images in self.renderPipeline.wait().items():
+                    self.images[name] = [os.path.abspath(image) for image in images]
+            finally:
+                self.renderPipeline.close()
+
+    def exportResults(self, name, scale = 2, textExports = True):
+        """
+        textExports: also write the nodal displacement and stress .dat files
+        """
 
         for beam in self.beamPropertiesList:
             beam.export_data()
 
-        export_nodal_displacements(self.frameStructure, self.U, "nodal_displacement_{0}.dat".format(name))
-        calculate_stress(self.frameStructure, self.U, "stresses_output_{0}.dat".format(name))
-        visualize_structure(self.frameStructure, self.U, scale = scale, name = name)
-        plot_stress_distribution(self.frameStructure, self.U, stress_component = "sigma_axial", filename = "stress_{0}.png".format(name))
-        plot_stress_distribution(self.frameStructure, self.U, stress_component = "sigma_bending_y", filename = "stress_{0}.png".format(name))
-        plot_stress_distribution(self.frameStructure, self.U, stress_component = "sigma_bending_z", filename = "stress_{0}.png".format(name))
-        plot_stress_distribution(self.frameStructure, self.U, stress_component = "tau_torsion", filename = "stress_{0}.png".format(name))
-        plot_stress_distribution(self.frameStructure, self.U, stress_component = "sigma_total", filename = "stress_{0}.png".format(name))
+        results = self.getResults(name)
+        if self.resultsStore is not None:
+            self.resultsStore.metadata["beam_properties"] = [
+                {key: value if value is None or isinstance(value, str) else float(value)
+                 for key, value in vars(beam).items()} for beam in self.beamPropertiesList]
+            self.resultsStore.add(results)
+        if textExports:
+            export_nodal_displacements(self.frameStructure, self.U, "nodal_displacement_{0}.dat".format(name), results = results)
+            calculate_stress(self.frameStructure, self.U, "stresses_output_{0}.dat".format(name), results = results)
+        if self.renderPipeline is not None:
+            self.renderPipeline.submit(self.frameStructure, results, scale)
+            return
+
+        images = [visualize_structure(self.frameStructure, self.U, scale = scale, name = name, results = results)]
+        for component in STRESS_PLOTS:
+            images.append(plot_stress_distribution(self.frameStructure, self.U, stress_component = component,
+                                                   filename = "stress_{0}.png".format(name), results = results))
+        self.images[name] = [os.path.abspath(image) for image in images]
         
 
     def createReport(self):
 
-        gen = EngineeringReportGenerator(os.getcwd())
+        self.renderFigures()
+
+        # Hand over the in-memory results; the working directory is only
+        # scanned when nothing was exported in this session
+        if self.results:
+            gen = EngineeringReportGenerator(os.getcwd(), results = self.results,
+                                             properties = self.beamPropertiesList, images = self.images)
+        else:
+            gen = EngineeringReportGenerator(os.getcwd())
         gen.generate()
 
 
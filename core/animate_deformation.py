@@ -4,8 +4,34 @@ import matplotlib.animation as animation
 from mpl_toolkits.mplot3d.art3d import Line3DCollection
 from matplotlib.animation import FFMpegWriter
 import os
+import subprocess
+from core.render_pipeline import process_pool
+
+N_FRAMES = 30
+FPS = 15
+BITRATE = 1800
+
+
+def animate_deformation(structure, U, scale=1.0, save_path="deformation_animation.mp4", fast=False,
+                        frames_dir=None, max_workers=None, start_method="forkserver"):
+    """
+    fast: compute the segments once and only update the deformed line
+          collection per frame instead of clearing and rebuilding the axes
+    frames_dir: render the frames in parallel to PNG files in this directory
+                (implies fast) and encode them with ffmpeg; with save_path=None
+                only the frames are written
+    max_workers: number of frame rendering processes (frames_dir only)
+    start_method: multiprocessing start method of the frame pool (see process_pool)
+    Returns: absolute path of the movie, or the frame files without save_path
+    """
+    if frames_dir is not None:
+        frames = render_deformation_frames(structure, U, scale, frames_dir, max_workers, start_method)
+        if save_path is None:
+            return frames
+        return encode_frames(frames_dir, save_path)
+    if fast:
+        return _animate_fast(structure, U, scale, save_path)
 
-def animate_deformation(structure, U, scale=1.0, save_path="deformation_animation.mp4"):
     fig = plt.figure()
     ax = fig.add_subplot(111, projection='3d')
 
@@ -57,10 +83,111 @@ def animate_deformation(structure, U, scale=1.0, save_path="deformation_animatio
 
 
     ani = animation.FuncAnimation(
-        fig, update, frames=np.linspace(0, scale, 30), interval=100
+        fig, update, frames=np.linspace(0, scale, N_FRAMES), interval=100
     )
 
-    writer = FFMpegWriter(fps=15, bitrate=1800)
+    writer = FFMpegWriter(fps=FPS, bitrate=BITRATE)
     ani.save(save_path, writer=writer)
     plt.close()
     return os.path.abspath(save_path)
+
+
+def deformation_segments(structure, U):
+    """
+    Returns: (E, 2, 3) undeformed beam segments and the (E, 2, 3) nodal
+             translations of their ends; the segments of frame factor f are
+             original + f * translations
+    """
+    coords = structure.node_coordinates()
+    connectivity = structure.beam_connectivity()
+    translations = np.asarray(U, dtype=float).reshape(-1, 6)[:, :3]
+    return coords[connectivity], translations[connectivity]
+
+
+def _deformation_figure(original):
+    """
+    Figure with the fixed axes, the undeformed structure and the deformed
+    line collection whose segments are updated per frame.
+    """
+    fig = plt.figure()
+    ax = fig.add_subplot(111, projection='3d')
+
+    all_coords = original.reshape(-1, 3)
+    x_min, y_min, z_min = all_coords.min(axis=0) - 1
+    x_max, y_max, z_max = all_coords.max(axis=0) + 1
+    ax.set_xlim([x_min, x_max])
+    ax.set_ylim([y_min, y_max])
+    ax.set_zlim([z_min, z_max])
+    ax.set_title("Animated Deformation")
+    ax.set_box_aspect([x_max - x_min, y_max - y_min, z_max - z_min])
+    ax.view_init(elev=30, azim=45)
+
+    ax.add_collection3d(Line3DCollection(original, colors='gray', linewidths=1.5, linestyles='dashed'))
+    deformed_lc = Line3DCollection(original, colors='blue', linewidths=2)
+    ax.add_collection3d(deformed_lc)
+    return fig, deformed_lc
+
+
+def _animate_fast(structure, U, scale, save_path):
+    original, translations = deformation_segments(structure, U)
+    fig, deformed_lc = _deformation_figure(original)
+
+    def update(frame):
+        deformed_lc.set_segments(original + frame * translations)
+        return deformed_lc,
+
+    ani = animation.FuncAnimation(
+        fig, update, frames=np.linspace(0, scale, N_FRAMES), interval=100
+    )
+
+    writer = FFMpegWriter(fps=FPS, bitrate=BITRATE)
+    ani.save(save_path, writer=writer)
+    plt.close(fig)
+    return os.path.abspath(save_path)
+
+
+def _render_frames(original, translations, frames, frames_dir):
+    """
+    Worker: renders the given (frame index, factor) pairs on one figure.
+    """
+    fig, deformed_lc = _deformation_figure(original)
+    files = []
+    for index, factor in frames:
+        deformed_lc.set_segments(original + factor * translations)
+        files.append(os.path.join(frames_dir, "frame_{0:04d}.png".format(index)))
+        fig.savefig(files[-1])
+    plt.close(fig)
+    return files
+
+
+def render_deformation_frames(structure, U, scale=1.0, frames_dir="deformation_frames", max_workers=None,
+                              start_method="forkserver"):
+    """
+    Renders the animation frames to frames_dir/frame_0000.png, ... with the
+    frames split over a pool of worker processes.
+    Returns: absolute paths of the frame files in frame order
+    """
+    frames_dir = os.path.abspath(frames_dir)
+    os.makedirs(frames_dir, exist_ok=True)
+    original, translations = deformation_segments(structure, U)
+    frames = list(enumerate(np.linspace(0, scale, N_FRAMES)))
+
+    max_workers = min(max_workers or os.cpu_count(), N_FRAMES)
+    with process_pool(max_workers, start_method) as pool:
+        chunks = [frames[k::max_workers] for k in range(max_workers)]
+        futures = [pool.submit(_render_frames, original, translations, chunk, frames_dir) for chunk in chunks]
+        files = [f for future in futures for f in future.result()]
+    return sorted(files)
+
+
+def encode_frames(frames_dir, save_path="deformation_animation.mp4"):
+    """
+    Encodes frames_dir/frame_%04d.png with the ffmpeg binary used by
+    matplotlib's FFMpegWriter.
+    """
+    command = [plt.rcParams['animation.ffmpeg_path'], '-y', '-framerate', str(FPS),
+               '-i', os.path.join(frames_dir, "frame_%04d.png"),
+               '-vcodec', plt.rcParams['animation.codec'], '-b:v', '{0}k'.format(BITRATE),
+               '-pix_fmt', 'yuv420p', save_path]
+    subprocess.run(command, check=True, capture_output=True)
+    return os.path.abspath(save_path)
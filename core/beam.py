@@ -1,4 +1,5 @@
 import numpy as np
+from functools import cached_property
 
 class BeamElement3D:
 
@@ -18,9 +19,20 @@ class BeamElement3D:
         self.name = beam_properties.name # Beam group name
 
         self.length, self.direction_cosines = self._compute_geometry()
-        self.k_local = self._compute_local_stiffness()
-        self.T = self._compute_transformation_matrix()
-        self.k_global = self.T.T @ self.k_local @ self.T
+
+    # Element matrices are built on first access; Structure assembles all
+    # beams at once with compute_global_stiffness_batch instead.
+    @cached_property
+    def k_local(self):
+        return self._compute_local_stiffness()
+
+    @cached_property
+    def T(self):
+        return self._compute_transformation_matrix()
+
+    @cached_property
+    def k_global(self):
+        return self.T.T @ self.k_local @ self.T
 
     def _compute_geometry(self):
         delta = self.node2.coords - self.node1.coords
@@ -139,4 +151,133 @@ class BeamElement3D:
             'sigma_bending_z': sigma_b_z,
             'tau_torsion': tau,
             'sigma_total': sigma_total
-        }
\ No newline at end of file
+        }
+
+# Stress components of Structure.recover_element_results, each at both beam ends
+STRESS_COMPONENTS = ('sigma_axial', 'sigma_bending_y', 'sigma_bending_z', 'tau_torsion', 'sigma_total', 'von_mises')
+ELEMENT_RESULTS_DTYPE = np.dtype([('forces', float, (12,))] + [(name, float, (2,)) for name in STRESS_COMPONENTS])
+
+
+def compute_local_stiffness_batch(E, G, A, Iy, Iz, J, L):
+    """
+    Local stiffness matrices of many beams at once.
+    All arguments are arrays of shape (n_elem,).
+    Returns: (n_elem, 12, 12) array, identical to BeamElement3D._compute_local_stiffness
+    """
+    E, G, A, Iy, Iz, J, L = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (E, G, A, Iy, Iz, J, L)))
+    L2 = L ** 2
+    L3 = L ** 3
+
+    k = np.zeros((len(L), 12, 12))
+
+    def put(entries, value):
+        for i, j in entries:
+            k[:, i, j] = value
+
+    # Axial and torsional stiffness
+    put([(0, 0), (6, 6)], E * A / L)
+    put([(0, 6), (6, 0)], -E * A / L)
+    put([(3, 3), (9, 9)], G * J / L)
+    put([(3, 9), (9, 3)], -G * J / L)
+
+    # Bending about Z-axis (Y-direction displacement)
+    put([(1, 1), (7, 7)], 12 * E * Iz / L3)
+    put([(1, 7), (7, 1)], -12 * E * Iz / L3)
+    put([(1, 5), (5, 1), (1, 11), (11, 1)], 6 * E * Iz / L2)
+    put([(5, 7), (7, 5), (11, 7), (7, 11)], -6 * E * Iz / L2)
+    put([(5, 11), (11, 5)], 2 * E * Iz / L)
+    put([(5, 5), (11, 11)], 4 * E * Iz / L)
+
+    # Bending about Y-axis (Z-direction displacement)
+    put([(2, 2), (8, 8)], 12 * E * Iy / L3)
+    put([(2, 8), (8, 2)], -12 * E * Iy / L3)
+    put([(2, 4), (4, 2), (2, 10), (10, 2)], -6 * E * Iy / L2)
+    put([(4, 8), (8, 4), (10, 8), (8, 10)], 6 * E * Iy / L2)
+    put([(4, 10), (10, 4)], 2 * E * Iy / L)
+    put([(4, 4), (10, 10)], 4 * E * Iy / L)
+
+    return k
+
+
+def compute_rotation_batch(coords1, coords2):
+    """
+    Lengths and 3x3 rotation blocks of many beams at once.
+    coords1, coords2: (n_elem, 3) end node coordinates
+    Returns: L (n_elem,), R (n_elem, 3, 3) with the same convention as
+             BeamElement3D._compute_transformation_matrix
+    """
+    delta = np.asarray(coords2, dtype=float) - np.asarray(coords1, dtype=float)
+    L = np.linalg.norm(delta, axis=1)
+    x_local = delta / L[:, None]
+
+    # Global Z as reference, global Y for vertical beams
+    ref = np.tile([0.0, 0.0, 1.0], (len(L), 1))
+    vertical = np.all(np.isclose(np.abs(x_local), ref), axis=1)
+    ref[vertical] = [0.0, 1.0, 0.0]
+
+    z_local = np.cross(x_local, ref)
+    z_local /= np.linalg.norm(z_local, axis=1)[:, None]
+    y_local = np.cross(z_local, x_local)
+    y_local /= np.linalg.norm(y_local, axis=1)[:, None]
+
+    R = np.stack((x_local, y_local, z_local), axis=2)  # columns are local axes
+    return L, R
+
+
+def compute_global_stiffness_batch(coords1, coords2, E, G, A, Iy, Iz, J):
+    """
+    Global stiffness matrices of many beams at once.
+    coords1, coords2: (n_elem, 3) end node coordinates
+    E, G, A, Iy, Iz, J: (n_elem,) section properties
+    Returns: (n_elem, 12, 12) stack of T.T @ k_local @ T
+
+    T is block diagonal with four copies of R, so each 3x3 block of the
+    global matrix is R.T @ k_ab @ R and the 12x12 products are never formed.
+    """
+    L, R = compute_rotation_batch(coords1, coords2)
+    k_local = compute_local_stiffness_batch(E, G, A, Iy, Iz, J, L)
+
+    n = len(L)
+    k_blocks = k_local.reshape(n, 4, 3, 4, 3)
+    k_global = np.einsum('nji,najbk,nkl->naibl', R, k_blocks, R, optimize=True)
+    return k_global.reshape(n, 12, 12)
+
+
+def compute_internal_forces_batch(coords1, coords2, E, G, A, Iy, Iz, J, u_elem):
+    """
+    Local internal force vectors of many beams at once.
+    coords1, coords2: (n_elem, 3) end node coordinates
+    E, G, A, Iy, Iz, J: (n_elem,) section properties
+    u_elem: (n_elem, 12) element displacements in global coordinates, or
+            (n_elem, 12, n_cases) for several displacement fields
+    Returns: array shaped like u_elem, identical to compute_internal_forces
+    """
+    L, R = compute_rotation_batch(coords1, coords2)
+    k_local = compute_local_stiffness_batch(E, G, A, Iy, Iz, J, L)
+
+    u_elem = np.asarray(u_elem, dtype=float)
+    u = u_elem.reshape(len(L), 4, 3, -1)
+    u_local = np.einsum('nij,najc->naic', R, u).reshape(len(L), 12, -1)
+    return np.einsum('nij,njc->nic', k_local, u_local).reshape(u_elem.shape)
+
+
+def compute_stresses_batch(f_local, A, Iy, Iz, J, c_y, c_z, c_t):
+    """
+    Stresses of many beams at once, as in BeamElement3D.compute_stresses.
+    f_local: (n_elem, 12) local internal forces, or (n_elem, 12, n_cases)
+    A, Iy, Iz, J, c_y, c_z, c_t: (n_elem,) section values
+    Returns: dict of (n_elem,) or (n_elem, n_cases) arrays
+    """
+    f_local = np.asarray(f_local, dtype=float)
+    shape = (-1,) + (1,) * (f_local.ndim - 2)
+    A, Iy, Iz, J, c_y, c_z, c_t = (np.asarray(v, dtype=float).reshape(shape) for v in (A, Iy, Iz, J, c_y, c_z, c_t))
+
+    sigma_b_y = -f_local[:, 5] * c_y / Iz
+    sigma_b_z = f_local[:, 4] * c_z / Iy
+    return {
+        'sigma_axial': f_local[:, 0] / A,
+        'sigma_bending_y': sigma_b_y,
+        'sigma_bending_z': sigma_b_z,
+        'tau_torsion': f_local[:, 3] * c_t / J,
+        'sigma_total': np.sqrt(sigma_b_y**2 + sigma_b_z**2)
+    }
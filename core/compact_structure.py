@@ -0,0 +1,251 @@
+import numpy as np
+from core.structure import Structure
+from core.beam import BeamElement3D, compute_rotation_batch, compute_local_stiffness_batch
+
+
+class _GrowableArray:
+    """
+    Row-appendable ndarray with amortized doubling of its capacity.
+    """
+
+    def __init__(self, width, dtype):
+        self._data = np.zeros((16, width), dtype=dtype)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def extend(self, rows):
+        rows = np.asarray(rows, dtype=self._data.dtype).reshape(-1, self._data.shape[1])
+        needed = self._size + len(rows)
+        if needed > len(self._data):
+            capacity = max(needed, 2 * len(self._data))
+            data = np.zeros((capacity, self._data.shape[1]), dtype=self._data.dtype)
+            data[:self._size] = self._data[:self._size]
+            self._data = data
+        self._data[self._size:needed] = rows
+        self._size = needed
+
+    @property
+    def array(self):
+        return self._data[:self._size]
+
+
+class NodeView:
+    """
+    Node-like view of one row of a CompactStructure coordinate array.
+    """
+    __slots__ = ("_structure", "id")
+
+    def __init__(self, structure, node_id):
+        self._structure = structure
+        self.id = node_id
+
+    @property
+    def coords(self):
+        return self._structure.coords[self.id]
+
+    @property
+    def dofs(self):
+        return [6 * self.id + i for i in range(6)]
+
+    def __eq__(self, other):
+        return (isinstance(other, NodeView) and other._structure is self._structure
+                and other.id == self.id)
+
+    def __hash__(self):
+        return hash((id(self._structure), self.id))
+
+    def __repr__(self):
+        return f"<Node {self.id}>"
+
+
+def _section_attribute(name):
+    return property(lambda self: getattr(self.section, name))
+
+
+class BeamView:
+    """
+    BeamElement3D-like view of one row of a CompactStructure connectivity
+    array. Geometry and matrices are computed on access and not stored.
+    """
+    __slots__ = ("_structure", "index")
+
+    def __init__(self, structure, index):
+        self._structure = structure
+        self.index = index
+
+    @property
+    def node1(self):
+        return NodeView(self._structure, int(self._structure.connectivity[self.index, 0]))
+
+    @property
+    def node2(self):
+        return NodeView(self._structure, int(self._structure.connectivity[self.index, 1]))
+
+    @property
+    def section(self):
+        return self._structure.sections[self._structure.section_ids[self.index]]
+
+    E = _section_attribute("E")
+    G = _section_attribute("G")
+    A = _section_attribute("A")
+    Iy = _section_attribute("Iy")
+    Iz = _section_attribute("Iz")
+    J = _section_attribute("J")
+    b = _section_attribute("b")
+    h = _section_attribute("h")
+    r = _section_attribute("r")
+    t = _section_attribute("t")
+    name = _section_attribute("name")
+
+    def _rotation(self):
+        return compute_rotation_batch(self.node1.coords[None], self.node2.coords[None])
+
+    @property
+    def length(self):
+        return self._rotation()[0][0]
+
+    @property
+    def direction_cosines(self):
+        return self._rotation()[1][0][:, 0]
+
+    @property
+    def k_local(self):
+        props = [[value] for value in (self.E, self.G, self.A, self.Iy, self.Iz, self.J, self.length)]
+        return compute_local_stiffness_batch(*props)[0]
+
+    @property
+    def T(self):
+        return np.kron(np.eye(4), self._rotation()[1][0])
+
+    @property
+    def k_global(self):
+        T = self.T
+        return T.T @ self.k_local @ T
+
+    get_dof_indices = BeamElement3D.get_dof_indices
+    compute_internal_forces = BeamElement3D.compute_internal_forces
+    compute_stresses = BeamElement3D.compute_stresses
+
+    def __repr__(self):
+        return f"<Beam {self.index}: {self.node1.id}-{self.node2.id} ({self.name})>"
+
+
+class _RowViews:
+    """
+    Read-only sequence of views over the rows of a CompactStructure array.
+    """
+
+    def __init__(self, structure, view_type, length):
+        self._structure = structure
+        self._view_type = view_type
+        self._length = length
+
+    def __len__(self):
+        return self._length(self._structure)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._view_type(self._structure, k) for k in range(*i.indices(len(self)))]
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(i)
+        return self._view_type(self._structure, i)
+
+    def __iter__(self):
+        return (self._view_type(self._structure, i) for i in range(len(self)))
+
+
+class CompactStructure(Structure):
+    """
+    Structure that stores nodes and beams as contiguous arrays:
+    - coords: (N, 3) node coordinates
+    - connectivity: (E, 2) beam end node ids
+    - section_ids: (E,) indices into the sections table of BeamProperties
+
+    nodes and elements are sequences of __slots__ views, so existing code that
+    reads node.coords, elem.node1, elem.k_global, ... keeps working; beam
+    matrices are built in one batch at assembly time instead of per element.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._coords = _GrowableArray(3, float)
+        self._connectivity = _GrowableArray(2, np.int32)
+        self._section_ids = _GrowableArray(1, np.int32)
+        self.sections = []
+        self._section_index = {}  # id(BeamProperties): row in sections
+        self.nodes = _RowViews(self, NodeView, lambda s: len(s._coords))
+        self.elements = _RowViews(self, BeamView, lambda s: len(s._connectivity))
+        self.node_index = None
+
+    @property
+    def coords(self):
+        return self._coords.array
+
+    @property
+    def connectivity(self):
+        return self._connectivity.array
+
+    @property
+    def section_ids(self):
+        return self._section_ids.array[:, 0]
+
+    def _section_id(self, beam_properties):
+        key = id(beam_properties)
+        if key not in self._section_index:
+            self._section_index[key] = len(self.sections)
+            self.sections.append(beam_properties)
+        return self._section_index[key]
+
+    def getNodeById(self, id):
+        if not 0 <= id < len(self._coords):
+            raise KeyError(id)
+        return NodeView(self, id)
+
+    def getNodesByIds(self, ids):
+        return [self.getNodeById(i) for i in ids]
+
+    def add_node(self, x, y, z):
+        node_id = len(self._coords)
+        self._coords.extend([x, y, z])
+        return NodeView(self, node_id)
+
+    def add_beam(self, node1, node2, beamProperties):
+        self._connectivity.extend([node1.id, node2.id])
+        self._section_ids.extend([self._section_id(beamProperties)])
+
+    def add_nodes(self, coords):
+        coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+        first = len(self._coords)
+        self._coords.extend(coords)
+        return np.arange(first, first + len(coords))
+
+    def add_beams(self, connectivity, beam_properties, section_ids=None):
+        connectivity, sections, section_ids = self._bulk_beam_arguments(connectivity, beam_properties, section_ids)
+        table_ids = np.array([self._section_id(p) for p in sections], dtype=np.int32)
+        self._connectivity.extend(connectivity)
+        self._section_ids.extend(table_ids[section_ids])
+
+    def node_coordinates(self):
+        return self.coords
+
+    def beam_connectivity(self):
+        return self.connectivity.astype(int)
+
+    def section_table(self):
+        """
+        (S, 6) array of E, G, A, Iy, Iz, J per section.
+        """
+        return np.array([(p.E, p.G, p.A, p.Iy, p.Iz, p.J) for p in self.sections], dtype=float).reshape(-1, 6)
+
+    def beam_section_properties(self):
+        return self.section_table()[self.section_ids]
+
+    def beam_section_dimensions(self):
+        table = np.array([(p.b, p.h) for p in self.sections], dtype=float).reshape(-1, 2)
+        return table[self.section_ids]
+
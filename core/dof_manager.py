@@ -0,0 +1,109 @@
+import numpy as np
+import scipy.sparse as sp
+
+
+class DofManager:
+    """
+    DOF bookkeeping for one boundary-condition set.
+
+    Every node owns 6 consecutive DOFs, in the order of node_ids (ids do not
+    have to be contiguous). Supported and MPC dependent DOFs are kept as
+    boolean masks; the free DOFs are numbered in ascending global order, so
+    the reduced system is the same from run to run.
+    node_ids: ids of the nodes, in DOF order
+    supports: {node_id: [fixed_dofs]}
+    dependent_dofs: global DOFs eliminated by MPCs
+    """
+
+    def __init__(self, node_ids, supports, dependent_dofs=None):
+        self.node_ids = np.asarray(node_ids, dtype=int)
+        self.ndof = 6 * len(self.node_ids)
+        self._contiguous = bool(np.array_equal(self.node_ids, np.arange(len(self.node_ids))))
+        if not self._contiguous:
+            self._sorter = np.argsort(self.node_ids, kind="stable")
+
+        self.constrained_mask = np.zeros(self.ndof, dtype=bool)
+        if supports:
+            node_ids = np.repeat(list(supports.keys()), [len(dofs) for dofs in supports.values()])
+            components = np.concatenate([np.asarray(dofs, dtype=int) for dofs in supports.values()])
+            self.constrained_mask[self.dofs(node_ids, components)] = True
+
+        self.dependent_mask = np.zeros(self.ndof, dtype=bool)
+        if dependent_dofs is not None:
+            self.dependent_mask[np.asarray(dependent_dofs, dtype=int)] = True
+        if np.any(self.constrained_mask & self.dependent_mask):
+            bad = np.flatnonzero(self.constrained_mask & self.dependent_mask) // 6
+            raise ValueError(f"Supports applied to MPC dependent nodes: {sorted(set(self.node_ids[bad].tolist()))}")
+
+        self.free_mask = ~(self.constrained_mask | self.dependent_mask)
+        self.free_dofs = np.flatnonzero(self.free_mask).astype(np.int32)
+        self.constrained_dofs = np.flatnonzero(self.constrained_mask).astype(np.int32)
+        self.dependent_dofs = np.flatnonzero(self.dependent_mask).astype(np.int32)
+
+        # Global DOF -> position in the reduced system, -1 if not free
+        self.reduced_index = np.full(self.ndof, -1, dtype=np.int32)
+        self.reduced_index[self.free_dofs] = np.arange(len(self.free_dofs), dtype=np.int32)
+
+    @property
+    def n_free(self):
+        return len(self.free_dofs)
+
+    def node_slots(self, node_ids):
+        """
+        Position of each node id in node_ids; raises KeyError for unknown ids.
+        """
+        node_ids = np.asarray(node_ids, dtype=int)
+        if self._contiguous:
+            slots = node_ids
+            valid = (slots >= 0) & (slots < len(self.node_ids))
+        else:
+            pos = np.searchsorted(self.node_ids, node_ids, sorter=self._sorter)
+            pos = np.minimum(pos, len(self.node_ids) - 1)
+            slots = self._sorter[pos]
+            valid = self.node_ids[slots] == node_ids
+        if not np.all(valid):
+            raise KeyError(np.asarray(node_ids)[~valid].tolist())
+        return slots
+
+    def dofs(self, node_ids, components=None):
+        """
+        Global DOF indices. With components=None all 6 DOFs of every node are
+        returned as an (n, 6) array, otherwise one DOF per (node, component).
+        """
+        slots = self.node_slots(node_ids)
+        if components is None:
+            return 6 * slots[..., None] + np.arange(6)
+        return 6 * slots + np.asarray(components, dtype=int)
+
+    def gather(self, U):
+        """
+        Free DOF entries of a global vector, or of the rows of an (ndof, n) matrix.
+        """
+        return np.asarray(U)[self.free_dofs]
+
+    def scatter(self, U_reduced, out=None):
+        """
+        Places reduced values at their global DOFs; the others stay zero
+        (or keep the values already in out).
+        """
+        U_reduced = np.asarray(U_reduced)
+        if out is None:
+            out = np.zeros((self.ndof,) + U_reduced.shape[1:], dtype=np.result_type(U_reduced, float))
+        out[self.free_dofs] = U_reduced
+        return out
+
+    def selection_matrix(self):
+        """
+        Sparse (ndof x n_free) 0/1 matrix S with U = S @ U_reduced.
+        """
+        return sp.csr_matrix((np.ones(self.n_free), (self.free_dofs, np.arange(self.n_free))),
+                             shape=(self.ndof, self.n_free))
+
+    def reduce(self, K):
+        """
+        Free-free block of a sparse or dense matrix. Only the free rows and
+        columns are copied.
+        """
+        if sp.issparse(K):
+            return sp.csr_matrix(K)[self.free_dofs][:, self.free_dofs]
+        return np.asarray(K)[np.ix_(self.free_dofs, self.free_dofs)]
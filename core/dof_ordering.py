@@ -0,0 +1,68 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+
+def node_adjacency(structure):
+    """
+    Node-to-node connectivity graph (N x N, CSR) of beams, springs, MPCs and superelements.
+    """
+    pairs = [(s.node1.id, s.node2.id) for s in structure.spring_elements]
+    pairs += [(r.node1.id, r.node2.id) for r in structure.rigid_elements]
+    for rbe in structure.rbe2_elements + structure.rbe3_elements:
+        pairs += [(rbe.master_node.id, slave.id) for slave in rbe.slave_nodes]
+    for instance in structure.superelements:
+        pairs += [(a.id, b.id) for a in instance.nodes for b in instance.nodes if a.id < b.id]
+    pairs = np.concatenate([structure.beam_connectivity(), np.array(pairs, dtype=int).reshape(-1, 2)])
+
+    n = len(structure.nodes)
+    rows = np.concatenate([pairs[:, 0], pairs[:, 1]])
+    cols = np.concatenate([pairs[:, 1], pairs[:, 0]])
+    return sp.coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n)).tocsr()
+
+
+def compute_node_ordering(structure, method="rcm"):
+    """
+    Returns a permutation of node ids; position k holds the node eliminated k-th.
+    """
+    if method != "rcm":
+        raise ValueError(f"Unknown node ordering method: {method}")
+    return np.asarray(reverse_cuthill_mckee(node_adjacency(structure), symmetric_mode=True))
+
+
+def reduced_dof_order(node_order, free_dofs):
+    """
+    Permutation of the reduced (free) DOFs that follows the node ordering.
+    Returns order such that K_reduced[order][:, order] is the renumbered system.
+    """
+    node_rank = np.empty(len(node_order), dtype=int)
+    node_rank[node_order] = np.arange(len(node_order))
+    free_dofs = np.asarray(free_dofs)
+    dof_rank = 6 * node_rank[free_dofs // 6] + free_dofs % 6
+    return np.argsort(dof_rank, kind="stable")
+
+
+def bandwidth(K):
+    """
+    Half-bandwidth max|i - j| over the stored entries of a sparse matrix.
+    """
+    K = sp.coo_matrix(K)
+    if K.nnz == 0:
+        return 0
+    return int(np.max(np.abs(K.row - K.col)))
+
+
+class PermutedFactor:
+    """
+    Factorization of a renumbered system K[order][:, order] that solves
+    in the original DOF numbering.
+    """
+
+    def __init__(self, factor, order):
+        self.factor = factor
+        self.order = np.asarray(order)
+
+    def solve(self, b):
+        x = np.empty_like(b, dtype=float)
+        x[self.order] = self.factor.solve(b[self.order])
+        return x
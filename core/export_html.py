@@ -0,0 +1,194 @@
+import base64
+import json
+import os
+import numpy as np
+from core.beam import STRESS_COMPONENTS
+
+
+def _pack(array, dtype):
+    """
+    base64 of the little-endian bytes of array, decoded in the viewer into a
+    typed array of the same dtype.
+    """
+    return base64.b64encode(np.ascontiguousarray(array, dtype=dtype).tobytes()).decode()
+
+
+def viewer_data(cases, scale=1.0):
+    """
+    JSON-serializable viewer payload. The geometry is packed once; every load
+    case adds its nodal translations and |stress| at node1 per component
+    (as in plot_stress_distribution). Coordinates and translations use the
+    Y/Z swap of visualize_structure: [X, Z, Y], so Y is vertical.
+    cases: LoadCaseResults sharing one model
+    """
+    cases = list(cases)
+    if not cases:
+        raise ValueError("No load cases to export")
+    coords = np.asarray(cases[0].node_coordinates, dtype=float)[:, [0, 2, 1]]
+    connectivity = np.asarray(cases[0].beam_connectivity)
+
+    data = {"nodes": _pack(coords, '<f4'), "beams": _pack(connectivity, '<u4'),
+            "components": list(STRESS_COMPONENTS), "scale": scale, "cases": []}
+    for results in cases:
+        translations = np.asarray(results.nodal_displacements, dtype=float)[:, [0, 2, 1]]
+        stresses = {}
+        for component in STRESS_COMPONENTS:
+            values = np.abs(np.asarray(results.stress(component), dtype=float))
+            stresses[component] = {"values": _pack(values, '<f4'),
+                                   "min": float(values.min()) if values.size else 0.0,
+                                   "max": float(values.max()) if values.size else 0.0}
+        data["cases"].append({"name": str(results.name), "U": _pack(translations, '<f4'), "stress": stresses})
+    return data
+
+
+def write_html_viewer(path, cases, scale=1.0):
+    """
+    Writes a single self-contained HTML file with the deformed structure
+    colored by stress. Load case, stress component and deformation scale are
+    switchable in the page; drag to rotate, scroll to zoom.
+    cases: LoadCaseResults sharing one model
+    scale: initial deformation scale
+    Returns: absolute path of the file
+    """
+    payload = json.dumps(viewer_data(cases, scale), separators=(",", ":"))
+    with open(path, "w") as f:
+        f.write(_TEMPLATE.replace("__DATA__", payload))
+    return os.path.abspath(path)
+
+
+_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Structure results</title>
+<style>
+body { margin: 0; font-family: sans-serif; font-size: 13px; }
+#controls { position: absolute; top: 8px; left: 8px; background: rgba(255,255,255,0.85); padding: 6px; }
+#controls label { margin-right: 10px; }
+#colorbar { position: absolute; top: 8px; right: 8px; width: 24px; height: 60%;
+            background: linear-gradient(to top, #00007f, #0000ff, #00ffff, #7fff7f, #ffff00, #ff0000, #7f0000); }
+#cmax, #cmin { position: absolute; right: 38px; }
+#cmax { top: 8px; }
+canvas { display: block; }
+</style>
+</head>
+<body>
+<div id="controls">
+<label>Load case <select id="case"></select></label>
+<label>Stress <select id="component"></select></label>
+<label>Scale <input id="scale" type="number" step="any" style="width: 6em"></label>
+</div>
+<div id="colorbar"></div><div id="cmax"></div><div id="cmin"></div>
+<canvas id="view"></canvas>
+<script>
+const DATA = __DATA__;
+
+function decode(b64, Type) {
+  const bytes = Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+  return new Type(bytes.buffer);
+}
+
+// Geometry is packed once, result buffers are decoded on first use
+const nodes = decode(DATA.nodes, Float32Array);   // [X, Z, Y] per node
+const beams = decode(DATA.beams, Uint32Array);
+const nNodes = nodes.length / 3, nBeams = beams.length / 2;
+const decoded = {};
+function buffer(key, b64) {
+  if (!(key in decoded)) decoded[key] = decode(b64, Float32Array);
+  return decoded[key];
+}
+
+const caseSelect = document.getElementById("case");
+const componentSelect = document.getElementById("component");
+const scaleInput = document.getElementById("scale");
+DATA.cases.forEach((c, i) => caseSelect.add(new Option(c.name, i)));
+DATA.components.forEach(c => componentSelect.add(new Option(c, c)));
+componentSelect.value = "von_mises";
+scaleInput.value = DATA.scale;
+
+const canvas = document.getElementById("view");
+const ctx = canvas.getContext("2d");
+let azim = 130 * Math.PI / 180, elev = 40 * Math.PI / 180, zoom = 1;
+
+// Bounding box of the undeformed structure
+const lo = [Infinity, Infinity, Infinity], hi = [-Infinity, -Infinity, -Infinity];
+for (let i = 0; i < nodes.length; i++) {
+  lo[i % 3] = Math.min(lo[i % 3], nodes[i]);
+  hi[i % 3] = Math.max(hi[i % 3], nodes[i]);
+}
+const center = [0, 1, 2].map(k => (lo[k] + hi[k]) / 2);
+const radius = Math.max(1e-9, ...[0, 1, 2].map(k => hi[k] - lo[k])) / 2;
+
+function jet(t) {
+  const r = Math.min(Math.max(1.5 - Math.abs(4 * t - 3), 0), 1);
+  const g = Math.min(Math.max(1.5 - Math.abs(4 * t - 2), 0), 1);
+  const b = Math.min(Math.max(1.5 - Math.abs(4 * t - 1), 0), 1);
+  return "rgb(" + Math.round(255 * r) + "," + Math.round(255 * g) + "," + Math.round(255 * b) + ")";
+}
+
+const BINS = 64;
+
+function draw() {
+  canvas.width = window.innerWidth;
+  canvas.height = window.innerHeight;
+  const c = DATA.cases[caseSelect.value];
+  const stress = c.stress[componentSelect.value];
+  // Keyed by case index: case names need not be unique
+  const values = buffer(caseSelect.value + "/" + componentSelect.value, stress.values);
+  const U = buffer(caseSelect.value + "/U", c.U);
+  const scale = parseFloat(scaleInput.value) || 0;
+  document.getElementById("cmax").textContent = stress.max.toPrecision(4) + " MPa";
+  document.getElementById("cmin").textContent = stress.min.toPrecision(4) + " MPa";
+  document.getElementById("cmin").style.top = (8 + 0.6 * canvas.height - 16) + "px";
+
+  // Orthographic view: azimuth about the vertical axis, then elevation
+  const ca = Math.cos(azim), sa = Math.sin(azim), ce = Math.cos(elev), se = Math.sin(elev);
+  const s = zoom * 0.45 * Math.min(canvas.width, canvas.height) / radius;
+  const cx = canvas.width / 2, cy = canvas.height / 2;
+  const sx = new Float32Array(nNodes), sy = new Float32Array(nNodes);
+  for (let n = 0; n < nNodes; n++) {
+    const x = nodes[3 * n] + scale * U[3 * n] - center[0];
+    const y = nodes[3 * n + 1] + scale * U[3 * n + 1] - center[1];
+    const z = nodes[3 * n + 2] + scale * U[3 * n + 2] - center[2];
+    sx[n] = cx + s * (-sa * x + ca * y);
+    sy[n] = cy - s * (-se * (ca * x + sa * y) + ce * z);
+  }
+
+  // One path per color bin instead of one stroke per beam
+  const range = stress.max - stress.min || 1;
+  const bins = Array.from({length: BINS}, () => []);
+  for (let e = 0; e < nBeams; e++) {
+    const t = (values[e] - stress.min) / range;
+    bins[Math.min(BINS - 1, Math.max(0, Math.floor(t * BINS)))].push(e);
+  }
+  ctx.lineWidth = 3;
+  bins.forEach((members, k) => {
+    if (!members.length) return;
+    ctx.strokeStyle = jet((k + 0.5) / BINS);
+    ctx.beginPath();
+    for (const e of members) {
+      ctx.moveTo(sx[beams[2 * e]], sy[beams[2 * e]]);
+      ctx.lineTo(sx[beams[2 * e + 1]], sy[beams[2 * e + 1]]);
+    }
+    ctx.stroke();
+  });
+}
+
+let drag = null;
+canvas.addEventListener("mousedown", e => { drag = [e.clientX, e.clientY]; });
+window.addEventListener("mouseup", () => { drag = null; });
+window.addEventListener("mousemove", e => {
+  if (!drag) return;
+  azim -= (e.clientX - drag[0]) * 0.01;
+  elev = Math.min(Math.PI / 2, Math.max(-Math.PI / 2, elev + (e.clientY - drag[1]) * 0.01));
+  drag = [e.clientX, e.clientY];
+  draw();
+});
+canvas.addEventListener("wheel", e => { e.preventDefault(); zoom *= Math.exp(-e.deltaY * 0.001); draw(); });
+[caseSelect, componentSelect, scaleInput].forEach(el => el.addEventListener("change", draw));
+window.addEventListener("resize", draw);
+draw();
+</script>
+</body>
+</html>
+"""
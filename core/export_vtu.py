@@ -0,0 +1,146 @@
+import os
+import re
+from xml.sax.saxutils import quoteattr
+import numpy as np
+from core.beam import STRESS_COMPONENTS
+
+VTK_LINE = 3
+_VTK_TYPES = {np.dtype('<f8'): "Float64", np.dtype('<i8'): "Int64",
+              np.dtype('<i4'): "Int32", np.dtype('u1'): "UInt8"}
+
+
+class _AppendedArrays:
+    """
+    Collects the DataArray headers and the raw appended block of one VTU
+    file. Every array is written as a UInt64 byte count followed by its
+    little-endian bytes, so no value is ever formatted as text.
+    """
+
+    def __init__(self):
+        self.blocks = []
+        self.offset = 0
+
+    def header(self, name, array, components=1):
+        array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('<'))
+        self.blocks.append(array)
+        header = '<DataArray type="{0}" Name={1} NumberOfComponents="{2}" format="appended" offset="{3}"/>'.format(
+            _VTK_TYPES[array.dtype], quoteattr(name), components, self.offset)
+        self.offset += 8 + array.nbytes
+        return header
+
+    def string_header(self, name, strings):
+        """
+        VTK String array: the UTF-8 bytes of every string, each followed by a
+        null terminator.
+        """
+        array = np.frombuffer(b"".join(s.encode() + b"\0" for s in strings), dtype='u1')
+        self.blocks.append(array)
+        header = '<DataArray type="String" Name={0} NumberOfTuples="{1}" format="appended" offset="{2}"/>'.format(
+            quoteattr(name), len(strings), self.offset)
+        self.offset += 8 + array.nbytes
+        return header
+
+    def write(self, f):
+        f.write(b'<AppendedData encoding="raw">\n_')
+        for array in self.blocks:
+            f.write(np.uint64(array.nbytes).tobytes())
+            f.write(array.data)
+        f.write(b'\n</AppendedData>\n')
+
+
+def element_group_ids(groups):
+    """
+    Returns: sorted unique group names and the (E,) group index of every beam
+    """
+    names, ids = np.unique(np.array([str(g) for g in groups]), return_inverse=True)
+    return list(names), ids.astype(np.int32)
+
+
+def write_vtu(path, results):
+    """
+    Writes one load case as a VTK unstructured grid of line cells with raw
+    binary appended data.
+    Point data: "U" (translations) and "rotations".
+    Cell data: every stress component at both beam ends ("<component>_node1",
+    "<component>_node2") and "group_id" (index into the "group_names" string
+    array of the field data).
+    results: LoadCaseResults (or StoredLoadCaseResults)
+    Returns: absolute path of the file
+    """
+    coords = np.asarray(results.node_coordinates, dtype='<f8')
+    connectivity = np.asarray(results.beam_connectivity, dtype='<i8')
+    displacements = np.asarray(results.nodal_displacements, dtype='<f8')
+    element_results = results.element_results
+    group_names, group_ids = element_group_ids(results.element_groups)
+    n_cells = len(connectivity)
+
+    data = _AppendedArrays()
+    points = data.header("Points", coords, 3)
+    cells = [data.header("connectivity", connectivity.ravel()),
+             data.header("offsets", np.arange(2, 2 * n_cells + 1, 2, dtype='<i8')),
+             data.header("types", np.full(n_cells, VTK_LINE, dtype='u1'))]
+    point_data = [data.header("U", displacements[:, :3], 3),
+                  data.header("rotations", displacements[:, 3:], 3)]
+    cell_data = []
+    for component in STRESS_COMPONENTS:
+        values = np.asarray(element_results[component], dtype='<f8')
+        cell_data.append(data.header(component + "_node1", values[:, 0]))
+        cell_data.append(data.header(component + "_node2", values[:, 1]))
+    cell_data.append(data.header("group_id", group_ids))
+    field_data = [data.string_header("group_names", group_names)]
+
+    xml = ['<?xml version="1.0"?>',
+           '<VTKFile type="UnstructuredGrid" version="1.0" byte_order="LittleEndian" header_type="UInt64">',
+           '<UnstructuredGrid>',
+           '<FieldData>', *field_data, '</FieldData>',
+           '<Piece NumberOfPoints="{0}" NumberOfCells="{1}">'.format(len(coords), n_cells),
+           '<Points>', points, '</Points>',
+           '<Cells>', *cells, '</Cells>',
+           '<PointData Vectors="U">', *point_data, '</PointData>',
+           '<CellData Scalars="von_mises_node1">', *cell_data, '</CellData>',
+           '</Piece>',
+           '</UnstructuredGrid>']
+
+    with open(path, "wb") as f:
+        f.write("\n".join(xml).encode() + b"\n")
+        data.write(f)
+        f.write(b'</VTKFile>\n')
+    return os.path.abspath(path)
+
+
+def safe_filename(name):
+    """
+    Returns: name with every character other than letters, digits, ".", "-"
+    and "_" replaced by "_"
+    """
+    return re.sub(r'[^A-Za-z0-9._-]', "_", str(name)) or "_"
+
+
+def write_vtu_series(pvd_path, cases):
+    """
+    Writes every load case to <pvd stem>_<case name>.vtu next to pvd_path and
+    a .pvd collection indexing them, one time step per load case in order.
+    Case names are made filesystem safe with safe_filename; a name that is
+    already taken gets the time step appended.
+    cases: iterable of LoadCaseResults
+    Returns: absolute paths of the .vtu files
+    """
+    directory = os.path.dirname(os.path.abspath(pvd_path))
+    stem = os.path.splitext(os.path.basename(pvd_path))[0]
+
+    files, entries, used = [], [], set()
+    for step, results in enumerate(cases):
+        name = "{0}_{1}.vtu".format(stem, safe_filename(results.name))
+        if name in used:
+            name = "{0}_{1}_{2}.vtu".format(stem, safe_filename(results.name), step)
+        used.add(name)
+        files.append(write_vtu(os.path.join(directory, name), results))
+        entries.append('<DataSet timestep="{0}" group="" part="0" file={1} name={2}/>'.format(
+            step, quoteattr(name), quoteattr(str(results.name))))
+
+    with open(pvd_path, "w") as f:
+        f.write("\n".join(['<?xml version="1.0"?>',
+                           '<VTKFile type="Collection" version="0.1" byte_order="LittleEndian">',
+                           '<Collection>', *entries, '</Collection>',
+                           '</VTKFile>']) + "\n")
+    return files
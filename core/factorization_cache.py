@@ -0,0 +1,166 @@
+import os
+import hashlib
+from collections import OrderedDict
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+from core.dof_ordering import PermutedFactor
+
+
+def model_hash(structure, supports=None):
+    """
+    Content hash of everything that enters the reduced stiffness matrix:
+    node coordinates, beam properties, springs, RBE2/RBE3/rigid constraints
+    and supports. Loads are deliberately left out.
+    """
+    if supports is None:
+        supports = structure.supports
+
+    h = hashlib.sha256()
+
+    def update(tag, values, dtype=float):
+        h.update(tag.encode())
+        h.update(np.ascontiguousarray(values, dtype=dtype).tobytes())
+
+    update("nodes", structure.node_coordinates())
+    update("beam_nodes", structure.beam_connectivity(), dtype=np.int64)
+    update("beam_props", structure.beam_section_properties())
+    update("spring_nodes", [(s.node1.id, s.node2.id) for s in structure.spring_elements], dtype=np.int64)
+    update("spring_k", [np.asarray(s.stiffness_vector, dtype=float)[:6] for s in structure.spring_elements])
+    for rbe2 in structure.rbe2_elements:
+        update("rbe2", [rbe2.master_node.id] + [n.id for n in rbe2.slave_nodes], dtype=np.int64)
+    for rbe3 in structure.rbe3_elements:
+        update("rbe3", [rbe3.master_node.id] + [n.id for n in rbe3.slave_nodes], dtype=np.int64)
+        update("rbe3_w", rbe3.weights)
+    for instance in structure.superelements:
+        update("superelement", [n.id for n in instance.nodes], dtype=np.int64)
+        update("superelement_k", instance.k_global)
+    update("rigid", [(r.node1.id, r.node2.id) for r in structure.rigid_elements], dtype=np.int64)
+    for nid in sorted(supports):
+        update("support", [nid] + sorted(supports[nid]), dtype=np.int64)
+    h.update(f"ordering={structure.dof_ordering};mpc={structure.mpc_method}".encode())
+
+    return h.hexdigest()
+
+
+class StoredLU:
+    """
+    Sparse LU factors exported from SuperLU (Pr A Pc = L U) so that they can
+    be written to disk and solved with triangular substitutions.
+    """
+
+    def __init__(self, L, U, perm_r, perm_c):
+        self.L = sp.csr_matrix(L)
+        self.U = sp.csr_matrix(U)
+        self.perm_r = np.asarray(perm_r)
+        self.perm_c = np.asarray(perm_c)
+        self.shape = self.L.shape
+
+    @classmethod
+    def from_superlu(cls, lu):
+        return cls(lu.L, lu.U, lu.perm_r, lu.perm_c)
+
+    def solve(self, b):
+        y = np.empty_like(b, dtype=float)
+        y[self.perm_r] = b
+        z = spla.spsolve_triangular(self.L, y, lower=True, unit_diagonal=True)
+        z = spla.spsolve_triangular(self.U, z, lower=False)
+        return z[self.perm_c]
+
+    def save(self, path, T, order=None):
+        extra = {} if order is None else {"order": np.asarray(order)}
+        T = sp.csr_matrix(T)
+        np.savez(path, **extra,
+                 T_data=T.data, T_indices=T.indices, T_indptr=T.indptr, T_shape=np.asarray(T.shape),
+                 L_data=self.L.data, L_indices=self.L.indices, L_indptr=self.L.indptr,
+                 U_data=self.U.data, U_indices=self.U.indices, U_indptr=self.U.indptr,
+                 shape=np.asarray(self.shape), perm_r=self.perm_r, perm_c=self.perm_c)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            shape = tuple(data["shape"])
+            L = sp.csr_matrix((data["L_data"], data["L_indices"], data["L_indptr"]), shape=shape)
+            U = sp.csr_matrix((data["U_data"], data["U_indices"], data["U_indptr"]), shape=shape)
+            T = sp.csr_matrix((data["T_data"], data["T_indices"], data["T_indptr"]),
+                              shape=tuple(data["T_shape"]))
+            factor = cls(L, U, data["perm_r"], data["perm_c"])
+            if "order" in data:
+                factor = PermutedFactor(factor, data["order"])
+            return factor, T
+
+
+class FactorizationCache:
+    """
+    LRU cache of reduced stiffness factorizations keyed by model_hash.
+    Entries are kept in memory; if cache_dir is given they are also written
+    to disk as .npz files so that later sessions can reuse them.
+    """
+
+    def __init__(self, max_entries=8, cache_dir=None, max_disk_entries=64):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_entries = max_disk_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _disk_path(self, key):
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def get(self, key):
+        """
+        Returns (factor, T) or None, T being the reduction U = T @ U_reduced.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        path = self._disk_path(key)
+        if path is not None and os.path.exists(path):
+            entry = StoredLU.load(path)
+            os.utime(path)  # mark as recently used
+            self._insert(key, entry)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        return None
+
+    def put(self, key, factor, T):
+        self._insert(key, (factor, T))
+
+        path = self._disk_path(key)
+        if path is not None:
+            order = None
+            if isinstance(factor, PermutedFactor):
+                factor, order = factor.factor, factor.order
+            if not isinstance(factor, StoredLU):
+                factor = StoredLU.from_superlu(factor)
+            factor.save(path, T, order)
+            self._prune_disk()
+
+    def clear(self):
+        self._entries.clear()
+
+    def _insert(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _prune_disk(self):
+        files = [os.path.join(self.cache_dir, f) for f in os.listdir(self.cache_dir) if f.endswith(".npz")]
+        if len(files) <= self.max_disk_entries:
+            return
+        files.sort(key=os.path.getmtime)
+        for f in files[:len(files) - self.max_disk_entries]:
+            os.remove(f)
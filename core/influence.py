@@ -0,0 +1,98 @@
+import numpy as np
+import scipy.sparse as sp
+
+
+class InfluenceAnalysis:
+    """
+    Influence of a unit load at candidate nodes/DOFs on the internal forces
+    and stresses of every beam.
+
+    The reduced stiffness is factorized once. With fewer candidate loads than
+    element force components the unit loads are solved as a load matrix;
+    otherwise the adjoint system K^-1 (B T).T is solved instead, one
+    right-hand side per force component. Either way the result is the same
+    table, so "worst stress for a load anywhere on these nodes" is a lookup.
+    Loads and operators stay sparse; the right-hand sides are densified and
+    solved chunk_size columns at a time.
+    Stresses are kept at both beam ends (node1, node2).
+    structure: Structure with the supports and MPCs of the analysis
+    node_ids: candidate load positions
+    dofs: loaded DOF components (0-5) at each candidate node
+    method: "auto", "direct" or "adjoint"
+    chunk_size: right-hand sides per factor solve
+    """
+
+    def __init__(self, structure, node_ids, dofs=(0, 1, 2), method="auto", chunk_size=256):
+        self.structure = structure
+        self.candidates = np.array([(nid, dof) for nid in node_ids for dof in dofs], dtype=int).reshape(-1, 2)
+        n_candidates = len(self.candidates)
+        n_elements = len(structure.elements)
+        ndof = 6 * len(structure.nodes)
+
+        if method == "auto":
+            method = "direct" if n_candidates <= 12 * n_elements else "adjoint"
+        if method not in ("direct", "adjoint"):
+            raise ValueError(f"Unknown influence method: {method}")
+        self.method = method
+
+        factor, T = structure._reduced_factorization(structure.supports)
+        unit_loads = sp.csr_matrix((np.ones(n_candidates),
+                                    (6 * self.candidates[:, 0] + self.candidates[:, 1], np.arange(n_candidates))),
+                                   shape=(ndof, n_candidates))
+        R = sp.csc_matrix(structure._reduce_loads(unit_loads, T))     # (n_reduced, P)
+        BT = sp.csr_matrix(structure.element_force_operator() @ T)    # (12E, n_reduced)
+
+        G = np.empty((BT.shape[0], n_candidates))
+        if method == "direct":
+            for start in range(0, n_candidates, chunk_size):
+                block = slice(start, start + chunk_size)
+                G[:, block] = BT @ factor.solve(R[:, block].toarray())
+        else:
+            RT = R.T.tocsr()
+            for start in range(0, BT.shape[0], chunk_size):
+                block = slice(start, start + chunk_size)
+                # K_reduced is symmetric
+                G[block] = (RT @ factor.solve(BT[block].T.toarray())).T
+
+        self.forces = G.reshape(n_elements, 12, n_candidates)         # per unit load
+        # Both beam ends, node2 with its end forces reversed as in recover_element_results
+        section_forces = np.stack([self.forces[:, :6], -self.forces[:, 6:]], axis=2)
+        self.stresses = structure.element_stresses(section_forces)    # dict of (E, 2, P)
+        self.element_groups = np.array([elem.name for elem in structure.elements], dtype=object)
+
+    def group_nodes(self, group):
+        """
+        Ids of the nodes of all beams in a group, e.g. the candidate nodes
+        along the fork beams.
+        """
+        conn = self.structure.beam_connectivity()[self.element_groups == group]
+        return np.unique(conn)
+
+    def worst(self, component="sigma_total", group=None, nodes=None, dofs=None, load=1.0):
+        """
+        Largest |stress| for a load of the given magnitude placed at any of the
+        candidates.
+        component: stress key of compute_stresses
+        group: only consider beams of this group (None for all beams)
+        nodes, dofs: restrict the load positions / directions (None for all)
+        Returns: dict with the signed "value" and the governing "element"
+                 index, beam "end" (0: node1, 1: node2), load "node" and load "dof"
+        """
+        # Stresses scale linearly with the load; sigma_total is a magnitude
+        scale = abs(load) if component == "sigma_total" else load
+        table = self.stresses[component] * scale
+        rows = np.ones(table.shape[0], dtype=bool) if group is None else self.element_groups == group
+        cols = np.ones(table.shape[2], dtype=bool)
+        if nodes is not None:
+            cols &= np.isin(self.candidates[:, 0], nodes)
+        if dofs is not None:
+            cols &= np.isin(self.candidates[:, 1], dofs)
+        if not rows.any() or not cols.any():
+            raise ValueError("No beams or load positions match the query")
+
+        elements, positions = np.flatnonzero(rows), np.flatnonzero(cols)
+        sub = table[np.ix_(elements, [0, 1], positions)]
+        i, end, j = np.unravel_index(np.argmax(np.abs(sub)), sub.shape)
+        node, dof = self.candidates[positions[j]]
+        return {"value": sub[i, end, j], "element": int(elements[i]), "end": int(end),
+                "node": int(node), "dof": int(dof)}
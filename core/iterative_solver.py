@@ -0,0 +1,128 @@
+import warnings
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+
+def jacobi_preconditioner(K, free_dofs=None):
+    """
+    Diagonal scaling M^-1 = diag(K)^-1.
+    """
+    diag = K.diagonal()
+    inv_diag = 1.0 / np.where(diag != 0.0, diag, 1.0)
+    return lambda r: inv_diag * r
+
+
+def block_jacobi_preconditioner(K, free_dofs):
+    """
+    Inverse of the 6x6 nodal diagonal blocks of K.
+    free_dofs: global DOF index of each row of K, used to group rows by node
+    """
+    free_dofs = np.asarray(free_dofs)
+    _, block_of_row = np.unique(free_dofs // 6, return_inverse=True)
+    slot_of_row = free_dofs % 6
+    n_blocks = block_of_row.max() + 1 if len(free_dofs) else 0
+
+    # Scatter the nodal blocks into an (n_blocks, 6, 6) stack; missing
+    # (constrained) DOFs get an identity entry so every block stays invertible
+    present = np.zeros((n_blocks, 6), dtype=bool)
+    present[block_of_row, slot_of_row] = True
+    blocks = np.zeros((n_blocks, 6, 6))
+    block_ids, slots = np.nonzero(~present)
+    blocks[block_ids, slots, slots] = 1.0
+
+    K = sp.coo_matrix(K)
+    same_node = block_of_row[K.row] == block_of_row[K.col]
+    rows, cols = K.row[same_node], K.col[same_node]
+    np.add.at(blocks, (block_of_row[rows], slot_of_row[rows], slot_of_row[cols]), K.data[same_node])
+    inv_blocks = np.linalg.inv(blocks)
+
+    def apply(r):
+        r_blocks = np.zeros((n_blocks, 6))
+        r_blocks[block_of_row, slot_of_row] = r
+        z_blocks = np.einsum('bij,bj->bi', inv_blocks, r_blocks)
+        return z_blocks[block_of_row, slot_of_row]
+
+    return apply
+
+
+def incomplete_cholesky_preconditioner(K, free_dofs=None, drop_tol=1e-6, fill_factor=10):
+    """
+    Incomplete factorization of K. SciPy offers no incomplete Cholesky, so a
+    threshold ILU in symmetric mode (symmetric ordering, diagonal pivots) is
+    used in its place.
+    """
+    ilu = spla.spilu(sp.csc_matrix(K), drop_tol=drop_tol, fill_factor=fill_factor,
+                     diag_pivot_thresh=0.0, permc_spec="MMD_AT_PLUS_A",
+                     options=dict(SymmetricMode=True))
+    return ilu.solve
+
+
+PRECONDITIONERS = {
+    None: lambda K, free_dofs=None: (lambda r: r),
+    "jacobi": jacobi_preconditioner,
+    "block_jacobi": block_jacobi_preconditioner,
+    "ic": incomplete_cholesky_preconditioner,
+}
+
+
+def pcg(K, F, x0=None, preconditioner="jacobi", free_dofs=None, tol=1e-10, maxiter=None):
+    """
+    Preconditioned conjugate gradient solution of K x = F.
+
+    Parameters:
+    - K: symmetric positive definite (sparse) matrix
+    - F: right-hand side
+    - x0: initial guess (warm start), zero if None
+    - preconditioner: None, "jacobi", "block_jacobi" or "ic"
+    - free_dofs: global DOF index of each row of K (needed for "block_jacobi")
+    - tol: relative residual tolerance ||F - K x|| / ||F||
+    - maxiter: iteration limit, defaults to 10 * size of K
+
+    Returns: x, info dict with iterations, residual_norm, residual_history, converged
+    """
+    if preconditioner not in PRECONDITIONERS:
+        raise ValueError(f"Unknown preconditioner: {preconditioner}")
+    if maxiter is None:
+        maxiter = 10 * K.shape[0]
+
+    apply_M = PRECONDITIONERS[preconditioner](K, free_dofs)
+
+    x = np.zeros(K.shape[0]) if x0 is None else np.array(x0, dtype=float)
+    r = F - K @ x
+    f_norm = np.linalg.norm(F)
+    if f_norm == 0.0:
+        f_norm = 1.0
+
+    history = [np.linalg.norm(r) / f_norm]
+    iterations = 0
+    if history[-1] > tol:
+        z = apply_M(r)
+        p = z.copy()
+        rz = r @ z
+        while iterations < maxiter:
+            Kp = K @ p
+            alpha = rz / (p @ Kp)
+            x += alpha * p
+            r -= alpha * Kp
+            iterations += 1
+            history.append(np.linalg.norm(r) / f_norm)
+            if history[-1] <= tol:
+                break
+            z = apply_M(r)
+            rz_new = r @ z
+            p = z + (rz_new / rz) * p
+            rz = rz_new
+
+    converged = history[-1] <= tol
+    if not converged:
+        warnings.warn(f"PCG did not converge in {iterations} iterations "
+                      f"(relative residual {history[-1]:.3e})")
+
+    info = {
+        "iterations": iterations,
+        "residual_norm": history[-1],
+        "residual_history": history,
+        "converged": converged,
+    }
+    return x, info
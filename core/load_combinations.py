@@ -0,0 +1,128 @@
+import numpy as np
+
+
+class LoadCombinations:
+    """
+    Factored combinations of basic load cases by superposition.
+
+    The basic cases are solved once (one factorization, one multi-column
+    back-substitution); every combination is then a weighted sum of the basic
+    displacements and internal forces, computed with matrix products.
+    structure: Structure with the elements, MPCs and supports shared by all cases
+    basic_cases: {case_name: {node_id: load_vector}}
+    superelement_case: basic case that carries the condensed interior loads of
+                       the structure's superelements; a name not in basic_cases
+                       adds a basic case with only those loads. None leaves them
+                       out, so they are never scaled by more than one factor.
+    """
+
+    def __init__(self, structure, basic_cases, superelement_case=None):
+        self.structure = structure
+        basic_cases = dict(basic_cases)
+        if superelement_case is not None:
+            basic_cases.setdefault(superelement_case, {})
+        self.case_names = list(basic_cases)
+        self.superelement_case = superelement_case
+        self.combination_names = []
+        self._factors = np.zeros((0, len(self.case_names)))
+        self._pending_factors = []  # factor blocks added since the last stack
+
+        U = structure.solve_many([{"loads": basic_cases[name], "superelement_loads": name == superelement_case}
+                                  for name in self.case_names])
+        self.basic_displacements = np.column_stack(U)                                   # (ndof, C)
+        self.basic_internal_forces = structure.element_internal_forces(self.basic_displacements)  # (E, 12, C)
+
+    def add_combination(self, name, factors):
+        """
+        factors: {case_name: factor}; cases not listed get a factor of 0
+        """
+        unknown = set(factors) - set(self.case_names)
+        if unknown:
+            raise ValueError(f"Unknown load cases: {sorted(unknown)}")
+        row = np.array([[factors.get(case, 0.0) for case in self.case_names]], dtype=float)
+        self.combination_names.append(name)
+        self._pending_factors.append(row)
+
+    def add_combinations(self, names, factors):
+        """
+        names: list of M combination names
+        factors: (M, C) factor matrix, columns in case_names order
+        """
+        factors = np.asarray(factors, dtype=float).reshape(-1, len(self.case_names))
+        if len(names) != len(factors):
+            raise ValueError("One row of factors is required per combination name")
+        self.combination_names.extend(names)
+        self._pending_factors.append(factors)
+
+    @property
+    def factors(self):
+        """
+        (M, C) factor matrix of all combinations. Added rows are stacked on
+        first use, so adding combinations one by one stays linear.
+        """
+        if self._pending_factors:
+            self._factors = np.vstack([self._factors] + self._pending_factors)
+            self._pending_factors = []
+        return self._factors
+
+    def _combination_index(self, combination):
+        if isinstance(combination, str):
+            return self.combination_names.index(combination)
+        return combination
+
+    def displacements(self, combination=None):
+        """
+        Global displacement vector of one combination (name or index), or the
+        (ndof, M) displacement matrix of all combinations.
+        """
+        if combination is None:
+            return self.basic_displacements @ self.factors.T
+        return self.basic_displacements @ self.factors[self._combination_index(combination)]
+
+    def internal_forces(self, combination=None):
+        """
+        (E, 12) local internal forces of one combination, or (E, 12, M) for all.
+        """
+        if combination is None:
+            return self.basic_internal_forces @ self.factors.T
+        return self.basic_internal_forces @ self.factors[self._combination_index(combination)]
+
+    def envelope(self, quantity="internal_forces", chunk_size=256):
+        """
+        Min/max of a result over all combinations, without forming the full
+        result of every combination at once.
+        quantity: "internal_forces" or "displacements"
+        chunk_size: number of combinations combined per matrix product
+        Returns: dict with "min", "max" (shaped like one combination's result)
+                 and "min_combination", "max_combination" (index into
+                 combination_names of the governing combination)
+        """
+        if quantity == "internal_forces":
+            basic = self.basic_internal_forces
+        elif quantity == "displacements":
+            basic = self.basic_displacements
+        else:
+            raise ValueError(f"Unknown envelope quantity: {quantity}")
+        if len(self.factors) == 0:
+            raise ValueError("No load combinations defined")
+
+        shape = basic.shape[:-1]
+        basic = basic.reshape(-1, basic.shape[-1])
+        lo = np.full(len(basic), np.inf)
+        hi = np.full(len(basic), -np.inf)
+        lo_id = np.zeros(len(basic), dtype=int)
+        hi_id = np.zeros(len(basic), dtype=int)
+
+        for start in range(0, len(self.factors), chunk_size):
+            values = basic @ self.factors[start:start + chunk_size].T
+            i_min, i_max = values.argmin(axis=1), values.argmax(axis=1)
+            v_min = np.take_along_axis(values, i_min[:, None], axis=1)[:, 0]
+            v_max = np.take_along_axis(values, i_max[:, None], axis=1)[:, 0]
+
+            better = v_min < lo
+            lo[better], lo_id[better] = v_min[better], start + i_min[better]
+            better = v_max > hi
+            hi[better], hi_id[better] = v_max[better], start + i_max[better]
+
+        return {"min": lo.reshape(shape), "max": hi.reshape(shape),
+                "min_combination": lo_id.reshape(shape), "max_combination": hi_id.reshape(shape)}
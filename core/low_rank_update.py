@@ -0,0 +1,44 @@
+import numpy as np
+import scipy.sparse as sp
+
+
+def low_rank_decomposition(delta_K, max_rank=None, tol=1e-12):
+    """
+    Splits a small symmetric sparse stiffness change into dK = U diag(lam) U.T.
+    max_rank: rank limit of the caller; a change touching more than
+              2 * max_rank DOFs is rejected before the dense eigen-decomposition
+    Returns: idx (touched rows), V (len(idx) x r), lam (r,) with U[idx] = V,
+             or None if the change is too large
+    """
+    delta_K = sp.coo_matrix(delta_K)
+    nonzero = delta_K.data != 0.0
+    idx = np.unique(np.concatenate([delta_K.row[nonzero], delta_K.col[nonzero]]))
+    if len(idx) == 0:
+        return idx, np.zeros((0, 0)), np.zeros(0)
+    if max_rank is not None and len(idx) > 2 * max_rank:
+        return None
+
+    block = sp.csr_matrix(delta_K)[idx][:, idx].toarray()
+    lam, V = np.linalg.eigh(0.5 * (block + block.T))
+    keep = np.abs(lam) > tol * np.abs(lam).max()
+    return idx, V[:, keep], lam[keep]
+
+
+class WoodburyFactor:
+    """
+    Solves (K + U diag(lam) U.T) x = b with an existing factorization of K
+    (Sherman-Morrison-Woodbury), so a small stiffness edit costs r extra
+    back-substitutions instead of a new factorization.
+    """
+
+    def __init__(self, base_factor, n, idx, V, lam):
+        self.base_factor = base_factor
+        self.rank = len(lam)
+        self.U = np.zeros((n, self.rank))
+        self.U[idx] = V
+        self.Z = base_factor.solve(self.U)                        # K^-1 U
+        self.capacitance = np.diag(1.0 / lam) + self.U.T @ self.Z
+
+    def solve(self, b):
+        y = self.base_factor.solve(b)
+        return y - self.Z @ np.linalg.solve(self.capacitance, self.U.T @ y)
@@ -0,0 +1,99 @@
+import numpy as np
+import scipy.sparse as sp
+from core.dof_manager import DofManager
+
+
+def rigid_arm(offset):
+    """
+    6x6 map from the DOFs of an independent node to a node located at
+    `offset` from it: u_d = u_i + theta_i x offset, theta_d = theta_i
+    """
+    rx, ry, rz = offset
+    B = np.eye(6)
+    B[0:3, 3:6] = [[0.0, rz, -ry],
+                   [-rz, 0.0, rx],
+                   [ry, -rx, 0.0]]
+    return B
+
+
+def rbe3_coefficients(master_node, slave_nodes, weights):
+    """
+    Least-squares rigid body motion of the RBE3 reference node from the
+    weighted translations of its slaves.
+    Returns: (6, 3 * n_slaves) matrix C with u_master = C @ [u_slave_translations]
+    """
+    arms = [rigid_arm(slave.coords - master_node.coords)[0:3] for slave in slave_nodes]
+    A = sum(w * B.T @ B for w, B in zip(weights, arms))
+    A_inv = np.linalg.pinv(A)  # rotations about a line of collinear slaves stay undetermined (zero)
+    return np.hstack([A_inv @ (w * B.T) for w, B in zip(weights, arms)])
+
+
+def mpc_equations(structure):
+    """
+    Collects every multi-point constraint as u_dependent = C @ u.
+    RBE2 slaves and RigidElement node1 follow their partner through a rigid arm;
+    RBE3 reference (master) nodes follow the weighted motion of their slaves.
+    Returns: dependent DOFs and the (rows, cols, vals) triplets of C
+    """
+    dependent, rows, cols, vals = [], [], [], []
+    owner = {}
+
+    def add(dep_node, coef, ind_dofs, mpc):
+        if dep_node.id in owner:
+            raise ValueError(f"Node {dep_node.id} is dependent in both {owner[dep_node.id]} and {mpc}")
+        owner[dep_node.id] = mpc
+        dep_dofs = np.asarray(dep_node.dofs)
+        r, c = np.nonzero(coef)
+        dependent.append(dep_dofs)
+        rows.append(dep_dofs[r])
+        cols.append(np.asarray(ind_dofs)[c])
+        vals.append(coef[r, c])
+
+    for rbe2 in structure.rbe2_elements:
+        master = rbe2.master_node
+        for slave in rbe2.slave_nodes:
+            add(slave, rigid_arm(slave.coords - master.coords), master.dofs, rbe2)
+
+    for rigid in structure.rigid_elements:
+        add(rigid.node1, rigid_arm(rigid.node1.coords - rigid.node2.coords), rigid.node2.dofs, rigid)
+
+    for rbe3 in structure.rbe3_elements:
+        coef = rbe3_coefficients(rbe3.master_node, rbe3.slave_nodes, rbe3.weights)
+        slave_dofs = [dof for slave in rbe3.slave_nodes for dof in slave.dofs[0:3]]
+        add(rbe3.master_node, coef, slave_dofs, rbe3)
+
+    if not dependent:
+        empty = np.zeros(0, dtype=int)
+        return empty, empty, empty, np.zeros(0)
+    return tuple(np.concatenate(a) for a in (dependent, rows, cols, vals))
+
+
+def build_constraint_transformation(structure, supports=None):
+    """
+    Sparse transformation from the free independent DOFs to all DOFs,
+    U = T @ U_reduced, so that K_reduced = T.T @ K @ T and F_reduced = T.T @ F.
+    Chained MPCs (a master that is itself dependent) are resolved by substitution.
+    Returns: T (ndof x n_free, CSR), free_dofs (global id of each reduced DOF)
+    """
+    if supports is None:
+        supports = structure.supports
+    ndof = 6 * len(structure.nodes)
+
+    dependent, rows, cols, vals = mpc_equations(structure)
+    dofs = DofManager(np.arange(len(structure.nodes)), supports, dependent)
+    ind_dofs = np.flatnonzero(~dofs.dependent_mask)
+
+    C = sp.coo_matrix((np.concatenate([vals, np.ones(len(ind_dofs))]),
+                       (np.concatenate([rows, ind_dofs]), np.concatenate([cols, ind_dofs]))),
+                      shape=(ndof, ndof)).tocsr()
+
+    T = C
+    for _ in range(len(dependent) + 1):
+        if T[:, dependent].nnz == 0:
+            break
+        T = T @ C
+        T.eliminate_zeros()
+    else:
+        raise ValueError("Cyclic MPC definition: dependent DOFs cannot be resolved")
+
+    return T[:, dofs.free_dofs].tocsr(), dofs.free_dofs
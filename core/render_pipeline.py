@@ -0,0 +1,101 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from core.visualise_structure import structure_plot_data, draw_structure
+from core.visualise_stress import draw_stress_distribution
+
+# Stress components plotted per load case by FEA_wrapper.exportResults
+STRESS_PLOTS = ("sigma_axial", "sigma_bending_y", "sigma_bending_z", "tau_torsion", "sigma_total")
+
+
+def _init_worker():
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def process_pool(max_workers=None, start_method="forkserver"):
+    """
+    Process pool of headless (Agg) plotting workers.
+    start_method: multiprocessing start method, falls back to "spawn" where
+                  it is not available. With "forkserver" and "spawn" the
+                  calling script is imported in the workers and needs an
+                  if __name__ == "__main__": guard; "fork" avoids that but
+                  can deadlock when the parent runs threads.
+    """
+    if start_method not in multiprocessing.get_all_start_methods():
+        start_method = "spawn"
+    context = multiprocessing.get_context(start_method)
+    return ProcessPoolExecutor(max_workers, mp_context=context, initializer=_init_worker)
+
+
+def _render(job):
+    kind, kwargs = job
+    if kind == "structure":
+        return draw_structure(**kwargs)
+    return draw_stress_distribution(**kwargs)
+
+
+def figure_jobs(structure, results, scale=2):
+    """
+    The figures of one load case (as exported by FEA_wrapper.exportResults)
+    as picklable jobs holding only NumPy arrays and plain values.
+    results: LoadCaseResults of the load case
+    """
+    name = results.name
+    coords = np.array(structure.node_coordinates(), dtype=float)
+    connectivity = np.array(structure.beam_connectivity(), dtype=int)
+    U = np.asarray(results.U, dtype=float)
+
+    jobs = [("structure", {"data": structure_plot_data(structure, U, results=results),
+                           "scale": scale, "name": name})]
+    for component in STRESS_PLOTS:
+        jobs.append(("stress", {"coords": coords, "connectivity": connectivity, "U": U,
+                                "stress_vals": np.abs(results.stress(component)),
+                                "stress_component": component, "filename": "stress_{0}.png".format(name)}))
+    return jobs
+
+
+class RenderPipeline:
+    """
+    Renders figures in a pool of worker processes with the headless Agg
+    backend. Jobs are submitted as soon as a load case is exported, so
+    rendering overlaps with solving the next one; wait() collects the file
+    names.
+    max_workers: pool size, defaults to the number of CPUs
+    start_method: multiprocessing start method of the pool (see process_pool)
+    """
+
+    def __init__(self, max_workers=None, start_method="forkserver"):
+        self.max_workers = max_workers or os.cpu_count()
+        self.start_method = start_method
+        self._executor = None
+        self._pending = []  # (load case name, future)
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = process_pool(self.max_workers, self.start_method)
+        return self._executor
+
+    def submit(self, structure, results, scale=2):
+        """
+        Queues the figures of one load case.
+        """
+        for job in figure_jobs(structure, results, scale):
+            self._pending.append((results.name, self._pool().submit(_render, job)))
+
+    def wait(self):
+        """
+        Waits for all queued figures.
+        Returns: {load case name: [file names]} in submission order
+        """
+        images = {}
+        pending, self._pending = self._pending, []
+        for name, future in pending:
+            images.setdefault(name, []).append(future.result())
+        return images
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -2,22 +2,69 @@ import os
 import glob
 import re
 import math
+import numpy as np
 from docx import Document
 from docx.shared import Inches
 from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import qn, nsdecls
 # from docx2pdf import convert
 
+# Rows of the beam properties table: attribute, description / units
+PROPERTY_ROWS = [
+    ("E", "Young's modulus (MPa)"),
+    ("G", "Shear modulus (MPa)"),
+    ("A", "Cross sectional Area (mm2)"),
+    ("Iy", "Moment of inertia - y axis"),
+    ("Iz", "Moment of inertia - z axis"),
+    ("J", "Torsional constant (Iy + Iz)"),
+    ("b", "Beam width (mm)"),
+    ("h", "Beam height (mm)"),
+    ("r", "Circle radius (mm)"),
+    ("t", "Thickness (mm)"),
+]
+
+
+def _xml_text(column):
+    """
+    Column values as XML-escaped strings (object array, for concatenation).
+    """
+    column = np.asarray(column)
+    text = column.astype(str)
+    if column.dtype.kind not in "iuf":
+        for char, entity in (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;")):
+            text = np.char.replace(text, char, entity)
+    return text.astype(object)
+
 
 class EngineeringReportGenerator:
-    def __init__(self, data_dir, output_name="Engineering_Report"):
+    def __init__(self, data_dir=None, output_name="Engineering_Report", results=None,
+                 properties=None, images=None):
+        """
+        Structured inputs are used as given; data_dir is only scanned for
+        .dat/.png files when none of them is provided.
+        results: {loadcase: LoadCaseResults}
+        properties: list of BeamProperties (or dicts of their attributes)
+        images: {loadcase: [image paths]}
+        """
         self.data_dir = data_dir
         self.output_name = output_name
+        self.results = dict(results) if results is not None else {}
+        self.properties = list(properties) if properties is not None else []
         self.properties_files = {}
         self.stresses_files = {}
         self.nodal_disp_files = {}
-        self.images = {}
+        self.images = {loadcase: list(paths) for loadcase, paths in (images or {}).items()}
+
+    @classmethod
+    def from_results_store(cls, reader, output_name="Engineering_Report", images=None):
+        """
+        Report of every load case in a ResultsReader, with the beam
+        properties stored in its metadata.
+        """
+        results = {name: reader.results(name) for name in reader.case_names}
+        return cls(None, output_name, results=results,
+                   properties=reader.metadata.get("beam_properties", []), images=images)
 
     def collect_files(self):
         for file in glob.glob(os.path.join(self.data_dir, "*.dat")):
@@ -101,11 +148,61 @@ class EngineeringReportGenerator:
                     })
         return nodes
 
+    def elements_from_results(self, results):
+        """
+        Stress table columns from a LoadCaseResults: {key: (E,) array}, with
+        the keys of parse_stresses_file plus "vonMises".
+        """
+        elements = {key: results.stress(key) for key in
+                    ("sigma_axial", "sigma_bending_y", "sigma_bending_z", "tau_torsion", "sigma_total")}
+        elements["ID"] = np.arange(1, len(results.element_groups) + 1)
+        elements["group"] = results.element_groups
+        elements["vonMises"] = results.stress("von_mises")
+        return elements
+
+    def nodes_from_results(self, results):
+        """
+        Displacement table columns from a LoadCaseResults: {key: (N,) array},
+        with the keys of parse_nodal_displacement_file.
+        """
+        nodes = dict(zip(("Ux", "Uy", "Uz", "Rx", "Ry", "Rz"), results.nodal_displacements.T))
+        nodes["ID"] = np.arange(len(results.total_displacements))
+        nodes["TotalDisp"] = results.total_displacements
+        return nodes
+
+    @staticmethod
+    def as_columns(rows):
+        """
+        {key: array} view of table rows given either as a list of dicts (the
+        parse_* format) or already as columns.
+        """
+        if isinstance(rows, dict):
+            return {key: np.asarray(values) for key, values in rows.items()}
+        return {key: np.array([row[key] for row in rows]) for key in (rows[0] if rows else {})}
+
     def add_image_with_caption(self, doc, image_path):
         doc.add_picture(image_path, width=Inches(5))
         image_name = os.path.basename(image_path).replace(".png", "")
         doc.add_paragraph(f"Figure: {image_name}", style='Caption')
 
+    def add_beam_properties_table(self, doc, beam):
+        props = beam if isinstance(beam, dict) else vars(beam)
+        doc.add_heading(f"{props.get('name')}", level=2)
+        table = doc.add_table(rows=1, cols=3)
+        hdr = table.rows[0].cells
+        hdr[0].paragraphs[0].add_run("Property").bold = True
+        hdr[1].paragraphs[0].add_run("Value").bold = True
+        hdr[2].paragraphs[0].add_run("Description / Units").bold = True
+
+        for key, comment in PROPERTY_ROWS:
+            val = props.get(key)
+            row = table.add_row().cells
+            row[0].text = key
+            row[1].text = "None" if val is None else f"{float(val):.1f}"
+            row[2].text = comment
+
+        self.set_table_borders(table)
+
     def add_properties_table(self, doc, filepath, name):
         doc.add_heading(f"{name}", level=2)
         table = doc.add_table(rows=1, cols=3)
@@ -137,78 +234,67 @@ class EngineeringReportGenerator:
 
         self.set_table_borders(table)
 
-    def add_stress_table(self, doc, elements):
-        doc.add_heading("Stresses Table - Full", level=3)
-        table = doc.add_table(rows=1, cols=8)
+    def add_bulk_table(self, doc, headers, columns):
+        """
+        Table with a bold header row and one row per entry of the columns.
+        The body is generated as a single XML fragment from the column arrays
+        instead of adding rows and setting cell texts one by one, and the
+        borders are applied once.
+        columns: list of 1D arrays, converted to str as they are
+        """
+        table = doc.add_table(rows=1, cols=len(headers))
         hdr = table.rows[0].cells
-        headers = ["Element ID", "Group", "σ_axial [MPa]", "σ_bend_y [MPa]",
-                   "σ_bend_z [MPa]", "τ_torsion [MPa]", "σ_total [MPa]", "σ_vonMises [MPa]"]
         for i, h in enumerate(headers):
             hdr[i].paragraphs[0].add_run(h).bold = True
 
-        for el in elements:
-            row = table.add_row().cells
-            row[0].text = str(el["ID"])
-            row[1].text = el["group"]
-            row[2].text = f'{el["sigma_axial"]:.2f}'
-            row[3].text = f'{el["sigma_bending_y"]:.2f}'
-            row[4].text = f'{el["sigma_bending_z"]:.2f}'
-            row[5].text = f'{el["tau_torsion"]:.2f}'
-            row[6].text = f'{el["sigma_total"]:.2f}'
-
-            vm = math.sqrt(el["sigma_axial"] ** 2 + el["sigma_bending_y"] ** 2 +
-                           el["sigma_bending_z"] ** 2 + 3 * el["tau_torsion"] ** 2)
-            row[7].text = f'{vm:.2f}'
-            el["vonMises"] = vm
+        widths = [cell._tc.tcPr.tcW.get(qn('w:w')) for cell in hdr]
+        row_xml = np.full(len(columns[0]) if columns else 0, "<w:tr>", dtype=object)
+        for width, column in zip(widths, columns):
+            row_xml += (f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr><w:p><w:r>'
+                        '<w:t xml:space="preserve">') + _xml_text(column) + '</w:t></w:r></w:p></w:tc>'
+        row_xml += "</w:tr>"
 
+        body = parse_xml(f'<w:tbl {nsdecls("w")}>' + "".join(row_xml) + '</w:tbl>')
+        table._tbl.extend(list(body))
         self.set_table_borders(table)
+        return table
+
+    def add_stress_table(self, doc, elements):
+        doc.add_heading("Stresses Table - Full", level=3)
+        headers = ["Element ID", "Group", "σ_axial [MPa]", "σ_bend_y [MPa]",
+                   "σ_bend_z [MPa]", "τ_torsion [MPa]", "σ_total [MPa]", "σ_vonMises [MPa]"]
+        el = self.as_columns(elements)
+        if "vonMises" not in el:
+            el["vonMises"] = np.sqrt(el["sigma_axial"] ** 2 + el["sigma_bending_y"] ** 2 +
+                                     el["sigma_bending_z"] ** 2 + 3 * el["tau_torsion"] ** 2)
+
+        columns = [el["ID"], el["group"]]
+        columns += [np.char.mod('%.2f', el[key]) for key in
+                    ("sigma_axial", "sigma_bending_y", "sigma_bending_z", "tau_torsion", "sigma_total", "vonMises")]
+        self.add_bulk_table(doc, headers, columns)
 
     def add_max_stress_summary(self, doc, elements):
-        max_el = max(elements, key=lambda x: x["vonMises"])
+        el = self.as_columns(elements)
+        i = int(np.argmax(el["vonMises"]))
         doc.add_heading("Maximum von Mises Stress", level=3)
-        table = doc.add_table(rows=1, cols=3)
-        hdr = table.rows[0].cells
         headers = ["Element ID", "Group", "Max σ_vonMises  [MPa]"]
-        for i, h in enumerate(headers):
-            hdr[i].paragraphs[0].add_run(h).bold = True
-        row = table.add_row().cells
-        row[0].text = str(max_el["ID"])
-        row[1].text = max_el["group"]
-        row[2].text = f'{max_el["vonMises"]:.2f}'
-        self.set_table_borders(table)
+        self.add_bulk_table(doc, headers, [el["ID"][i:i + 1], el["group"][i:i + 1],
+                                           np.char.mod('%.2f', el["vonMises"][i:i + 1])])
 
     def add_nodal_displacement_table(self, doc, nodes):
         doc.add_heading("Total Nodal Displacement - Full", level=3)
-        table = doc.add_table(rows=1, cols=8)
-        hdr = table.rows[0].cells
         headers = ["Node ID", "Ux [mm]", "Uy [mm]", "Uz [mm]", "Rx [rad]", "Ry [rad]", "Rz [rad]", "Total Disp [mm]"]
-        for i, h in enumerate(headers):
-            hdr[i].paragraphs[0].add_run(h).bold = True
-
-        for node in nodes:
-            row = table.add_row().cells
-            row[0].text = str(node["ID"])
-            row[1].text = f'{node["Ux"]:.3f}'
-            row[2].text = f'{node["Uy"]:.3f}'
-            row[3].text = f'{node["Uz"]:.3f}'
-            row[4].text = f'{node["Rx"]:.3f}'
-            row[5].text = f'{node["Ry"]:.3f}'
-            row[6].text = f'{node["Rz"]:.3f}'
-            row[7].text = f'{node["TotalDisp"]:.3f}'
-
-        self.set_table_borders(table)
+        node = self.as_columns(nodes)
+        columns = [node["ID"]] + [np.char.mod('%.3f', node[key]) for key in
+                                  ("Ux", "Uy", "Uz", "Rx", "Ry", "Rz", "TotalDisp")]
+        self.add_bulk_table(doc, headers, columns)
 
     def add_max_displacement_summary(self, doc, nodes):
-        max_node = max(nodes, key=lambda x: x["TotalDisp"])
+        node = self.as_columns(nodes)
+        i = int(np.argmax(node["TotalDisp"]))
         doc.add_heading("Maximum Total Displacement", level=3)
-        table = doc.add_table(rows=1, cols=2)
-        hdr = table.rows[0].cells
-        hdr[0].paragraphs[0].add_run("Node ID").bold = True
-        hdr[1].paragraphs[0].add_run("Max Total Disp [mm]").bold = True
-        row = table.add_row().cells
-        row[0].text = str(max_node["ID"])
-        row[1].text = f'{max_node["TotalDisp"]:.3f}'
-        self.set_table_borders(table)
+        headers = ["Node ID", "Max Total Disp [mm]"]
+        self.add_bulk_table(doc, headers, [node["ID"][i:i + 1], np.char.mod('%.3f', node["TotalDisp"][i:i + 1])])
 
     def set_table_borders(self, table):
         tbl = table._tbl
@@ -230,7 +316,8 @@ class EngineeringReportGenerator:
             el["vonMises"] = vm
 
     def generate(self):
-        self.collect_files()
+        if not (self.results or self.properties or self.images) and self.data_dir is not None:
+            self.collect_files()
         doc = Document()
         doc.add_heading("Engineering Report", 0)
 
@@ -260,11 +347,13 @@ class EngineeringReportGenerator:
 
         # Properties sections
         doc.add_heading(f" Beam Properties", level=1)
+        for beam in self.properties:
+            self.add_beam_properties_table(doc, beam)
         for name, file in self.properties_files.items():
             self.add_properties_table(doc, file, name)
 
         all_loadcases = set(self.stresses_files.keys()).union(
-            self.nodal_disp_files.keys()).union(self.images.keys())
+            self.nodal_disp_files.keys()).union(self.images.keys()).union(self.results.keys())
 
         for loadcase in sorted(all_loadcases):
             doc.add_heading(f'Loadcase: {loadcase}', level=1)
@@ -274,17 +363,25 @@ class EngineeringReportGenerator:
                 for img in self.images[loadcase]:
                     self.add_image_with_caption(doc, img)
 
-            if loadcase in self.stresses_files:
+            if loadcase in self.results:
+                elements = self.elements_from_results(self.results[loadcase])
+                nodes = self.nodes_from_results(self.results[loadcase])
+            else:
+                elements = nodes = None
+                if loadcase in self.stresses_files:
+                    elements = self.parse_stresses_file(self.stresses_files[loadcase])
+                    self.compute_von_mises(elements)
+                if loadcase in self.nodal_disp_files:
+                    nodes = self.parse_nodal_displacement_file(self.nodal_disp_files[loadcase])
+
+            if elements is not None:
                 doc.add_heading('Stress Results', level=2)
-                elements = self.parse_stresses_file(self.stresses_files[loadcase])
-                self.compute_von_mises(elements)
                 self.add_max_stress_summary(doc, elements)
                 self.add_stress_table(doc, elements)
                 
                 
-            if loadcase in self.nodal_disp_files:
+            if nodes is not None:
                 doc.add_heading('Nodal Displacements', level=2)
-                nodes = self.parse_nodal_displacement_file(self.nodal_disp_files[loadcase])
                 self.add_max_displacement_summary(doc, nodes)
                 self.add_nodal_displacement_table(doc, nodes)
 
@@ -0,0 +1,80 @@
+import numpy as np
+from functools import cached_property
+
+
+class LoadCaseResults:
+    """
+    Post-processing results of one load case.
+
+    Element forces, stresses and derived quantities are computed on first
+    access and kept, so the text exporters, plotters and report generator
+    share one recovery pass instead of each recomputing it.
+    structure: the solved Structure
+    U: global displacement vector of the load case
+    name: load case name
+    """
+
+    def __init__(self, structure, U, name=None):
+        self.structure = structure
+        self.U = np.asarray(U)
+        self.name = name
+
+    @cached_property
+    def element_results(self):
+        """
+        Structured array of Structure.recover_element_results.
+        """
+        return self.structure.recover_element_results(self.U)
+
+    @property
+    def element_forces(self):
+        return self.element_results['forces']
+
+    def stress(self, component, end=0):
+        """
+        (E,) stress component at one beam end (0: node1, 1: node2).
+        """
+        return self.element_results[component][:, end]
+
+    @cached_property
+    def element_groups(self):
+        return np.array([elem.name for elem in self.structure.elements], dtype=object)
+
+    @cached_property
+    def node_coordinates(self):
+        return self.structure.node_coordinates()
+
+    @cached_property
+    def beam_connectivity(self):
+        return self.structure.beam_connectivity()
+
+    @cached_property
+    def nodal_displacements(self):
+        """
+        (N, 6) displacements and rotations per node.
+        """
+        return self.U.reshape(-1, 6)
+
+    @cached_property
+    def total_displacements(self):
+        """
+        (N,) magnitude of the nodal translations.
+        """
+        return np.linalg.norm(self.nodal_displacements[:, :3], axis=1)
+
+    @cached_property
+    def max_von_mises(self):
+        """
+        (element index, value) of the largest node1 von Mises stress.
+        """
+        von_mises = self.stress('von_mises')
+        i = int(np.argmax(von_mises))
+        return i, von_mises[i]
+
+    @cached_property
+    def max_displacement(self):
+        """
+        (node index, value) of the largest total displacement.
+        """
+        i = int(np.argmax(self.total_displacements))
+        return i, self.total_displacements[i]
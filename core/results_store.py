@@ -0,0 +1,179 @@
+import ast
+import json
+import os
+import struct
+from functools import cached_property
+import numpy as np
+from core.results import LoadCaseResults
+
+MAGIC = b"FEA3DRES"
+VERSION = 1
+ALIGNMENT = 64
+_TRAILER = struct.Struct("<Q8s")  # footer offset, magic
+
+
+class ResultsWriter:
+    """
+    Writes the results of a run to one binary file.
+
+    Layout: an 8-byte magic, then raw C-ordered arrays, each aligned to 64
+    bytes, then a JSON footer with the metadata, the model arrays and the
+    dtype/shape/offset of every per-load-case array, and a fixed trailer
+    pointing at the footer. The footer is rewritten after every load case, so
+    the file is complete at any time and can be read while a run continues.
+    path: output file
+    metadata: optional dict stored with the results (JSON serializable)
+    """
+
+    def __init__(self, path, metadata=None):
+        self.path = path
+        self.metadata = dict(metadata or {})
+        self.model = None
+        self.cases = []
+        self._file = open(path, "w+b")
+        self._file.write(MAGIC)
+        self._data_end = self._file.tell()
+        self._write_footer()
+
+    def _write_array(self, array):
+        array = np.ascontiguousarray(array)
+        self._file.seek(self._data_end)
+        offset = -(-self._data_end // ALIGNMENT) * ALIGNMENT
+        self._file.write(b"\0" * (offset - self._data_end))
+        self._file.write(array.tobytes())
+        self._data_end = self._file.tell()
+        return {"offset": offset, "dtype": repr(np.lib.format.dtype_to_descr(array.dtype)), "shape": list(array.shape)}
+
+    def _write_footer(self):
+        footer = json.dumps({"version": VERSION, "metadata": self.metadata,
+                             "model": self.model, "cases": self.cases}).encode()
+        self._file.seek(self._data_end)
+        self._file.write(footer)
+        self._file.write(_TRAILER.pack(self._data_end, MAGIC))
+        self._file.truncate()
+        self._file.flush()
+
+    def add(self, results):
+        """
+        Appends one load case. A load case stored again under the same name
+        replaces the earlier entry (its bytes stay in the file, unreferenced).
+        results: LoadCaseResults (its name is the load case name)
+        """
+        if self._file.closed:
+            raise ValueError("Results file is closed")
+        self.cases = [case for case in self.cases if case["name"] != results.name]
+
+        if self.model is None:
+            self.model = {"node_coordinates": self._write_array(results.node_coordinates),
+                          "beam_connectivity": self._write_array(results.beam_connectivity),
+                          "element_groups": [None if g is None else str(g) for g in results.element_groups]}
+
+        self.cases.append({"name": results.name,
+                           "displacements": self._write_array(results.nodal_displacements),
+                           "element_results": self._write_array(results.element_results)})
+        self._write_footer()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ResultsReader:
+    """
+    Memory-mapped access to a file written by ResultsWriter. Arrays are only
+    read from disk when their pages are touched.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a results file")
+            f.seek(-_TRAILER.size, os.SEEK_END)
+            end = f.tell()
+            footer_offset, magic = _TRAILER.unpack(f.read(_TRAILER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} has no results footer")
+            f.seek(footer_offset)
+            footer = json.loads(f.read(end - footer_offset))
+
+        if footer["version"] > VERSION:
+            raise ValueError(f"Unsupported results file version {footer['version']}")
+        self.metadata = footer["metadata"]
+        self._model = footer["model"]
+        self._cases = {case["name"]: case for case in footer["cases"]}
+        self.case_names = [case["name"] for case in footer["cases"]]
+
+    def _array(self, entry):
+        dtype = np.lib.format.descr_to_dtype(ast.literal_eval(entry["dtype"]))
+        shape = tuple(entry["shape"])
+        if int(np.prod(shape)) == 0:
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(self.path, dtype=dtype, mode="r", offset=entry["offset"], shape=shape)
+
+    def _case(self, name):
+        if name not in self._cases:
+            raise KeyError(name)
+        return self._cases[name]
+
+    @property
+    def node_coordinates(self):
+        return self._array(self._model["node_coordinates"])
+
+    @property
+    def beam_connectivity(self):
+        return self._array(self._model["beam_connectivity"])
+
+    @property
+    def element_groups(self):
+        return np.array(self._model["element_groups"], dtype=object)
+
+    def displacements(self, name):
+        """
+        (N, 6) nodal displacements of a load case.
+        """
+        return self._array(self._case(name)["displacements"])
+
+    def element_results(self, name):
+        """
+        (E,) structured array of Structure.recover_element_results for a load case.
+        """
+        return self._array(self._case(name)["element_results"])
+
+    def results(self, name):
+        """
+        LoadCaseResults-compatible view of a stored load case.
+        """
+        return StoredLoadCaseResults(self, name)
+
+
+class StoredLoadCaseResults(LoadCaseResults):
+    """
+    LoadCaseResults backed by a ResultsReader instead of a Structure.
+    """
+
+    def __init__(self, reader, name):
+        super().__init__(None, reader.displacements(name).reshape(-1), name)
+        self.reader = reader
+
+    @cached_property
+    def element_results(self):
+        return self.reader.element_results(self.name)
+
+    @cached_property
+    def element_groups(self):
+        return self.reader.element_groups
+
+    @cached_property
+    def node_coordinates(self):
+        return self.reader.node_coordinates
+
+    @cached_property
+    def beam_connectivity(self):
+        return self.reader.beam_connectivity
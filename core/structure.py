@@ -1,35 +1,136 @@
 from core.node import Node
-from core.beam import BeamElement3D
+from core.beam import BeamElement3D, compute_global_stiffness_batch, \
+    compute_internal_forces_batch, compute_stresses_batch, ELEMENT_RESULTS_DTYPE
 from core.spring_element import SpringElement3D
 from core.RBE2 import RBE2Element
 from core.RBE3 import RBE3Element
 from core.RigidElement import RigidElement
+from core.superelement import SuperelementInstance
+from core.factorization_cache import model_hash
+from core.iterative_solver import pcg
+from core.dof_ordering import compute_node_ordering, reduced_dof_order, PermutedFactor
+from core.dof_manager import DofManager
+from core.mpc_transformation import build_constraint_transformation
+from core.low_rank_update import low_rank_decomposition, WoodburyFactor
 import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
 
 class Structure:
     def __init__(self):
         self.nodes = []
+        self.node_index = {}  # node_id: Node, kept in sync by add_node
         self.elements = []
         self.spring_elements = []
         self.rbe2_elements = []
         self.rbe3_elements = []
         self.rigid_elements = []
+        self.superelements = []
         self.loads = {}       # node_id: [Fx, Fy, Fz, Mx, My, Mz]
         self.supports = {}    # node_id: [fixed_dofs]
+        self.factorization_cache = None  # optional FactorizationCache
+        self.dof_ordering = None         # None or "rcm": renumber DOFs before factorization
+        self.solver_info = {}            # iteration/residual report of the last solve
+        self.mpc_method = "legacy"       # or "transformation": eliminate MPCs with a sparse T
+        self.low_rank_update = False     # apply small stiffness edits to the last factorization
+        self.max_update_rank = 48
+        self._base_factorization = None  # (supports key, K, T, factor) of the last full factorization
 
     def getNodeById(self, id):
-        return next((item for item in self.nodes if item.id == id))
+        return self.node_index[id]
+
+    def getNodesByIds(self, ids):
+        index = self.node_index
+        return [index[i] for i in ids]
 
     def add_node(self, x, y, z):
         node_id = len(self.nodes)
         node = Node(node_id, x, y, z)
         self.nodes.append(node)
+        self.node_index[node_id] = node
         return node
 
     def add_beam(self, node1, node2, beamProperties):
         element = BeamElement3D(node1, node2, beamProperties)
         self.elements.append(element)
 
+    def add_nodes(self, coords):
+        """
+        Adds many nodes at once. A Node is still created per row;
+        CompactStructure stores the coordinates as one array instead.
+        coords: (n, 3) array of node coordinates
+        Returns: (n,) array of the new node ids
+        """
+        coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+        first = len(self.nodes)
+        nodes = [Node(first + i, x, y, z) for i, (x, y, z) in enumerate(coords.tolist())]
+        self.nodes.extend(nodes)
+        self.node_index.update((node.id, node) for node in nodes)
+        return np.arange(first, first + len(coords))
+
+    def add_beams(self, connectivity, beam_properties, section_ids=None):
+        """
+        Adds many beams at once. Node and section ids are checked for all
+        rows before any beam is added; a BeamElement3D is still created per
+        row, CompactStructure only stores the id arrays.
+        connectivity: (n, 2) array of end node ids
+        beam_properties: a BeamProperties shared by all beams, or a list of them
+        section_ids: (n,) indices into beam_properties when it is a list
+        """
+        connectivity, sections, section_ids = self._bulk_beam_arguments(connectivity, beam_properties, section_ids)
+        nodes = self.nodes
+        self.elements.extend(BeamElement3D(nodes[i], nodes[j], sections[k])
+                             for (i, j), k in zip(connectivity.tolist(), section_ids.tolist()))
+
+    def _bulk_beam_arguments(self, connectivity, beam_properties, section_ids):
+        connectivity = np.asarray(connectivity, dtype=int).reshape(-1, 2)
+        if len(connectivity) and (connectivity.min() < 0 or connectivity.max() >= len(self.nodes)):
+            raise ValueError("Beam connectivity refers to undefined nodes")
+        if isinstance(beam_properties, (list, tuple)):
+            sections = list(beam_properties)
+            if section_ids is None:
+                raise ValueError("section_ids is required when several beam properties are given")
+            section_ids = np.asarray(section_ids, dtype=int)
+        else:
+            sections = [beam_properties]
+            section_ids = np.zeros(len(connectivity), dtype=int)
+        if len(section_ids) != len(connectivity):
+            raise ValueError("One section id is required per beam")
+        if len(section_ids) and (section_ids.min() < 0 or section_ids.max() >= len(sections)):
+            raise ValueError("Section ids refer to undefined beam properties")
+        return connectivity, sections, section_ids
+
+    def add_springs(self, connectivity, stiffness_vectors):
+        """
+        Adds many springs at once. Node ids are checked for all rows before
+        any spring is added.
+        connectivity: (n, 2) array of node ids
+        stiffness_vectors: one stiffness vector for all springs, or one per spring
+        """
+        connectivity = np.asarray(connectivity, dtype=int).reshape(-1, 2)
+        if len(connectivity) and (connectivity.min() < 0 or connectivity.max() >= len(self.nodes)):
+            raise ValueError("Spring connectivity refers to undefined nodes")
+        stiffness_vectors = np.asarray(stiffness_vectors, dtype=float)
+        if stiffness_vectors.ndim == 1:
+            stiffness_vectors = np.tile(stiffness_vectors, (len(connectivity), 1))
+        if len(stiffness_vectors) != len(connectivity):
+            raise ValueError("One stiffness vector is required per spring")
+        nodes = self.nodes
+        self.spring_elements.extend(SpringElement3D(nodes[i], nodes[j], k)
+                                    for (i, j), k in zip(connectivity.tolist(), stiffness_vectors))
+
+    def add_supports(self, node_ids, fixed_dofs):
+        """
+        Adds many supports at once.
+        node_ids: sequence of node ids
+        fixed_dofs: one list of fixed DOFs for all nodes, or one list per node
+        """
+        node_ids = [int(nid) for nid in node_ids]
+        if len(fixed_dofs) and np.ndim(fixed_dofs[0]) == 0:
+            fixed_dofs = [fixed_dofs] * len(node_ids)
+        for nid, dofs in zip(node_ids, fixed_dofs):
+            self.add_support(nid, [int(dof) for dof in dofs])
+
     def add_spring(self, node1, node2, stiffness_vector):
         spring = SpringElement3D(node1, node2, stiffness_vector)
         self.spring_elements.append(spring)
@@ -46,45 +147,181 @@ class Structure:
         rigid = RigidElement(node1, node2)
         self.rigid_elements.append(rigid)
 
+    def add_superelement(self, superelement, nodes, rotation=None):
+        """
+        Places a condensed Superelement in this structure.
+        nodes: nodes of this structure matched to the superelement boundary nodes
+        rotation: optional 3x3 matrix from sub-model axes to this structure's axes
+        """
+        instance = SuperelementInstance(superelement, nodes, rotation)
+        self.superelements.append(instance)
+        return instance
+
     def add_support(self, node_id, fixed_dofs):
         self.supports[node_id] = fixed_dofs
 
     def add_load(self, node_id, load_vector):
         self.loads[node_id] = np.array(load_vector)
 
-    def assemble_global_stiffness(self):
+    def node_coordinates(self):
+        """
+        (N, 3) array of node coordinates.
+        """
+        return np.array([node.coords for node in self.nodes], dtype=float).reshape(-1, 3)
+
+    def beam_connectivity(self):
+        """
+        (E, 2) array of beam end node ids.
+        """
+        return np.array([(e.node1.id, e.node2.id) for e in self.elements], dtype=int).reshape(-1, 2)
+
+    def beam_section_properties(self):
+        """
+        (E, 6) array of beam E, G, A, Iy, Iz, J.
+        """
+        return np.array([(e.E, e.G, e.A, e.Iy, e.Iz, e.J) for e in self.elements], dtype=float).reshape(-1, 6)
+
+    def element_internal_forces(self, U):
+        """
+        Local internal force vectors of all beams, computed in one batch.
+        U: global displacement vector, or (ndof, n_cases) displacement matrix
+        Returns: (E, 12) array, or (E, 12, n_cases), in the DOF order of
+                 BeamElement3D.compute_internal_forces
+        """
+        conn = self.beam_connectivity()
+        coords = self.node_coordinates()
+        dofs = (6 * conn[:, :, None] + np.arange(6)).reshape(-1, 12)
+        return compute_internal_forces_batch(coords[conn[:, 0]], coords[conn[:, 1]],
+                                             *self.beam_section_properties().T, np.asarray(U)[dofs])
+
+    def beam_section_dimensions(self):
+        """
+        (E, 2) array of section width b and height h per beam (nan if unset).
+        """
+        return np.array([(elem.b, elem.h) for elem in self.elements], dtype=float).reshape(-1, 2)
+
+    def element_stresses(self, forces):
+        """
+        Stresses from element_internal_forces output, computed in one batch
+        with the same section assumptions as calculate_stress.
+        Returns: dict of (E,) or (E, n_cases) arrays, keyed as compute_stresses
+        """
+        E, G, A, Iy, Iz, J = self.beam_section_properties().T
+        b, h = self.beam_section_dimensions().T
+        return compute_stresses_batch(forces, A, Iy, Iz, J, h / 2, b / 2, h / 2)
+
+    def recover_element_results(self, U):
+        """
+        Internal forces and stresses of all beams from one displacement vector,
+        computed in one batch.
+        Returns: structured array of shape (E,) with dtype ELEMENT_RESULTS_DTYPE:
+                 "forces" holds the 12 local end forces, and every stress
+                 component has two columns, node1 and node2. Node2 values use
+                 the node1 sign convention (its end forces reversed), so
+                 column 0 equals BeamElement3D.compute_stresses.
+        """
+        forces = self.element_internal_forces(U)
+        section_forces = np.stack([forces[:, :6], -forces[:, 6:]], axis=2)   # (E, 6, 2)
+        stresses = self.element_stresses(section_forces)
+
+        results = np.zeros(len(forces), dtype=ELEMENT_RESULTS_DTYPE)
+        results['forces'] = forces
+        for name, values in stresses.items():
+            results[name] = values
+        results['von_mises'] = np.sqrt(stresses['sigma_axial']**2 + stresses['sigma_bending_y']**2 +
+                                       stresses['sigma_bending_z']**2 + 3 * stresses['tau_torsion']**2)
+        return results
+
+    def element_force_operator(self):
+        """
+        Sparse (12E x ndof) matrix B with element_internal_forces(U) == (B @ U).reshape(E, 12).
+        """
+        conn = self.beam_connectivity()
+        coords = self.node_coordinates()
+        dofs = (6 * conn[:, :, None] + np.arange(6)).reshape(-1, 12)
+        unit = np.broadcast_to(np.eye(12), (len(conn), 12, 12))
+        blocks = compute_internal_forces_batch(coords[conn[:, 0]], coords[conn[:, 1]],
+                                               *self.beam_section_properties().T, unit)
+        rows = np.broadcast_to(np.arange(12 * len(conn)).reshape(-1, 12, 1), blocks.shape)
+        cols = np.broadcast_to(dofs[:, None, :], blocks.shape)
+        return sp.csr_matrix((blocks.ravel(), (rows.ravel(), cols.ravel())),
+                             shape=(12 * len(conn), 6 * len(self.nodes)))
+
+    def _beam_stiffness_blocks(self):
+        """
+        (E, 12, 12) global beam stiffness matrices, built in one batch.
+        """
+        conn = self.beam_connectivity()
+        if len(conn) == 0:
+            return np.zeros((0, 12, 12))
+        coords = self.node_coordinates()
+        props = self.beam_section_properties()
+        return compute_global_stiffness_batch(coords[conn[:, 0]], coords[conn[:, 1]], *props.T)
+
+    def _stiffness_triplets(self):
+        """
+        Collects the COO triplets (rows, cols, values) of all beam and spring
+        element stiffness matrices in a single vectorized pass.
+        """
+        conn = self.beam_connectivity()
+        beam_dofs = (6 * conn[:, :, None] + np.arange(6)).reshape(-1, 12)
+        spring_dofs = np.array([spring.get_dof_indices() for spring in self.spring_elements], dtype=int)
+
+        blocks = [self._beam_stiffness_blocks()]
+        blocks += [np.array([spring.k_global for spring in self.spring_elements], dtype=float).reshape(-1, 12, 12)]
+
+        triplets = []
+        if len(conn) or len(self.spring_elements):
+            k = np.concatenate(blocks)                                      # (n_elem, 12, 12)
+            dofs = np.concatenate([beam_dofs, spring_dofs.reshape(-1, 12)])  # (n_elem, 12)
+
+            rows = np.repeat(dofs, 12, axis=1)     # rows[e, 12*i + j] = dofs[e, i]
+            cols = np.tile(dofs, (1, 12))          # cols[e, 12*i + j] = dofs[e, j]
+            triplets.append((rows.ravel(), cols.ravel(), k.ravel()))
+
+        # Condensed superelement blocks
+        for instance in self.superelements:
+            se_dofs = np.asarray(instance.get_dof_indices(), dtype=int)
+            n = len(se_dofs)
+            triplets.append((np.repeat(se_dofs, n), np.tile(se_dofs, n), instance.k_global.ravel()))
+
+        if not triplets:
+            empty = np.zeros(0, dtype=int)
+            return empty, empty, np.zeros(0)
+        return tuple(np.concatenate(a) for a in zip(*triplets))
+
+    def assemble_global_stiffness_sparse(self):
+        """
+        Assembles the global stiffness matrix in CSR format.
+        Duplicate triplets are summed during the COO -> CSR conversion.
+        """
         ndof = 6 * len(self.nodes)
-        K = np.zeros((ndof, ndof))
-        for elem in self.elements:
-            dofs = elem.node1.dofs + elem.node2.dofs
-            for i in range(12):
-                for j in range(12):
-                    K[dofs[i], dofs[j]] += elem.k_global[i, j]
-
-        # Add spring element stiffness
-        for spring in self.spring_elements:
-            dofs = spring.get_dof_indices()
-            for i in range(12):
-                for j in range(12):
-                    K[dofs[i], dofs[j]] += spring.k_global[i, j]
-
-        return K
-
-    def assemble_load_vector(self):
+        rows, cols, vals = self._stiffness_triplets()
+        return sp.coo_matrix((vals, (rows, cols)), shape=(ndof, ndof)).tocsr()
+
+    def assemble_global_stiffness(self):
+        return self.assemble_global_stiffness_sparse().toarray()
+
+    def assemble_load_vector(self, loads=None, superelement_loads=True):
+        """
+        loads: {node_id: load_vector}, defaults to the structure loads
+        superelement_loads: add the condensed interior loads of the superelements
+        """
+        if loads is None:
+            loads = self.loads
         ndof = 6 * len(self.nodes)
         F = np.zeros(ndof)
-        for nid, load in self.loads.items():
+        for nid, load in loads.items():
             for i in range(6):
                 F[6 * nid + i] = load[i]
+
+        # Condensed interior loads of superelements
+        if superelement_loads:
+            for instance in self.superelements:
+                F[instance.get_dof_indices()] += instance.f_global
         return F
 
     def apply_boundary_conditions(self, K, F):
-        constrained_dofs = []
-
-        # Standard supports
-        for nid, dofs in self.supports.items():
-            constrained_dofs.extend([6 * nid + dof for dof in dofs])
-
         # --- Add RBE2 constraints ---
         for rbe2 in self.rbe2_elements:
             constraints = rbe2.assemble_constraint_matrix()
@@ -118,18 +355,262 @@ class Structure:
                 K[dof1, dof2] = -1.0
                 K[dof2, dof1] = -1.0
 
-        free_dofs = list(set(range(K.shape[0])) - set(constrained_dofs))
+        dofs = self.dof_manager()
+        K_reduced = dofs.reduce(K)
+        F_reduced = dofs.gather(F)
+        return K_reduced, F_reduced, dofs.free_dofs
+
+    def _mpc_pairs(self):
+        """
+        (dependent_dof, partner_dof) pairs of all RBE2 and Rigid elements.
+        """
+        pairs = []
+        for rbe2 in self.rbe2_elements:
+            pairs.extend((slave_dof, master_dof) for master_dof, slave_dof in rbe2.assemble_constraint_matrix())
+        for rigid in self.rigid_elements:
+            pairs.extend(rigid.assemble_constraint_matrix())
+        if not pairs:
+            return np.zeros((0, 2), dtype=int)
+        return np.unique(np.asarray(pairs, dtype=int), axis=0)
+
+    def dof_manager(self, supports=None, dependent_dofs=None):
+        """
+        DofManager of the given supports (defaults to the structure supports).
+        dependent_dofs: MPC dependent DOFs to eliminate as well
+        """
+        if supports is None:
+            supports = self.supports
+        return DofManager(np.arange(len(self.nodes)), supports, dependent_dofs)
+
+    def _legacy_load_vector(self, F):
+        """
+        Zeroes the loads on RBE2/Rigid dependent DOFs, as apply_boundary_conditions does.
+        """
+        dependent = np.unique(self._mpc_pairs()[:, 0])
+        if sp.issparse(F):
+            keep = np.ones(F.shape[0])
+            keep[dependent] = 0.0
+            return sp.diags(keep) @ F
+        F = F.copy()
+        F[dependent] = 0.0
+        return F
+
+    def apply_boundary_conditions_sparse(self, K, F, supports=None):
+        """
+        Sparse counterpart of apply_boundary_conditions.
+        K: global stiffness matrix (scipy.sparse)
+        F: global load vector, or (ndof, n_cases) load matrix
+        supports: {node_id: [fixed_dofs]}, defaults to the structure supports
+        Returns: K_reduced (CSC), F_reduced, free_dofs
+        """
+        if supports is None:
+            supports = self.supports
+        ndof = K.shape[0]
+
+        # --- RBE2 and Rigid elements: dependent DOF tied to its partner ---
+        pairs = self._mpc_pairs()
+
+        rows, cols, vals = [], [], []
+        if len(pairs):
+            dependent = np.unique(pairs[:, 0])
+
+            # Zero the rows and columns of all dependent DOFs at once
+            keep = np.ones(ndof)
+            keep[dependent] = 0.0
+            D = sp.diags(keep)
+            K = D @ K @ D
+
+            rows += [dependent, pairs[:, 0], pairs[:, 1]]
+            cols += [dependent, pairs[:, 1], pairs[:, 0]]
+            vals += [np.ones(len(dependent)), -np.ones(len(pairs)), -np.ones(len(pairs))]
+
+        # --- RBE3 weights ---
+        for rbe3 in self.rbe3_elements:
+            for master_dof, slave_info in rbe3.assemble_constraint_matrix():
+                for slave_dof, weight in slave_info:
+                    rows.append([master_dof, slave_dof])
+                    cols.append([slave_dof, master_dof])
+                    vals.append([-weight, -weight])
+
+        if rows:
+            K = K + sp.coo_matrix((np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+                                  shape=(ndof, ndof))
+
+        dofs = self.dof_manager(supports)
+        F_reduced = dofs.gather(self._legacy_load_vector(F))
+        K_reduced = dofs.reduce(K).tocsc()
+        return K_reduced, F_reduced, dofs.free_dofs
+
+    def _reduction(self, supports):
+        """
+        Returns (T, free_dofs) with U = T @ U_reduced.
+        free_dofs: global id of the DOF behind each reduced unknown
+        """
+        if self.mpc_method == "legacy":
+            dofs = self.dof_manager(supports)
+            return dofs.selection_matrix(), dofs.free_dofs
+        if self.mpc_method == "transformation":
+            return build_constraint_transformation(self, supports)
+        raise ValueError(f"Unknown MPC method: {self.mpc_method}")
 
-        K_reduced = K[np.ix_(free_dofs, free_dofs)]
-        F_reduced = F[free_dofs]
-        return K_reduced, F_reduced, free_dofs
+    def reduce_system(self, K, F, supports=None):
+        """
+        Applies supports and MPCs to the global system.
+        With mpc_method "transformation" the MPCs are eliminated through
+        K_reduced = T.T @ K @ T and F_reduced = T.T @ F.
+        Returns: K_reduced (CSC), F_reduced, T, free_dofs
+        """
+        if supports is None:
+            supports = self.supports
+        if self.mpc_method == "legacy":
+            K_red, F_red, free_dofs = self.apply_boundary_conditions_sparse(K, F, supports)
+            T, _ = self._reduction(supports)
+            return K_red, F_red, T, free_dofs
 
-    def solve(self):
-        K = self.assemble_global_stiffness()
+        T, free_dofs = self._reduction(supports)
+        K_red = (T.T @ K @ T).tocsc()
+        return K_red, T.T @ F, T, free_dofs
+
+    def _reduce_loads(self, F, T):
+        if self.mpc_method == "legacy":
+            F = self._legacy_load_vector(F)
+        return T.T @ F
+
+    def _factorize(self, K_reduced, free_dofs):
+        """
+        LU-factorizes the reduced stiffness matrix.
+        With dof_ordering set, the system is renumbered first and factorized
+        in that order; the returned factor still solves in the original numbering.
+        Returns an object exposing solve(F) for one or several right-hand sides.
+        """
+        if self.dof_ordering is None:
+            return spla.splu(K_reduced)
+
+        order = reduced_dof_order(compute_node_ordering(self, self.dof_ordering), free_dofs)
+        K_perm = K_reduced[order][:, order]
+        return PermutedFactor(spla.splu(K_perm, permc_spec="NATURAL"), order)
+
+    @staticmethod
+    def _supports_key(supports):
+        return tuple(sorted((nid, tuple(sorted(dofs))) for nid, dofs in supports.items()))
+
+    def _low_rank_factor(self, K, T, supports):
+        """
+        Woodbury update of the last full factorization for the stiffness
+        change K - K_base, or None if the change is not a small edit on the
+        same supports and MPCs.
+        """
+        if self._base_factorization is None:
+            return None
+        # The legacy MPC rows are not of the form T.T K T
+        if self.mpc_method != "transformation" and (self.rbe2_elements or self.rbe3_elements or self.rigid_elements):
+            return None
+        base_key, K_base, T_base, base_factor = self._base_factorization
+        if base_key != self._supports_key(supports) or T.shape != T_base.shape or (T != T_base).nnz:
+            return None
+
+        delta = T.T @ (K - K_base) @ T
+        decomposition = low_rank_decomposition(delta, self.max_update_rank)
+        if decomposition is None:
+            return None
+        idx, V, lam = decomposition
+        if len(lam) == 0:
+            return base_factor
+        if len(lam) > self.max_update_rank:
+            return None
+        return WoodburyFactor(base_factor, delta.shape[0], idx, V, lam)
+
+    def _reduced_factorization(self, supports, K=None):
+        """
+        Returns (factor, T) of the reduced stiffness matrix for the given
+        supports, served from self.factorization_cache when possible, or as a
+        low-rank update of the previous factorization when low_rank_update is on.
+        K: assembled global stiffness matrix, assembled here if needed
+        """
+        key = None
+        if self.factorization_cache is not None:
+            key = model_hash(self, supports)
+            entry = self.factorization_cache.get(key)
+            if entry is not None:
+                return entry
+
+        if K is None:
+            K = self.assemble_global_stiffness_sparse()
+        K_red, _, T, free_dofs = self.reduce_system(K, np.zeros(K.shape[0]), supports)
+
+        if self.low_rank_update:
+            factor = self._low_rank_factor(K, T, supports)
+            if factor is not None:
+                return factor, T
+
+        factor = self._factorize(K_red, free_dofs)
+        if key is not None:
+            self.factorization_cache.put(key, factor, T)
+        if self.low_rank_update:
+            self._base_factorization = (self._supports_key(supports), K, T, factor)
+        return factor, T
+
+    def solve(self, method="direct", x0=None, preconditioner="jacobi", tol=1e-10, maxiter=None):
+        """
+        Solves the static problem for the current loads and supports.
+        method: "direct" (sparse LU) or "pcg" (preconditioned conjugate gradient)
+        x0: global displacement vector to warm start PCG from, e.g. a previous solution
+        preconditioner: "jacobi", "block_jacobi", "ic" or None (PCG only)
+        tol, maxiter: PCG relative residual tolerance and iteration limit
+        Returns: global displacement vector U
+        """
         F = self.assemble_load_vector()
-        K_red, F_red, free_dofs = self.apply_boundary_conditions(K, F)
 
-        U = np.zeros(K.shape[0])
-        U_free = np.linalg.solve(K_red, F_red)
-        U[free_dofs] = U_free
+        if method == "direct":
+            factor, T = self._reduced_factorization(self.supports)
+            U = T @ factor.solve(self._reduce_loads(F, T))
+            self.solver_info = {"method": "direct"}
+            if isinstance(factor, WoodburyFactor):
+                self.solver_info["update_rank"] = factor.rank
+        elif method == "pcg":
+            K = self.assemble_global_stiffness_sparse()
+            K_red, F_red, T, free_dofs = self.reduce_system(K, F)
+            x0_red = None if x0 is None else np.asarray(x0)[free_dofs]
+            U_red, info = pcg(K_red.tocsr(), F_red, x0_red, preconditioner, free_dofs, tol, maxiter)
+            U = T @ U_red
+            self.solver_info = {"method": "pcg", "preconditioner": preconditioner, **info}
+        else:
+            raise ValueError(f"Unknown solver method: {method}")
         return U
+
+    def solve_many(self, load_cases):
+        """
+        Solves several load cases on the same elements, springs and MPCs.
+        load_cases: list of dicts {"loads": {node_id: load_vector},
+                                   "supports": {node_id: [fixed_dofs]},
+                                   "superelement_loads": bool}
+                    "supports" defaults to the structure supports. The condensed
+                    interior loads of superelements are added unless a case sets
+                    "superelement_loads": False, as solve() does; cases that are
+                    superposed (LoadCombinations) set it so they count them once.
+        Load cases with identical supports share one factorization and are
+        back-substituted together as a load matrix.
+        Returns: list of global displacement vectors, in load case order
+        """
+        K = None
+
+        # Group load cases by their support set
+        groups = {}
+        for i, load_case in enumerate(load_cases):
+            supports = load_case.get("supports", self.supports)
+            key = self._supports_key(supports)
+            groups.setdefault(key, (supports, []))[1].append(i)
+
+        results = [None] * len(load_cases)
+        for supports, case_ids in groups.values():
+            if K is None and self.factorization_cache is None:
+                K = self.assemble_global_stiffness_sparse()
+            factor, T = self._reduced_factorization(supports, K)
+
+            F = np.column_stack([self.assemble_load_vector(load_cases[i].get("loads", {}),
+                                                           load_cases[i].get("superelement_loads", True))
+                                 for i in case_ids])
+            U = T @ factor.solve(self._reduce_loads(F, T))
+            for col, i in enumerate(case_ids):
+                results[i] = U[:, col]
+        return results
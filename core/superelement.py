@@ -0,0 +1,108 @@
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+
+def dof_rotation(rotation, n_nodes):
+    """
+    Block-diagonal (6n x 6n) DOF rotation for n nodes. Rotations are pseudo-vectors,
+    so they pick up det(R) when the placement is a mirror image.
+    """
+    R = np.asarray(rotation, dtype=float)
+    block = np.zeros((6, 6))
+    block[0:3, 0:3] = R
+    block[3:6, 3:6] = np.linalg.det(R) * R
+    return np.kron(np.eye(n_nodes), block)
+
+
+class Superelement:
+    """
+    Static (Guyan) condensation of a Structure onto its boundary nodes.
+
+    The sub-model is reduced with its own supports and MPCs, the interior
+    block is factorized once, and the condensed stiffness, condensed loads and
+    recovery matrix are kept so the same sub-assembly can be placed in a parent
+    Structure any number of times.
+    """
+
+    def __init__(self, structure, boundary_node_ids, name=None):
+        self.structure = structure
+        self.boundary_node_ids = list(boundary_node_ids)
+        self.name = name
+
+        K = structure.assemble_global_stiffness_sparse()
+        F = structure.assemble_load_vector()
+        K_red, F_red, self.T, free_dofs = structure.reduce_system(K, F)
+        K_red = sp.csr_matrix(K_red)
+
+        # Boundary slot (6 * boundary position + component) of every reduced DOF
+        position = {nid: k for k, nid in enumerate(self.boundary_node_ids)}
+        slots = np.array([6 * position.get(dof // 6, -1) + dof % 6 for dof in free_dofs], dtype=int)
+        self.b = np.flatnonzero(slots >= 0)
+        self.i = np.flatnonzero(slots < 0)
+        self.boundary_slots = slots[self.b]
+
+        missing = set(self.boundary_node_ids) - set(free_dofs[self.b] // 6)
+        if missing:
+            raise ValueError(f"Boundary nodes {sorted(missing)} have no free independent DOFs")
+
+        K_bb = K_red[self.b][:, self.b].toarray()
+        K_bi = K_red[self.b][:, self.i]
+        K_ib = K_red[self.i][:, self.b].toarray()
+
+        self.interior_factor = spla.splu(K_red[self.i][:, self.i].tocsc()) if len(self.i) else None
+        if self.interior_factor is not None:
+            self.recovery = -self.interior_factor.solve(K_ib)           # u_i = recovery @ u_b + u_i0
+            self.u_i0 = self.interior_factor.solve(F_red[self.i])
+        else:
+            self.recovery = np.zeros((0, len(self.b)))
+            self.u_i0 = np.zeros(0)
+
+        n = 6 * len(self.boundary_node_ids)
+        self.K_condensed = np.zeros((n, n))
+        self.F_condensed = np.zeros(n)
+        self.K_condensed[np.ix_(self.boundary_slots, self.boundary_slots)] = K_bb + K_bi @ self.recovery
+        self.F_condensed[self.boundary_slots] = F_red[self.b] - K_bi @ self.u_i0
+
+    def recover(self, u_boundary):
+        """
+        Sub-model displacements from the boundary displacements.
+        u_boundary: (6 * n_boundary,) vector in the sub-model frame
+        Returns: global displacement vector of the sub-model Structure, usable
+                 with calculate_stress(superelement.structure, U_sub)
+        """
+        u_b = np.asarray(u_boundary)[self.boundary_slots]
+        x = np.zeros(self.T.shape[1])
+        x[self.b] = u_b
+        x[self.i] = self.recovery @ u_b + self.u_i0
+        return self.T @ x
+
+
+class SuperelementInstance:
+    """
+    Placement of a Superelement in a parent Structure.
+    nodes: parent nodes matched to the superelement boundary nodes, in order
+    rotation: 3x3 matrix from sub-model axes to parent axes (None for identity)
+    """
+
+    def __init__(self, superelement, nodes, rotation=None):
+        if len(nodes) != len(superelement.boundary_node_ids):
+            raise ValueError("One parent node is required per superelement boundary node")
+        self.superelement = superelement
+        self.nodes = list(nodes)
+        self.rotation = np.eye(3) if rotation is None else np.asarray(rotation, dtype=float)
+
+        L = dof_rotation(self.rotation, len(self.nodes))
+        self._L = L
+        self.k_global = L @ superelement.K_condensed @ L.T
+        self.f_global = L @ superelement.F_condensed
+
+    def get_dof_indices(self):
+        return [dof for node in self.nodes for dof in node.dofs]
+
+    def recover(self, U):
+        """
+        Sub-model global displacement vector from the parent solution U.
+        """
+        u_boundary = self._L.T @ np.asarray(U)[self.get_dof_indices()]
+        return self.superelement.recover(u_boundary)
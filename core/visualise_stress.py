@@ -3,48 +3,43 @@ import numpy as np
 from mpl_toolkits.mplot3d.art3d import Line3DCollection
 import matplotlib.cm as cm
 import matplotlib.colors as colors
+from core.beam import STRESS_COMPONENTS
 
-def plot_stress_distribution(structure, U, stress_component='axial', scale=1.0, filename="stress.png"):
+def plot_stress_distribution(structure, U, stress_component='axial', scale=1.0, filename="stress.png", results=None):
     """
     Visualizes stress distribution on the structure elements using color mapping,
     with Y as the vertical axis instead of Z.
+    results: optional LoadCaseResults of U, reused instead of recomputing stresses
     """
 
-    # Collect lines and stress magnitudes for coloring
-    lines = []
-    stress_vals = []
+    results = results.element_results if results is not None else structure.recover_element_results(U)
+    if stress_component in STRESS_COMPONENTS:
+        stress_vals = np.abs(results[stress_component][:, 0])
+    else:
+        stress_vals = np.zeros(len(results))
 
-    for element in structure.elements:
-        i, j = element.node1.id, element.node2.id
+    return draw_stress_distribution(structure.node_coordinates(), structure.beam_connectivity(), U,
+                                    stress_vals, stress_component, scale, filename)
 
-        u_i = U[6*i:6*i+3]
-        u_j = U[6*j:6*j+3]
 
-        p1 = structure.nodes[i].coords + scale * u_i
-        p2 = structure.nodes[j].coords + scale * u_j
-
-        # Swap Y and Z: [X, Z, Y]
-        p1_swapped = np.array([p1[0], p1[2], p1[1]])
-        p2_swapped = np.array([p2[0], p2[2], p2[1]])
-
-        lines.append([p1_swapped, p2_swapped])
-
-        f_local = element.compute_internal_forces(U, i, j)
-
-        c_y = element.h / 2
-        c_z = element.b / 2
-        c_t = c_y
-
-        stresses = element.compute_stresses(f_local, c_y, c_z, c_t)
+def draw_stress_distribution(coords, connectivity, U, stress_vals, stress_component='axial', scale=1.0,
+                             filename="stress.png"):
+    """
+    Array version of plot_stress_distribution.
+    coords: (N, 3) node coordinates, connectivity: (E, 2) beam node ids
+    stress_vals: (E,) values used for the coloring
+    Returns: the saved file name
+    """
+    coords = np.asarray(coords, dtype=float)
+    connectivity = np.asarray(connectivity, dtype=int).reshape(-1, 2)
+    stress_vals = np.asarray(stress_vals, dtype=float)
 
-        if stress_component in stresses:
-            stress_vals.append(abs(stresses[stress_component]))
-        else:
-            stress_vals.append(abs(stresses.get('axial', 0)))
+    # Deformed beam segments, Y and Z swapped: [X, Z, Y]
+    deformed = coords + scale * np.asarray(U, dtype=float).reshape(-1, 6)[:, :3]
+    lines = deformed[connectivity][:, :, [0, 2, 1]]
 
-    stress_vals = np.array(stress_vals)
     norm = colors.Normalize(vmin=stress_vals.min(), vmax=stress_vals.max())
-    cmap = cm.get_cmap('jet')
+    cmap = plt.get_cmap('jet')
     colors_mapped = cmap(norm(stress_vals))
 
     fig = plt.figure()
@@ -54,7 +49,7 @@ def plot_stress_distribution(structure, U, stress_component='axial', scale=1.0,
     ax.add_collection3d(lc)
 
     # Plot undeformed nodes (swapped Y/Z)
-    node_coords = np.array([node.coords for node in structure.nodes])
+    node_coords = coords
     node_coords_swapped = node_coords[:, [0, 2, 1]]
     ax.scatter(node_coords_swapped[:, 0], node_coords_swapped[:, 1], node_coords_swapped[:, 2],
                color='k', s=10)
@@ -78,4 +73,5 @@ def plot_stress_distribution(structure, U, stress_component='axial', scale=1.0,
 
     plt.tight_layout()
     plt.savefig(f"{stress_component}_{filename}")
-    plt.close()
\ No newline at end of file
+    plt.close()
+    return f"{stress_component}_{filename}"
\ No newline at end of file
@@ -1,43 +1,134 @@
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 import numpy as np
 
+
+def _node_pairs(pairs):
+    return np.array(pairs, dtype=int).reshape(-1, 2)
+
+
+def structure_plot_data(structure, displacements=None, show_internal_forces=False, results=None):
+    """
+    Plain arrays of everything visualize_structure draws, so the figure can be
+    rendered (e.g. in another process) without the Structure object.
+    """
+    data = {
+        "coords": np.array(structure.node_coordinates(), dtype=float),
+        "beams": np.array(structure.beam_connectivity(), dtype=int).reshape(-1, 2),
+        "springs": _node_pairs([(s.node1.id, s.node2.id) for s in structure.spring_elements]),
+        "rbe2": _node_pairs([(rbe2.master_node.id, slave.id) for rbe2 in structure.rbe2_elements
+                             for slave in rbe2.slave_nodes]),
+        "rbe2_masters": np.array([rbe2.master_node.id for rbe2 in structure.rbe2_elements], dtype=int),
+        "rbe3": _node_pairs([(rbe3.master_node.id, slave.id) for rbe3 in structure.rbe3_elements
+                             for slave in rbe3.slave_nodes]),
+        "rigid": _node_pairs([(rigid.node1.id, rigid.node2.id) for rigid in structure.rigid_elements]),
+        "load_nodes": np.array(list(structure.loads.keys()), dtype=int),
+        "load_vectors": np.array([np.asarray(load, dtype=float)[0:3] for load in structure.loads.values()]).reshape(-1, 3),
+        "support_nodes": np.array(list(structure.supports.keys()), dtype=int),
+        "displacements": None,
+        "axial_forces": None,
+    }
+    if displacements is not None:
+        data["displacements"] = np.asarray(displacements, dtype=float).reshape(-1, 6)
+        if show_internal_forces:
+            forces = results.element_forces if results is not None else structure.element_internal_forces(displacements)
+            data["axial_forces"] = np.asarray(forces)[:, 0]
+    return data
+
+
 def visualize_structure(structure, displacements=None, show_forces=True, show_supports=True,
-                        show_internal_forces=False, scale=1.0, name = None):
+                        show_internal_forces=False, scale=1.0, name = None, results=None, batched=False):
+    """
+    batched: draw each element category as one line collection instead of
+             one artist per element (use for large frames)
+    """
+    data = structure_plot_data(structure, displacements, show_internal_forces, results)
+    return draw_structure(data, show_forces, show_supports, show_internal_forces, scale, name, batched)
+
+
+def draw_structure(data, show_forces=True, show_supports=True, show_internal_forces=False, scale=1.0, name=None,
+                   batched=False):
+    """
+    Draws the output of structure_plot_data and saves it as
+    displacement_visualisation_{name}.png.
+    Returns: the saved file name
+    """
+    coords = data["coords"]
+
     fig = plt.figure()
     ax = fig.add_subplot(111, projection='3d')
 
-    # --- Beam elements ---
-    for elem in structure.elements:
-        if elem in structure.spring_elements:
-            continue  # skip springs here, handled separately
+    if batched:
+        _draw_batched(ax, data, show_forces, show_supports, show_internal_forces, scale)
+    else:
+        _draw_items(ax, data, show_forces, show_supports, show_internal_forces, scale)
+
+    ax.set_xlabel("X")
+    ax.set_ylabel("Z")  # original Z is horizontal now
+    ax.set_zlabel("Y")  # vertical axis is Y
+
+    ax.set_title("Structure Visualization (Y vertical)")
+
+    ax.view_init(elev=20, azim=135)
+
+    # Equal aspect ratio
+    # Get all plotted coordinates
+    all_x = coords[:, 0]
+    all_y = coords[:, 2]  # original Z
+    all_z = coords[:, 1]  # original Y
+
+    x_middle = np.mean([min(all_x), max(all_x)])
+    y_middle = np.mean([min(all_y), max(all_y)])
+    z_middle = np.mean([min(all_z), max(all_z)])
+
+    x_range = max(all_x) - min(all_x)
+    y_range = max(all_y) - min(all_y)
+    z_range = max(all_z) - min(all_z)
+
+    plot_radius = 0.5 * max(x_range, y_range, z_range)
+
+    ax.set_xlim3d([x_middle - plot_radius, x_middle + plot_radius])
+    ax.set_ylim3d([y_middle - plot_radius, y_middle + plot_radius])
+    ax.set_zlim3d([z_middle - plot_radius, z_middle + plot_radius])
+
+    plt.tight_layout()
+    plt.savefig('{0}_{1}.png'.format("displacement_visualisation",  name))
+    plt.close()
+    return '{0}_{1}.png'.format("displacement_visualisation",  name)
+
 
-        n1 = elem.node1
-        n2 = elem.node2
+def _draw_items(ax, data, show_forces, show_supports, show_internal_forces, scale):
+    coords = data["coords"]
+    displacements = data["displacements"]
+
+    # --- Beam elements ---
+    for k, (i, j) in enumerate(data["beams"]):
+        c1, c2 = coords[i], coords[j]
 
         # Swap Y and Z
-        x = [n1.coords[0], n2.coords[0]]
-        y = [n1.coords[2], n2.coords[2]]  # original Z
-        z = [n1.coords[1], n2.coords[1]]  # original Y
+        x = [c1[0], c2[0]]
+        y = [c1[2], c2[2]]  # original Z
+        z = [c1[1], c2[1]]  # original Y
 
         ax.plot(x, y, z, color='black', linewidth=1)
 
         if displacements is not None:
-            u1 = displacements[n1.dofs]
-            u2 = displacements[n2.dofs]
+            u1 = displacements[i]
+            u2 = displacements[j]
 
-            xd = [n1.coords[0] + scale * u1[0], n2.coords[0] + scale * u2[0]]
-            yd = [n1.coords[2] + scale * u1[2], n2.coords[2] + scale * u2[2]]  # original Z
-            zd = [n1.coords[1] + scale * u1[1], n2.coords[1] + scale * u2[1]]  # original Y
+            xd = [c1[0] + scale * u1[0], c2[0] + scale * u2[0]]
+            yd = [c1[2] + scale * u1[2], c2[2] + scale * u2[2]]  # original Z
+            zd = [c1[1] + scale * u1[1], c2[1] + scale * u2[1]]  # original Y
 
             ax.plot(xd, yd, zd, color='cyan', linestyle='--')
 
             if show_internal_forces:
-                f_local = elem.compute_internal_forces(displacements, n1.id, n2.id)
-                axial_force = f_local[0]
-                fx = axial_force * elem.direction_cosines[0]
-                fy = axial_force * elem.direction_cosines[2]  # original Z
-                fz = axial_force * elem.direction_cosines[1]  # original Y
+                direction_cosines = (c2 - c1) / np.linalg.norm(c2 - c1)
+                axial_force = data["axial_forces"][k]
+                fx = axial_force * direction_cosines[0]
+                fy = axial_force * direction_cosines[2]  # original Z
+                fz = axial_force * direction_cosines[1]  # original Y
 
                 midpoint = np.array([
                     (xd[0] + xd[1]) / 2,
@@ -49,113 +140,160 @@ def visualize_structure(structure, displacements=None, show_forces=True, show_su
                           color='yellow', length=0.1, normalize=True)
 
     # --- Spring elements ---
-    for spring in structure.spring_elements:
-        n1 = spring.node1
-        n2 = spring.node2
+    for i, j in data["springs"]:
+        c1, c2 = coords[i], coords[j]
 
-        x = [n1.coords[0], n2.coords[0]]
-        y = [n1.coords[2], n2.coords[2]]  # original Z
-        z = [n1.coords[1], n2.coords[1]]  # original Y
+        x = [c1[0], c2[0]]
+        y = [c1[2], c2[2]]  # original Z
+        z = [c1[1], c2[1]]  # original Y
 
         ax.plot(x, y, z, color='magenta', linestyle='--', linewidth=1)
 
         if displacements is not None:
-            u1 = displacements[n1.dofs]
-            u2 = displacements[n2.dofs]
+            u1 = displacements[i]
+            u2 = displacements[j]
 
-            xd = [n1.coords[0] + scale * u1[0], n2.coords[0] + scale * u2[0]]
-            yd = [n1.coords[2] + scale * u1[2], n2.coords[2] + scale * u2[2]]  # original Z
-            zd = [n1.coords[1] + scale * u1[1], n2.coords[1] + scale * u2[1]]  # original Y
+            xd = [c1[0] + scale * u1[0], c2[0] + scale * u2[0]]
+            yd = [c1[2] + scale * u1[2], c2[2] + scale * u2[2]]  # original Z
+            zd = [c1[1] + scale * u1[1], c2[1] + scale * u2[1]]  # original Y
 
             ax.plot(xd, yd, zd, color='magenta', linestyle=':', linewidth=1)
 
     # --- RBE2 elements ---
-    for rbe2 in structure.rbe2_elements:
-        master = rbe2.master_node
+    for m in data["rbe2_masters"]:
+        master = coords[m]
 
         # Plot master node
-        ax.scatter(master.coords[0], master.coords[2], master.coords[1],
+        ax.scatter(master[0], master[2], master[1],
                 color='green', s=80, marker='o', label='RBE2 Master')
 
-        for slave in rbe2.slave_nodes:
-            # Plot slave node
-            ax.scatter(slave.coords[0], slave.coords[2], slave.coords[1],
-                    color='yellow', s=40, marker='^', label='RBE2 Slave')
+    for m, s in data["rbe2"]:
+        master, slave = coords[m], coords[s]
 
-            # Line between master and slave
-            x = [master.coords[0], slave.coords[0]]
-            y = [master.coords[2], slave.coords[2]]
-            z = [master.coords[1], slave.coords[1]]
-            ax.plot(x, y, z, color='green', linestyle='-', linewidth=1)
+        # Plot slave node
+        ax.scatter(slave[0], slave[2], slave[1],
+                color='yellow', s=40, marker='^', label='RBE2 Slave')
+
+        # Line between master and slave
+        x = [master[0], slave[0]]
+        y = [master[2], slave[2]]
+        z = [master[1], slave[1]]
+        ax.plot(x, y, z, color='green', linestyle='-', linewidth=1)
 
     # --- RBE3 elements ---
-    for rbe3 in structure.rbe3_elements:
-        master = rbe3.master_node
-        for slave in rbe3.slave_nodes:
-            x = [master.coords[0], slave.coords[0]]
-            y = [master.coords[2], slave.coords[2]]
-            z = [master.coords[1], slave.coords[1]]
-            ax.plot(x, y, z, color='orange', linestyle='--', linewidth=1)
+    for m, s in data["rbe3"]:
+        master, slave = coords[m], coords[s]
+        x = [master[0], slave[0]]
+        y = [master[2], slave[2]]
+        z = [master[1], slave[1]]
+        ax.plot(x, y, z, color='orange', linestyle='--', linewidth=1)
 
     # --- Rigid elements ---
-    for rigid in structure.rigid_elements:
-        n1 = rigid.node1
-        n2 = rigid.node2
-        x = [n1.coords[0], n2.coords[0]]
-        y = [n1.coords[2], n2.coords[2]]
-        z = [n1.coords[1], n2.coords[1]]
+    for i, j in data["rigid"]:
+        c1, c2 = coords[i], coords[j]
+        x = [c1[0], c2[0]]
+        y = [c1[2], c2[2]]
+        z = [c1[1], c2[1]]
         ax.plot(x, y, z, color='purple', linestyle='-.', linewidth=1)
 
 
     # --- Loads ---
     if show_forces:
-        for nid, load in structure.loads.items():
-            node = structure.nodes[nid]
+        for nid, load in zip(data["load_nodes"], data["load_vectors"]):
+            node = coords[nid]
             fx, fy, fz = load[0:3]
 
             fy_swapped = fz  # original Z
             fz_swapped = fy  # original Y
 
             if fx != 0 or fy != 0 or fz != 0:
-                ax.quiver(node.coords[0], node.coords[2], node.coords[1],  # coords swapped
+                ax.quiver(node[0], node[2], node[1],  # coords swapped
                           fx, fy_swapped, fz_swapped,
                           color='blue', length=10, normalize=True)
 
     # --- Supports ---
     if show_supports:
-        for nid, fixed_dofs in structure.supports.items():
-            node = structure.nodes[nid]
-            ax.scatter(node.coords[0], node.coords[2], node.coords[1],
+        for nid in data["support_nodes"]:
+            node = coords[nid]
+            ax.scatter(node[0], node[2], node[1],
                        color='red', s=50, marker='s')
 
-    ax.set_xlabel("X")
-    ax.set_ylabel("Z")  # original Z is horizontal now
-    ax.set_zlabel("Y")  # vertical axis is Y
-
-    ax.set_title("Structure Visualization (Y vertical)")
-
-    ax.view_init(elev=20, azim=135)
-
-    # Equal aspect ratio
-    # Get all plotted coordinates
-    all_x = [node.coords[0] for node in structure.nodes]
-    all_y = [node.coords[2] for node in structure.nodes]  # original Z
-    all_z = [node.coords[1] for node in structure.nodes]  # original Y
-
-    x_middle = np.mean([min(all_x), max(all_x)])
-    y_middle = np.mean([min(all_y), max(all_y)])
-    z_middle = np.mean([min(all_z), max(all_z)])
 
-    x_range = max(all_x) - min(all_x)
-    y_range = max(all_y) - min(all_y)
-    z_range = max(all_z) - min(all_z)
+def _swapped(points):
+    """
+    [X, Y, Z] -> [X, Z, Y] along the last axis (Y vertical in the plots).
+    """
+    return points[..., [0, 2, 1]]
+
+
+def _add_lines(ax, points, pairs, **kwargs):
+    """
+    Adds the (node1, node2) segments as one NaN-separated polyline, so
+    matplotlib projects and strokes a single path instead of one per segment.
+    """
+    if len(pairs):
+        segments = _swapped(points[pairs])
+        breaks = np.full((len(segments), 1, 3), np.nan)
+        polyline = np.concatenate([segments, breaks], axis=1).reshape(-1, 3)[:-1]
+        ax.add_collection3d(Line3DCollection([polyline], **kwargs))
+
+
+def _draw_batched(ax, data, show_forces, show_supports, show_internal_forces, scale):
+    """
+    Same figure as _draw_items with one artist per category: a line
+    collection for the undeformed/deformed beams, springs, RBE2, RBE3 and
+    rigid links and one scatter/quiver per marker type.
+    """
+    coords = data["coords"]
+    displacements = data["displacements"]
+    beams = data["beams"]
+    springs = data["springs"]
+
+    # --- Beam and spring elements ---
+    _add_lines(ax, coords, beams, colors='black', linewidths=1)
+    _add_lines(ax, coords, springs, colors='magenta', linestyles='--', linewidths=1)
+
+    if displacements is not None:
+        deformed = coords + scale * displacements[:, :3]
+        _add_lines(ax, deformed, beams, colors='cyan', linestyles='--')
+        _add_lines(ax, deformed, springs, colors='magenta', linestyles=':', linewidths=1)
+
+        if show_internal_forces and len(beams):
+            axis = coords[beams[:, 1]] - coords[beams[:, 0]]
+            direction_cosines = axis / np.linalg.norm(axis, axis=1)[:, None]
+            forces = _swapped(data["axial_forces"][:, None] * direction_cosines)
+            midpoints = _swapped(deformed[beams].mean(axis=1))
+            ax.quiver(midpoints[:, 0], midpoints[:, 1], midpoints[:, 2],
+                      forces[:, 0], forces[:, 1], forces[:, 2],
+                      color='yellow', length=0.1, normalize=True)
 
-    plot_radius = 0.5 * max(x_range, y_range, z_range)
+    # --- RBE2 elements ---
+    if len(data["rbe2_masters"]):
+        masters = _swapped(coords[data["rbe2_masters"]])
+        ax.scatter(masters[:, 0], masters[:, 1], masters[:, 2],
+                   color='green', s=80, marker='o', label='RBE2 Master')
+    if len(data["rbe2"]):
+        slaves = _swapped(coords[data["rbe2"][:, 1]])
+        ax.scatter(slaves[:, 0], slaves[:, 1], slaves[:, 2],
+                   color='yellow', s=40, marker='^', label='RBE2 Slave')
+    _add_lines(ax, coords, data["rbe2"], colors='green', linestyles='-', linewidths=1)
+
+    # --- RBE3 and rigid elements ---
+    _add_lines(ax, coords, data["rbe3"], colors='orange', linestyles='--', linewidths=1)
+    _add_lines(ax, coords, data["rigid"], colors='purple', linestyles='-.', linewidths=1)
 
-    ax.set_xlim3d([x_middle - plot_radius, x_middle + plot_radius])
-    ax.set_ylim3d([y_middle - plot_radius, y_middle + plot_radius])
-    ax.set_zlim3d([z_middle - plot_radius, z_middle + plot_radius])
+    # --- Loads ---
+    if show_forces:
+        loaded = np.any(data["load_vectors"] != 0, axis=1)
+        if loaded.any():
+            nodes = _swapped(coords[data["load_nodes"][loaded]])
+            loads = _swapped(data["load_vectors"][loaded])
+            ax.quiver(nodes[:, 0], nodes[:, 1], nodes[:, 2],
+                      loads[:, 0], loads[:, 1], loads[:, 2],
+                      color='blue', length=10, normalize=True)
 
-    plt.tight_layout()
-    plt.savefig('{0}_{1}.png'.format("displacement_visualisation",  name))
-    plt.close()
\ No newline at end of file
+    # --- Supports ---
+    if show_supports and len(data["support_nodes"]):
+        supports = _swapped(coords[data["support_nodes"]])
+        ax.scatter(supports[:, 0], supports[:, 1], supports[:, 2],
+                   color='red', s=50, marker='s')
@@ -42,7 +42,7 @@ s.add_load(n3.id, [1000, 0, 0, 0, 0, 0])  # Fx = 100 N
 # Solve
 U = s.solve()
 
-visualize_structure(s, U)
+visualize_structure(s, U, name = "rigidTest")
 
 # --------------------------
 # Print nodal displacements
@@ -45,7 +45,7 @@ s.add_load(n3.id, [100, 0, 0, 0, 0, 0])  # Fx = 1000 N
 # Solve
 U = s.solve()
 
-visualize_structure(s, U)
+visualize_structure(s, U, name = "springTest")
 
 # --------------------------
 # Print nodal displacements
@@ -0,0 +1,35 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from core.structure import Structure
+from core.beamProperties import BeamProperties
+from core.animate_deformation import animate_deformation, deformation_segments, N_FRAMES
+
+class TestAnimateDeformation(unittest.TestCase):
+
+    def setUp(self):
+        self.structure = Structure()
+        beamProp = BeamProperties(210e3, 81.2e3, 475, 1.7e5, 1.7e5, 50, 50, name="frame")
+        self.structure.add_nodes([(0, 0, 0), (500, 0, 0), (1000, 0, 0)])
+        self.structure.add_beams([(0, 1), (1, 2)], beamProp)
+        self.structure.add_support(0, [0, 1, 2, 3, 4, 5])
+        self.structure.add_load(2, [0, -1000, 0, 0, 0, 0])
+        self.U = self.structure.solve()
+
+    def test_segments(self):
+        original, translations = deformation_segments(self.structure, self.U)
+        self.assertEqual(original.shape, (2, 2, 3))
+        np.testing.assert_allclose(original[1], [[500, 0, 0], [1000, 0, 0]])
+        np.testing.assert_allclose(translations[1, 1], self.U[12:15])
+
+    def test_parallel_frames(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            frames = animate_deformation(self.structure, self.U, scale=10, save_path=None,
+                                         frames_dir=tmpdir, max_workers=2)
+            self.assertEqual(len(frames), N_FRAMES)
+            self.assertEqual(os.path.basename(frames[-1]), "frame_{0:04d}.png".format(N_FRAMES - 1))
+            self.assertTrue(all(os.path.getsize(f) > 0 for f in frames))
+
+if __name__ == '__main__':
+    unittest.main()
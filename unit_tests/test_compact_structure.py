@@ -0,0 +1,89 @@
+import unittest
+import numpy as np
+from core.structure import Structure
+from core.compact_structure import CompactStructure
+from core.beamProperties import BeamProperties
+from core.beam import BeamElement3D
+
+class TestCompactStructure(unittest.TestCase):
+
+    def build(self, structure_type):
+        s = structure_type()
+        legs = BeamProperties(210e3, 81.2e3, 2500, 520833.3, 520833.3, 50, 50, name="legs")
+        ties = BeamProperties(210e3, 81.2e3, 1600, 213333.3, 213333.3, 40, 40, name="ties")
+
+        coords = [(0, 0, 0), (1000, 0, 0), (0, 0, 800), (1000, 0, 800),
+                  (0, 1200, 0), (1000, 1200, 0), (0, 1200, 800), (1000, 1200, 800)]
+        nodes = [s.add_node(*c) for c in coords]
+        for i in range(4):
+            s.add_beam(nodes[i], nodes[i + 4], legs)
+        for i, j in [(4, 5), (6, 7), (4, 6), (5, 7), (4, 7)]:
+            s.add_beam(nodes[i], nodes[j], ties)
+        s.add_spring(nodes[5], nodes[6], [0, 0, 50, 0, 0, 0])
+        s.add_rbe2(nodes[7], [s.add_node(1000, 1400, 800)])
+
+        for nid in range(4):
+            s.add_support(nid, [0, 1, 2, 3, 4, 5])
+        s.add_load(8, [300, -1000, 200, 0, 0, 0])
+        return s
+
+    def test_matches_object_storage(self):
+        reference = self.build(Structure)
+        compact = self.build(CompactStructure)
+
+        self.assertEqual(compact.coords.shape, (9, 3))
+        self.assertEqual(compact.connectivity.shape, (9, 2))
+        self.assertEqual(len(compact.sections), 2)
+        np.testing.assert_allclose(compact.assemble_global_stiffness(), reference.assemble_global_stiffness())
+        np.testing.assert_allclose(compact.solve(), reference.solve(), rtol=1e-10, atol=1e-14)
+
+    def test_views(self):
+        compact = self.build(CompactStructure)
+        node = compact.getNodeById(3)
+        np.testing.assert_array_equal(node.coords, [1000, 0, 800])
+        self.assertEqual(node.dofs, list(range(18, 24)))
+        self.assertEqual(compact.nodes[-1], compact.getNodeById(8))
+
+        beam = compact.elements[8]
+        self.assertEqual(beam.name, "ties")
+        element = BeamElement3D(beam.node1, beam.node2, beam.section)
+        self.assertAlmostEqual(beam.length, element.length)
+        np.testing.assert_allclose(beam.k_global, element.k_global)
+
+        U = compact.solve()
+        np.testing.assert_allclose(beam.compute_internal_forces(U, beam.node1.id, beam.node2.id),
+                                   element.compute_internal_forces(U, beam.node1.id, beam.node2.id))
+
+    def test_bulk_api(self):
+        reference = self.build(Structure)
+        legs = BeamProperties(210e3, 81.2e3, 2500, 520833.3, 520833.3, 50, 50, name="legs")
+        ties = BeamProperties(210e3, 81.2e3, 1600, 213333.3, 213333.3, 40, 40, name="ties")
+        coords = [n.coords for n in reference.nodes]
+        connectivity = [(e.node1.id, e.node2.id) for e in reference.elements]
+        section_ids = [0] * 4 + [1] * 5
+
+        for structure_type in (Structure, CompactStructure):
+            s = structure_type()
+            ids = s.add_nodes(coords)
+            np.testing.assert_array_equal(ids, np.arange(9))
+            s.add_beams(connectivity, [legs, ties], section_ids)
+            s.add_springs([(5, 6)], [0, 0, 50, 0, 0, 0])
+            s.add_rbe2(s.getNodeById(7), [s.getNodeById(8)])
+            s.add_supports(range(4), [0, 1, 2, 3, 4, 5])
+            s.add_load(8, [300, -1000, 200, 0, 0, 0])
+
+            self.assertEqual(len(s.elements), 9)
+            self.assertEqual(s.elements[8].name, "ties")
+            np.testing.assert_allclose(s.solve(), reference.solve(), rtol=1e-10, atol=1e-14)
+
+            # Rejected before any row is added
+            with self.assertRaises(ValueError):
+                s.add_beams([(0, 1), (0, 99)], legs)
+            with self.assertRaises(ValueError):
+                s.add_beams([(0, 1), (1, 2)], [legs, ties], [0, 2])
+            with self.assertRaises(ValueError):
+                s.add_springs([(0, 1), (1, -1)], [0, 0, 50, 0, 0, 0])
+            self.assertEqual((len(s.elements), len(s.spring_elements)), (9, 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+import scipy.sparse as sp
+from core.dof_manager import DofManager
+
+class TestDofManager(unittest.TestCase):
+
+    def test_masks_and_index_maps(self):
+        dofs = DofManager([0, 1, 2], {0: [0, 1, 2, 3, 4, 5], 2: [1]}, dependent_dofs=[8, 9])
+
+        self.assertEqual(dofs.ndof, 18)
+        np.testing.assert_array_equal(dofs.constrained_dofs, [0, 1, 2, 3, 4, 5, 13])
+        np.testing.assert_array_equal(dofs.dependent_dofs, [8, 9])
+        np.testing.assert_array_equal(dofs.free_dofs, [6, 7, 10, 11, 12, 14, 15, 16, 17])
+        self.assertEqual(dofs.free_dofs.dtype, np.int32)
+        self.assertEqual(dofs.reduced_index[10], 2)
+        self.assertEqual(dofs.reduced_index[13], -1)
+
+    def test_scatter_gather(self):
+        dofs = DofManager([0, 1], {0: [0, 1, 2, 3, 4, 5]})
+        U = np.arange(12.0)
+        np.testing.assert_array_equal(dofs.gather(U), U[6:])
+        np.testing.assert_array_equal(dofs.scatter(dofs.gather(U)), np.r_[np.zeros(6), U[6:]])
+        np.testing.assert_array_equal(dofs.selection_matrix() @ dofs.gather(U), dofs.scatter(U[6:]))
+
+        cases = np.arange(24.0).reshape(12, 2)
+        self.assertEqual(dofs.scatter(dofs.gather(cases)).shape, (12, 2))
+
+    def test_reduce(self):
+        dofs = DofManager([0, 1], {1: [2, 5]})
+        K = np.random.default_rng(0).random((12, 12))
+        np.testing.assert_array_equal(dofs.reduce(K), K[np.ix_(dofs.free_dofs, dofs.free_dofs)])
+        np.testing.assert_array_equal(dofs.reduce(sp.csr_matrix(K)).toarray(), dofs.reduce(K))
+
+    def test_non_contiguous_node_ids(self):
+        dofs = DofManager([10, 3, 42], {42: [0], 3: [5]})
+        np.testing.assert_array_equal(dofs.dofs([3, 42], [5, 0]), [11, 12])
+        np.testing.assert_array_equal(dofs.dofs([10]), [[0, 1, 2, 3, 4, 5]])
+        np.testing.assert_array_equal(dofs.constrained_dofs, [11, 12])
+        with self.assertRaises(KeyError):
+            dofs.dofs([7])
+
+    def test_support_on_dependent_dof(self):
+        with self.assertRaises(ValueError):
+            DofManager([0, 1], {1: [0]}, dependent_dofs=[6, 7])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import base64
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+from core.structure import Structure
+from core.beamProperties import BeamProperties
+from core.results import LoadCaseResults
+from core.export_html import viewer_data, write_html_viewer
+
+def unpack(b64, dtype):
+    return np.frombuffer(base64.b64decode(b64), dtype)
+
+class TestExportHTML(unittest.TestCase):
+
+    def setUp(self):
+        structure = Structure()
+        beamProp = BeamProperties(210e3, 81.2e3, 475, 1.7e5, 1.7e5, 50, 50, name="frame")
+        structure.add_nodes([(0, 0, 0), (500, 0, 0), (500, 0, 500)])
+        structure.add_beams([(0, 1), (1, 2)], beamProp)
+        structure.add_support(0, [0, 1, 2, 3, 4, 5])
+        structure.add_load(2, [0, -1000, 0, 0, 0, 0])
+        self.bending = LoadCaseResults(structure, structure.solve(), "bending")
+        structure.loads.clear()
+        structure.add_load(2, [1000, 0, 0, 0, 0, 0])
+        self.axial = LoadCaseResults(structure, structure.solve(), "axial")
+
+    def test_payload(self):
+        data = viewer_data([self.bending, self.axial], scale=5)
+        # Y/Z swapped as in visualize_structure
+        np.testing.assert_allclose(unpack(data["nodes"], '<f4').reshape(-1, 3)[2], [500, 500, 0])
+        self.assertEqual(unpack(data["beams"], '<u4').tolist(), [0, 1, 1, 2])
+        self.assertEqual([c["name"] for c in data["cases"]], ["bending", "axial"])
+        U = unpack(data["cases"][0]["U"], '<f4').reshape(-1, 3)
+        np.testing.assert_allclose(U[:, 2], self.bending.nodal_displacements[:, 1], rtol=1e-6)
+        von_mises = data["cases"][1]["stress"]["von_mises"]
+        np.testing.assert_allclose(unpack(von_mises["values"], '<f4'), np.abs(self.axial.stress("von_mises")), rtol=1e-6)
+        self.assertAlmostEqual(von_mises["max"], np.abs(self.axial.stress("von_mises")).max())
+        # Same color range as draw_stress_distribution: the smallest magnitude, not 0
+        self.assertGreater(von_mises["min"], 0)
+        self.assertAlmostEqual(von_mises["min"], np.abs(self.axial.stress("von_mises")).min())
+
+    def test_single_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = write_html_viewer(os.path.join(tmpdir, "viewer.html"), [self.bending])
+            with open(path) as f:
+                html = f.read()
+        self.assertNotIn("__DATA__", html)
+        self.assertNotIn("src=", html)  # no external scripts
+        payload = html.split("const DATA = ", 1)[1].split(";\n", 1)[0]
+        self.assertEqual(json.loads(payload)["cases"][0]["name"], "bending")
+
+if __name__ == '__main__':
+    unittest.main()
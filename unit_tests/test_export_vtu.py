@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+import numpy as np
+from core.structure import Structure
+from core.beamProperties import BeamProperties
+from core.results import LoadCaseResults
+from core.export_vtu import write_vtu_series
+
+_DTYPES = {"Float64": '<f8', "Int64": '<i8', "Int32": '<i4', "UInt8": 'u1'}
+
+def read_vtu(path):
+    """
+    Minimal reader for raw appended VTU files: {array name: values}.
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    start = content.index(b'<AppendedData encoding="raw">')
+    header = ET.fromstring(content[:start] + b'</VTKFile>')
+    raw = content[content.index(b'_', start) + 1:]
+    arrays = {}
+    for element in header.iter("DataArray"):
+        offset = int(element.get("offset"))
+        nbytes = int(np.frombuffer(raw[offset:offset + 8], '<u8')[0])
+        if element.get("type") == "String":
+            arrays[element.get("Name")] = raw[offset + 8:offset + 8 + nbytes].decode().split("\0")[:-1]
+            continue
+        values = np.frombuffer(raw[offset + 8:offset + 8 + nbytes], _DTYPES[element.get("type")])
+        arrays[element.get("Name")] = values.reshape(-1, int(element.get("NumberOfComponents")))
+    return header, arrays
+
+class TestExportVTU(unittest.TestCase):
+
+    def test_series(self):
+        structure = Structure()
+        fork = BeamProperties(210e3, 81.2e3, 475, 1.7e5, 1.7e5, 50, 50, name="fork")
+        frame = BeamProperties(210e3, 81.2e3, 475, 1.7e5, 1.7e5, 50, 50, name="frame")
+        structure.add_nodes([(0, 0, 0), (500, 0, 0), (1000, 0, 0)])
+        structure.add_beams([(0, 1)], frame)
+        structure.add_beams([(1, 2)], fork)
+        structure.add_support(0, [0, 1, 2, 3, 4, 5])
+        structure.add_load(2, [0, -1000, 0, 0, 0, 0])
+        bending = LoadCaseResults(structure, structure.solve(), "bending")
+        structure.loads.clear()
+        structure.add_load(2, [0, 0, 0, 1e5, 0, 0])
+        torsion = LoadCaseResults(structure, structure.solve(), "torsion")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = write_vtu_series(os.path.join(tmpdir, "run.pvd"), [bending, torsion])
+            self.assertEqual([os.path.basename(f) for f in files], ["run_bending.vtu", "run_torsion.vtu"])
+            pvd = ET.parse(os.path.join(tmpdir, "run.pvd")).getroot()
+            self.assertEqual([(d.get("timestep"), d.get("file")) for d in pvd.iter("DataSet")],
+                             [("0", "run_bending.vtu"), ("1", "run_torsion.vtu")])
+            header, arrays = read_vtu(files[1])
+
+        piece = header.find("UnstructuredGrid/Piece")
+        self.assertEqual((piece.get("NumberOfPoints"), piece.get("NumberOfCells")), ("3", "2"))
+        np.testing.assert_allclose(arrays["Points"], structure.node_coordinates())
+        self.assertEqual(arrays["connectivity"].ravel().tolist(), [0, 1, 1, 2])
+        self.assertEqual(arrays["offsets"].ravel().tolist(), [2, 4])
+        self.assertEqual(arrays["types"].ravel().tolist(), [3, 3])
+        np.testing.assert_allclose(arrays["rotations"], torsion.nodal_displacements[:, 3:])
+        np.testing.assert_allclose(arrays["tau_torsion_node2"].ravel(), torsion.stress("tau_torsion", end=1))
+        self.assertEqual(arrays["group_id"].ravel().tolist(), [1, 0])
+        self.assertEqual(arrays["group_names"], ["fork", "frame"])
+
+    def test_case_names_in_file_names(self):
+        structure = Structure()
+        beamProp = BeamProperties(210e3, 81.2e3, 475, 1.7e5, 1.7e5, 50, 50)
+        structure.add_nodes([(0, 0, 0), (500, 0, 0)])
+        structure.add_beams([(0, 1)], beamProp)
+        structure.add_support(0, [0, 1, 2, 3, 4, 5])
+        structure.add_load(1, [0, -1000, 0, 0, 0, 0])
+        cases = [LoadCaseResults(structure, structure.solve(), name) for name in ("bump 1/2", "bump 1 2")]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = write_vtu_series(os.path.join(tmpdir, "run.pvd"), cases)
+            self.assertEqual([os.path.basename(f) for f in files], ["run_bump_1_2.vtu", "run_bump_1_2_1.vtu"])
+            self.assertTrue(all(os.path.isfile(f) for f in files))
+            pvd = ET.parse(os.path.join(tmpdir, "run.pvd")).getroot()
+            self.assertEqual([d.get("name") for d in pvd.iter("DataSet")], ["bump 1/2", "bump 1 2"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import tempfile
+import numpy as np
+from core.structure import Structure
+from core.beamProperties import BeamProperties
+from core.factorization_cache import FactorizationCache, model_hash
+
+class TestFactorizationCache(unittest.TestCase):
+
+    def setUp(self):
+        self.structure = Structure()
+        beamProp = BeamProperties(210e3, 81.2e3, 2500, 520833.3, 520833.3, 50, 50)
+
+        nodes = [self.structure.add_node(x, 0, 0) for x in (0, 500, 1000, 1500)]
+        for n1, n2 in zip(nodes[:-1], nodes[1:]):
+            self.structure.add_beam(n1, n2, beamProp)
+
+        self.structure.add_support(0, [0, 1, 2, 3, 4, 5])
+        self.structure.add_load(3, [0, -1000, 0, 0, 0, 0])
+        self.U_ref = self.structure.solve()
+
+    def test_hash_ignores_loads(self):
+        key = model_hash(self.structure)
+        self.structure.add_load(2, [0, 0, 500, 0, 0, 0])
+        self.assertEqual(key, model_hash(self.structure))
+
+        self.structure.add_support(3, [1])
+        self.assertNotEqual(key, model_hash(self.structure))
+
+    def test_memory_cache_hit(self):
+        self.structure.factorization_cache = FactorizationCache()
+        self.structure.solve()
+        self.structure.add_load(3, [0, -2000, 0, 0, 0, 0])
+        U = self.structure.solve()
+
+        self.assertEqual(self.structure.factorization_cache.hits, 1)
+        np.testing.assert_allclose(U, 2 * self.U_ref)
+
+    def test_lru_eviction(self):
+        cache = FactorizationCache(max_entries=1)
+        self.structure.factorization_cache = cache
+        self.structure.solve()
+        self.structure.add_support(3, [1])
+        self.structure.solve()
+        self.assertEqual(len(cache), 1)
+
+    def test_disk_cache_roundtrip(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.structure.factorization_cache = FactorizationCache(cache_dir=cache_dir)
+            self.structure.solve()
+
+            # A fresh cache on the same directory starts with an empty memory
+            self.structure.factorization_cache = FactorizationCache(cache_dir=cache_dir)
+            U = self.structure.solve()
+
+            self.assertEqual(self.structure.factorization_cache.hits, 1)
+            np.testing.assert_allclose(U, self.U_ref, rtol=1e-10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+import numpy as np
+from core.structure import Structure
+from core.beamProperties import BeamProperties
+from core.influence import InfluenceAnalysis
+
+class TestInfluenceAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        self.structure = Structure()
+        fork = BeamProperties(210e3, 81.2e3, 444, 213333.3, 213333.3, 40, 40, t=3, name="fork")
+        frame = BeamProperties(210e3, 81.2e3, 475, 520833.3, 520833.3, 50, 50, t=2.5, name="frame")
+
+        # Frame beams along X, a fork extending them, and a side branch on a spring
+        self.structure.add_nodes([(0, 0, 0), (400, 0, 0), (800, 0, 0), (1000, 0, 0), (1200, 0, 0), (1400, 0, 0)])
+        self.structure.add_beams([(0, 1), (1, 2), (2, 3), (3, 4), (4, 5)], [frame, fork], [0, 0, 1, 1, 1])
+        self.structure.add_springs([(1, 4)], [0, 50, 0, 0, 0, 0])
+        self.structure.add_supports([0], [0, 1, 2, 3, 4, 5])
+
+    def test_direct_matches_adjoint(self):
+        nodes = range(len(self.structure.nodes))
+        direct = InfluenceAnalysis(self.structure, nodes, method="direct")
+        adjoint = InfluenceAnalysis(self.structure, nodes, method="adjoint")
+        np.testing.assert_allclose(adjoint.forces, direct.forces, atol=1e-8 * np.abs(direct.forces).max())
+
+    def test_chunked_solves(self):
+        nodes = range(len(self.structure.nodes))
+        reference = InfluenceAnalysis(self.structure, nodes, method="direct")
+        for method in ("direct", "adjoint"):
+            chunked = InfluenceAnalysis(self.structure, nodes, method=method, chunk_size=5)
+            np.testing.assert_allclose(chunked.forces, reference.forces, atol=1e-8 * np.abs(reference.forces).max())
+
+    def test_worst_stress_matches_solve(self):
+        influence = InfluenceAnalysis(self.structure, range(len(self.structure.nodes)), dofs=(1, 2))
+        fork_nodes = influence.group_nodes("fork")
+        np.testing.assert_array_equal(fork_nodes, [2, 3, 4, 5])
+
+        worst = influence.worst("sigma_total", group="frame", nodes=fork_nodes, load=-1000.0)
+        self.assertIn(worst["node"], fork_nodes)
+
+        # Brute force: one solve per load position
+        values = []
+        for nid in fork_nodes:
+            for dof in (1, 2):
+                load = np.zeros(6)
+                load[dof] = -1000.0
+                U = self.structure.solve_many([{"loads": {nid: load}}])[0]
+                values.append(self.structure.recover_element_results(U)["sigma_total"][:2].max())
+        self.assertAlmostEqual(worst["value"], max(values), places=6)
+
+    def test_worst_at_node2(self):
+        # Cantilever defined from the free tip (node1) to the support (node2)
+        structure = Structure()
+        frame = BeamProperties(210e3, 81.2e3, 475, 520833.3, 520833.3, 50, 50, t=2.5, name="frame")
+        structure.add_nodes([(0, 0, 0), (500, 0, 0)])
+        structure.add_beams([(0, 1)], frame)
+        structure.add_supports([1], [0, 1, 2, 3, 4, 5])
+
+        influence = InfluenceAnalysis(structure, [0], dofs=(1, 2))
+        worst = influence.worst("sigma_total", load=-1000.0)
+        self.assertEqual(worst["end"], 1)
+
+        load = np.zeros(6)
+        load[worst["dof"]] = -1000.0
+        U = structure.solve_many([{"loads": {0: load}}])[0]
+        reference = structure.recover_element_results(U)["sigma_total"][0]
+        self.assertAlmostEqual(worst["value"], reference[1], places=6)
+        self.assertAlmostEqual(worst["value"], 1000.0 * 500 * 25 / 520833.3, places=6)
+
+if __name__ == '__main__':
+    unittest.main()
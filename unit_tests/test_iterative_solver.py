@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+from core.structure import Structure
+from core.beamProperties import BeamProperties
+
+class TestPCGSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.structure = Structure()
+        beamProp = BeamProperties(210e3, 81.2e3, 2500, 520833.3, 520833.3, 50, 50)
+
+        # Two-bay portal frame
+        coords = [(0, 0, 0), (1000, 0, 0), (2000, 0, 0),
+                  (0, 1000, 0), (1000, 1000, 0), (2000, 1000, 0)]
+        nodes = [self.structure.add_node(*c) for c in coords]
+        for i, j in [(0, 3), (1, 4), (2, 5), (3, 4), (4, 5), (0, 4)]:
+            self.structure.add_beam(nodes[i], nodes[j], beamProp)
+
+        for nid in (0, 1, 2):
+            self.structure.add_support(nid, [0, 1, 2, 3, 4, 5])
+        self.structure.add_load(3, [500, 0, 0, 0, 0, 0])
+        self.structure.add_load(5, [0, -1000, 200, 0, 0, 0])
+
+        self.U_ref = self.structure.solve()
+
+    def test_preconditioners_match_direct(self):
+        for preconditioner in (None, "jacobi", "block_jacobi", "ic"):
+            U = self.structure.solve(method="pcg", preconditioner=preconditioner, tol=1e-12)
+            info = self.structure.solver_info
+
+            self.assertTrue(info["converged"], preconditioner)
+            self.assertEqual(info["iterations"], len(info["residual_history"]) - 1)
+            np.testing.assert_allclose(U, self.U_ref, rtol=1e-6, atol=1e-9 * np.abs(self.U_ref).max())
+
+    def test_warm_start(self):
+        self.structure.solve(method="pcg", tol=1e-12)
+        cold_iterations = self.structure.solver_info["iterations"]
+
+        self.structure.add_load(5, [0, -1010, 200, 0, 0, 0])
+        self.structure.solve(method="pcg", x0=self.U_ref, tol=1e-12)
+        self.assertLess(self.structure.solver_info["iterations"], cold_iterations)
+
+        self.structure.solve(method="pcg", x0=self.structure.solve(), tol=1e-8)
+        self.assertEqual(self.structure.solver_info["iterations"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
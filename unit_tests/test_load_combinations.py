@@ -0,0 +1,88 @@
+import unittest
+import numpy as np
+from core.structure import Structure
+from core.beamProperties import BeamProperties
+from core.load_combinations import LoadCombinations
+from core.superelement import Superelement
+
+class TestLoadCombinations(unittest.TestCase):
+
+    def setUp(self):
+        self.structure = Structure()
+        beamProp = BeamProperties(210e3, 81.2e3, 2500, 520833.3, 520833.3, 50, 50)
+
+        # Cantilever along X, clamped over its first span
+        nodes = self.structure.add_nodes([(0, 0, 0), (500, 0, 0), (1000, 0, 0), (1500, 0, 0)])
+        self.structure.add_beams([(0, 1), (1, 2), (2, 3)], beamProp)
+        self.structure.add_supports(nodes[:2], [0, 1, 2, 3, 4, 5])
+
+        self.cases = {"dead": {2: [0, -1000, 0, 0, 0, 0], 3: [0, -500, 0, 0, 0, 0]},
+                      "skid": {3: [200, 0, 300, 0, 0, 0]}}
+        self.combos = LoadCombinations(self.structure, self.cases)
+        self.combos.add_combination("ULS", {"dead": 1.35, "skid": 1.5})
+        self.combos.add_combinations(["SLS", "uplift"], [[1.0, 1.0], [-1.0, 0.0]])
+
+    def solve_combination(self, factors):
+        loads = {}
+        for case, factor in factors.items():
+            for nid, load in self.cases[case].items():
+                loads[nid] = loads.get(nid, 0) + factor * np.asarray(load, dtype=float)
+        return self.structure.solve_many([{"loads": loads}])[0]
+
+    def test_matches_direct_solution(self):
+        U = self.solve_combination({"dead": 1.35, "skid": 1.5})
+        np.testing.assert_allclose(self.combos.displacements("ULS"), U, atol=1e-12)
+        np.testing.assert_allclose(self.combos.internal_forces("ULS"),
+                                   self.structure.element_internal_forces(U), atol=1e-6)
+        self.assertEqual(self.combos.displacements().shape, (24, 3))
+        self.assertEqual(self.combos.internal_forces().shape, (3, 12, 3))
+
+    def test_envelope(self):
+        forces = self.combos.internal_forces()
+        envelope = self.combos.envelope(chunk_size=2)
+        np.testing.assert_allclose(envelope["min"], forces.min(axis=-1))
+        np.testing.assert_allclose(envelope["max"], forces.max(axis=-1))
+        np.testing.assert_array_equal(envelope["max_combination"], forces.argmax(axis=-1))
+
+        envelope = self.combos.envelope("displacements")
+        # Tip deflection in Y: most negative for ULS, most positive for uplift
+        self.assertEqual(envelope["min_combination"][19], 0)
+        self.assertEqual(envelope["max_combination"][19], 2)
+        with self.assertRaises(ValueError):
+            self.combos.add_combination("bad", {"wind": 1.0})
+
+    def test_superelement_loads_counted_once(self):
+        beamProp = BeamProperties(210e3, 81.2e3, 2500, 520833.3, 520833.3, 50, 50)
+
+        # Loaded sub-assembly condensed onto its ends, placed at the cantilever tip
+        sub = Structure()
+        sub.add_nodes([(0, 0, 0), (250, 0, 0), (500, 0, 0)])
+        sub.add_beams([(0, 1), (1, 2)], beamProp)
+        sub.add_load(1, [0, -300, 0, 0, 0, 0])
+        superelement = Superelement(sub, [0, 2])
+        self.structure.add_nodes([(2000, 0, 0)])
+        self.structure.add_superelement(superelement, [self.structure.nodes[3], self.structure.nodes[4]])
+
+        # Reference: the same sub-assembly modeled with beams, its load in "dead"
+        full = Structure()
+        full.add_nodes([(0, 0, 0), (500, 0, 0), (1000, 0, 0), (1500, 0, 0), (2000, 0, 0), (1750, 0, 0)])
+        full.add_beams([(0, 1), (1, 2), (2, 3), (3, 5), (5, 4)], beamProp)
+        full.add_supports([0, 1], [0, 1, 2, 3, 4, 5])
+        dead = {**self.cases["dead"], 5: [0, -300, 0, 0, 0, 0]}
+        uls = {nid: 1.35 * np.asarray(dead.get(nid, np.zeros(6)), dtype=float) +
+                    1.5 * np.asarray(self.cases["skid"].get(nid, np.zeros(6)), dtype=float)
+               for nid in set(dead) | set(self.cases["skid"])}
+        U_full = full.solve_many([{"loads": uls}])[0]
+
+        combos = LoadCombinations(self.structure, self.cases, superelement_case="dead")
+        combos.add_combination("ULS", {"dead": 1.35, "skid": 1.5})
+        np.testing.assert_allclose(combos.displacements("ULS"), U_full[:30], rtol=1e-9, atol=1e-12)
+
+        # The condensed loads as a basic case of their own
+        combos = LoadCombinations(self.structure, self.cases, superelement_case="sub")
+        self.assertEqual(combos.case_names, ["dead", "skid", "sub"])
+        combos.add_combination("ULS", {"dead": 1.35, "skid": 1.5, "sub": 1.35})
+        np.testing.assert_allclose(combos.displacements("ULS"), U_full[:30], rtol=1e-9, atol=1e-12)
+
+if __name__ == '__main__':
+    unittest.main()
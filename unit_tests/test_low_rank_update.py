@@ -0,0 +1,67 @@
+import unittest
+from unittest import mock
+import numpy as np
+from core.structure import Structure
+from core.beamProperties import BeamProperties
+
+class TestLowRankUpdate(unittest.TestCase):
+
+    def build(self, k_spring):
+        s = Structure()
+        beamProp = BeamProperties(210e3, 81.2e3, 2500, 520833.3, 520833.3, 50, 50)
+        nodes = [s.add_node(x, 0, 0) for x in (0, 500, 1000, 1500)]
+        for n1, n2 in zip(nodes[:-1], nodes[1:]):
+            s.add_beam(n1, n2, beamProp)
+        ground = s.add_node(1500, 0, 0)
+        s.add_spring(nodes[2], nodes[3], [0, k_spring, 0, 0, 0, 0])
+        s.add_spring(nodes[3], ground, [0, k_spring, k_spring, 0, 0, 0])
+        s.add_support(0, [0, 1, 2, 3, 4, 5])
+        s.add_support(ground.id, [0, 1, 2, 3, 4, 5])
+        s.add_load(3, [0, -1000, 500, 0, 0, 0])
+        return s
+
+    def test_spring_change_uses_update(self):
+        s = self.build(6.0)
+        s.low_rank_update = True
+        s.solve()
+
+        s.spring_elements.clear()
+        s.add_spring(s.nodes[2], s.nodes[3], [0, 600.0, 0, 0, 0, 0])
+        s.add_spring(s.nodes[3], s.nodes[4], [0, 600.0, 600.0, 0, 0, 0])
+        U = s.solve()
+
+        self.assertEqual(s.solver_info["update_rank"], 3)
+        np.testing.assert_allclose(U, self.build(600.0).solve(), rtol=1e-8, atol=1e-12)
+
+    def test_large_change_rejected_early(self):
+        s = self.build(6.0)
+        s.low_rank_update = True
+        s.max_update_rank = 4
+        s.solve()
+
+        # A section change on every beam touches all beam DOFs
+        stiffer = BeamProperties(210e3, 81.2e3, 5000, 1e6, 1e6, 50, 50)
+        nodes = s.nodes[:4]
+        s.elements.clear()
+        for n1, n2 in zip(nodes[:-1], nodes[1:]):
+            s.add_beam(n1, n2, stiffer)
+        with mock.patch("core.low_rank_update.np.linalg.eigh") as eigh:
+            s.solve()
+        eigh.assert_not_called()
+        self.assertNotIn("update_rank", s.solver_info)
+
+    def test_support_change_refactorizes(self):
+        s = self.build(6.0)
+        s.low_rank_update = True
+        s.solve()
+
+        s.add_support(2, [1])
+        U = s.solve()
+        self.assertNotIn("update_rank", s.solver_info)
+
+        reference = self.build(6.0)
+        reference.add_support(2, [1])
+        np.testing.assert_allclose(U, reference.solve())
+
+if __name__ == '__main__':
+    unittest.main()
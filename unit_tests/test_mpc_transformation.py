@@ -0,0 +1,79 @@
+import unittest
+import numpy as np
+from core.structure import Structure
+from core.beamProperties import BeamProperties
+
+E, G, I = 210e3, 81.2e3, 520833.3
+L, ARM, P = 1000.0, 500.0, -1000.0
+
+class TestMPCTransformation(unittest.TestCase):
+
+    def setUp(self):
+        self.beamProp = BeamProperties(E, G, 2500, I, I, 50, 50)
+
+    def cantilever_with_arm(self, connector):
+        s = Structure()
+        s.mpc_method = "transformation"
+        n0 = s.add_node(0, 0, 0)
+        n1 = s.add_node(L, 0, 0)
+        n2 = s.add_node(L + ARM, 0, 0)
+        s.add_beam(n0, n1, self.beamProp)
+        if connector == "rbe2":
+            s.add_rbe2(n1, [n2])
+        else:
+            s.add_rigid(n2, n1)
+        s.add_support(n0.id, [0, 1, 2, 3, 4, 5])
+        s.add_load(n2.id, [0, P, 0, 0, 0, 0])
+        return s
+
+    def test_rbe2_rigid_arm(self):
+        U = self.cantilever_with_arm("rbe2").solve()
+
+        # Tip load on a rigid arm: shear P and moment P * ARM at the beam end
+        uy1 = P * L**3 / (3 * E * I) + P * ARM * L**2 / (2 * E * I)
+        rz1 = P * L**2 / (2 * E * I) + P * ARM * L / (E * I)
+        self.assertAlmostEqual(U[6 + 1], uy1, delta=1e-6 * abs(uy1))
+        self.assertAlmostEqual(U[6 + 5], rz1, delta=1e-6 * abs(rz1))
+        self.assertAlmostEqual(U[12 + 1], uy1 + ARM * rz1, delta=1e-6 * abs(uy1))
+
+    def test_rigid_matches_rbe2(self):
+        np.testing.assert_allclose(self.cantilever_with_arm("rigid").solve(),
+                                   self.cantilever_with_arm("rbe2").solve())
+
+    def test_rbe3_distributes_load(self):
+        s = Structure()
+        s.mpc_method = "transformation"
+        a, b = s.add_node(0, 0, 0), s.add_node(L, 0, 0)
+        c, d = s.add_node(0, 0, 200), s.add_node(L, 0, 200)
+        ref = s.add_node(L, 0, 100)
+        s.add_beam(a, b, self.beamProp)
+        s.add_beam(c, d, self.beamProp)
+        s.add_rbe3(ref, [b, d])
+        s.add_support(a.id, [0, 1, 2, 3, 4, 5])
+        s.add_support(c.id, [0, 1, 2, 3, 4, 5])
+        s.add_load(ref.id, [0, P, 0, 0, 0, 0])
+        U = s.solve()
+
+        # Each cantilever carries half of the load; the reference follows the average
+        uy = (P / 2) * L**3 / (3 * E * I)
+        for nid in (b.id, d.id, ref.id):
+            self.assertAlmostEqual(U[6 * nid + 1], uy, delta=1e-6 * abs(uy))
+
+    def test_support_on_dependent_node(self):
+        s = self.cantilever_with_arm("rbe2")
+        s.add_support(2, [1])
+        with self.assertRaises(ValueError):
+            s.solve()
+
+    def test_legacy_method(self):
+        s = self.cantilever_with_arm("rbe2")
+        s.mpc_method = "legacy"
+        K = s.assemble_global_stiffness()
+        F = s.assemble_load_vector()
+        K_red, F_red, free_dofs = s.apply_boundary_conditions(K, F)
+        U = np.zeros(K.shape[0])
+        U[free_dofs] = np.linalg.solve(K_red, F_red)
+        np.testing.assert_allclose(s.solve(), U, atol=1e-12)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import matplotlib.pyplot as plt
+from core.structure import Structure
+from core.beamProperties import BeamProperties
+from core.results import LoadCaseResults
+from core.visualise_structure import visualize_structure
+from core.FEA_3D_code_wrapper import FEA_wrapper
+from core.render_pipeline import RenderPipeline, figure_jobs, process_pool, STRESS_PLOTS
+
+class TestRenderPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.structure = Structure()
+        beamProp = BeamProperties(210e3, 81.2e3, 475, 1.7e5, 1.7e5, 50, 50, name="frame")
+        self.structure.add_nodes([(0, 0, 0), (500, 0, 0), (500, 0, 500)])
+        self.structure.add_beams([(0, 1), (1, 2)], beamProp)
+        self.structure.add_support(0, [0, 1, 2, 3, 4, 5])
+        self.structure.add_load(2, [0, -1000, 0, 0, 0, 0])
+        self.results = LoadCaseResults(self.structure, self.structure.solve(), "bending")
+        self.cwd = os.getcwd()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmpdir.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmpdir.cleanup()
+
+    def test_jobs_are_arrays(self):
+        jobs = figure_jobs(self.structure, self.results)
+        self.assertEqual(len(jobs), 1 + len(STRESS_PLOTS))
+        self.assertEqual(jobs[0][1]["data"]["beams"].tolist(), [[0, 1], [1, 2]])
+
+    def test_batched_structure_plot(self):
+        artists = {}
+        def count_artists(*args, **kwargs):
+            ax = plt.gcf().axes[0]
+            artists.update(lines=len(ax.lines), collections=len(ax.collections))
+        with mock.patch("core.visualise_structure.plt.savefig", side_effect=count_artists):
+            visualize_structure(self.structure, self.results.U, name="bending", batched=True)
+        # undeformed and deformed beams, load arrows, supports
+        self.assertEqual(artists, {"lines": 0, "collections": 4})
+
+    def test_parallel_render(self):
+        pipeline = RenderPipeline(max_workers=2)
+        try:
+            pipeline.submit(self.structure, self.results)
+            images = pipeline.wait()
+        finally:
+            pipeline.close()
+        expected = ["displacement_visualisation_bending.png"] + \
+                   ["{0}_stress_bending.png".format(component) for component in STRESS_PLOTS]
+        self.assertEqual(images, {"bending": expected})
+        for image in expected:
+            self.assertGreater(os.path.getsize(image), 0)
+
+    def test_start_method(self):
+        pipeline = RenderPipeline(max_workers=2)
+        self.assertEqual(pipeline._pool()._mp_context.get_start_method(), "forkserver")
+        pipeline.close()
+        with mock.patch("core.render_pipeline.multiprocessing.get_all_start_methods", return_value=["spawn"]):
+            with process_pool(1) as pool:
+                self.assertEqual(pool._mp_context.get_start_method(), "spawn")
+
+    def test_wrapper_closes_pool(self):
+        wrapper = FEA_wrapper()
+        wrapper.frameStructure, wrapper.U = self.structure, self.results.U
+        wrapper.enableParallelRendering(max_workers=2)
+        wrapper.exportResults("first", textExports=False)
+        first = wrapper.renderPipeline
+
+        # Re-enabling collects the queued figures and shuts the old pool down
+        wrapper.enableParallelRendering(max_workers=2)
+        self.assertIsNone(first._executor)
+        self.assertEqual(len(wrapper.images["first"]), 1 + len(STRESS_PLOTS))
+
+        wrapper.exportResults("second", textExports=False)
+        wrapper.renderFigures()
+        self.assertIsNone(wrapper.renderPipeline._executor)
+        self.assertEqual(sorted(wrapper.images), ["first", "second"])
+        wrapper.closeParallelRendering()
+        self.assertIsNone(wrapper.renderPipeline)
+
+if __name__ == '__main__':
+    unittest.main()
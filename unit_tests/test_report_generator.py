@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from docx import Document
+from docx.oxml.ns import qn
+from core.structure import Structure
+from core.beamProperties import BeamProperties
+from core.results import LoadCaseResults
+from core.report_generator import EngineeringReportGenerator
+
+class TestReportGenerator(unittest.TestCase):
+
+    def test_structured_results(self):
+        structure = Structure()
+        beamProp = BeamProperties(210e3, 81.2e3, 475, 1.7e5, 1.7e5, 50, 50, t=2.5, name="frame")
+        structure.add_nodes([(0, 0, 0), (500, 0, 0), (1000, 0, 0)])
+        structure.add_beams([(0, 1), (1, 2)], beamProp)
+        structure.add_support(0, [0, 1, 2, 3, 4, 5])
+        structure.add_load(2, [0, 0, -1000, 0, 0, 0])
+        results = LoadCaseResults(structure, structure.solve(), "bending")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # A stray file that directory scanning would pick up as a load case
+            open(os.path.join(tmpdir, "stresses_output_stray.dat"), "w").close()
+            output = os.path.join(tmpdir, "report")
+            gen = EngineeringReportGenerator(tmpdir, output, results={"bending": results}, properties=[beamProp])
+            gen.generate()
+            doc = Document(output + ".docx")
+
+        headings = [p.text for p in doc.paragraphs if p.style.name.startswith("Heading")]
+        self.assertIn("Loadcase: bending", headings)
+        self.assertNotIn("Loadcase: stray", headings)
+
+        properties, max_stress, stresses, max_disp, displacements = doc.tables
+        self.assertEqual([c.text for c in properties.rows[1].cells], ["E", "210000.0", "Young's modulus (MPa)"])
+        self.assertEqual(max_stress.rows[1].cells[2].text, f"{results.max_von_mises[1]:.2f}")
+        self.assertEqual(len(stresses.rows), 3)
+        self.assertEqual(max_disp.rows[1].cells[0].text, "2")
+        self.assertEqual(len(displacements.rows), 4)
+
+    def test_bulk_table(self):
+        doc = Document()
+        gen = EngineeringReportGenerator()
+        table = gen.add_bulk_table(doc, ["ID", "Group", "Value"],
+                                   [np.arange(3), np.array(["a", "b&<c>", None], dtype=object),
+                                    np.char.mod('%.2f', [1.0, -2.5, 3.125])])
+        self.assertEqual([[c.text for c in row.cells] for row in table.rows],
+                         [["ID", "Group", "Value"], ["0", "a", "1.00"], ["1", "b&<c>", "-2.50"], ["2", "None", "3.12"]])
+        self.assertEqual(len(table._tbl.tblPr.findall(qn('w:tblBorders'))), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from unittest import mock
+import numpy as np
+from core.structure import Structure
+from core.beamProperties import BeamProperties
+from core.results import LoadCaseResults
+
+class TestLoadCaseResults(unittest.TestCase):
+
+    def setUp(self):
+        self.structure = Structure()
+        beamProp = BeamProperties(210e3, 81.2e3, 475, 1.7e5, 1.7e5, 50, 50, name="frame")
+        self.structure.add_nodes([(0, 0, 0), (500, 0, 0), (1000, 0, 0)])
+        self.structure.add_beams([(0, 1), (1, 2)], beamProp)
+        self.structure.add_support(0, [0, 1, 2, 3, 4, 5])
+        self.structure.add_load(2, [100, 0, -1000, 0, 0, 0])
+        self.U = self.structure.solve()
+
+    def test_recovered_once(self):
+        results = LoadCaseResults(self.structure, self.U, "bending")
+        with mock.patch.object(self.structure, "recover_element_results",
+                               wraps=self.structure.recover_element_results) as recover:
+            for component in ("sigma_axial", "sigma_total", "von_mises"):
+                results.stress(component)
+            results.element_forces
+            results.max_von_mises
+            self.assertEqual(recover.call_count, 1)
+
+    def test_values(self):
+        results = LoadCaseResults(self.structure, self.U)
+        reference = self.structure.recover_element_results(self.U)
+        np.testing.assert_allclose(results.stress("von_mises"), reference["von_mises"][:, 0])
+        self.assertEqual(results.max_von_mises[0], 0)  # root element carries the largest moment
+        self.assertEqual(results.max_displacement[0], 2)
+        self.assertAlmostEqual(results.max_displacement[1], np.linalg.norm(self.U[12:15]))
+        self.assertEqual(list(results.element_groups), ["frame", "frame"])
+
+if __name__ == '__main__':
+    unittest.main()
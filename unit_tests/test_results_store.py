@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from core.structure import Structure
+from core.beamProperties import BeamProperties
+from core.results import LoadCaseResults
+from core.results_store import ResultsWriter, ResultsReader
+
+class TestResultsStore(unittest.TestCase):
+
+    def setUp(self):
+        self.structure = Structure()
+        beamProp = BeamProperties(210e3, 81.2e3, 475, 1.7e5, 1.7e5, 50, 50, name="frame")
+        self.structure.add_nodes([(0, 0, 0), (500, 0, 0), (1000, 0, 0)])
+        self.structure.add_beams([(0, 1), (1, 2)], beamProp)
+        self.structure.add_support(0, [0, 1, 2, 3, 4, 5])
+        U = self.structure.solve_many([{"loads": {2: [0, 0, -1000, 0, 0, 0]}},
+                                       {"loads": {2: [200, 500, 0, 1e4, 0, 0]}}])
+        self.cases = [LoadCaseResults(self.structure, u, name) for u, name in zip(U, ["bending", "mixed"])]
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "run.fea")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        with ResultsWriter(self.path, metadata={"frame": "test"}) as writer:
+            writer.add(self.cases[0])
+            # The file is readable while the run continues
+            self.assertEqual(ResultsReader(self.path).case_names, ["bending"])
+            writer.add(self.cases[1])
+
+        reader = ResultsReader(self.path)
+        self.assertEqual(reader.case_names, ["bending", "mixed"])
+        self.assertEqual(reader.metadata, {"frame": "test"})
+        np.testing.assert_array_equal(reader.node_coordinates, self.structure.node_coordinates())
+        np.testing.assert_array_equal(reader.beam_connectivity, [[0, 1], [1, 2]])
+        self.assertEqual(list(reader.element_groups), ["frame", "frame"])
+
+        for case in self.cases:
+            stored = reader.results(case.name)
+            self.assertIsInstance(stored.element_results, np.memmap)
+            np.testing.assert_array_equal(stored.element_results, case.element_results)
+            np.testing.assert_array_equal(stored.nodal_displacements, case.nodal_displacements)
+            self.assertEqual(stored.max_von_mises, case.max_von_mises)
+
+    def test_replace_and_errors(self):
+        with ResultsWriter(self.path) as writer:
+            writer.add(self.cases[0])
+            writer.add(LoadCaseResults(self.structure, self.cases[1].U, "bending"))
+        reader = ResultsReader(self.path)
+        self.assertEqual(reader.case_names, ["bending"])
+        np.testing.assert_array_equal(reader.displacements("bending"), self.cases[1].nodal_displacements)
+        with self.assertRaises(KeyError):
+            reader.displacements("missing")
+
+        with open(self.path, "r+b") as f:
+            f.write(b"NOTAFILE")
+        with self.assertRaises(ValueError):
+            ResultsReader(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
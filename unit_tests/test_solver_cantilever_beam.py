@@ -1,6 +1,6 @@
 import unittest
 import numpy as np
-from core.beam import BeamElement3D
+from core.beam import BeamElement3D, compute_global_stiffness_batch
 from core.beamProperties import BeamProperties
 from core.node import Node
 from core.structure import Structure
@@ -30,6 +30,20 @@ class TestBeamElement3D(unittest.TestCase):
         I = np.eye(3)
         np.testing.assert_array_almost_equal(R.T @ R, I, decimal=6)
 
+    def test_batch_stiffness_matches_element(self):
+        beamProp = BeamProperties(210e9, 81e9, 0.003, 5.2e-7, 3.1e-7, 1.0e-6)
+        ends = [((0, 0, 0), (0, 0, 2.0)),      # vertical, uses global Y as reference
+                ((0, 0, 0), (1.0, 2.0, -0.5)),
+                ((1.0, 1.0, 1.0), (-1.0, 0.5, 1.0))]
+        elements = [BeamElement3D(Node(0, *p1), Node(1, *p2), beamProp) for p1, p2 in ends]
+
+        props = [np.full(len(ends), getattr(beamProp, name)) for name in ("E", "G", "A", "Iy", "Iz", "J")]
+        k_batch = compute_global_stiffness_batch([p1 for p1, _ in ends], [p2 for _, p2 in ends], *props)
+
+        self.assertEqual(k_batch.shape, (3, 12, 12))
+        for elem, k in zip(elements, k_batch):
+            np.testing.assert_allclose(k, elem.k_global, rtol=1e-12, atol=1e-6)
+
 class TestStructureSolve(unittest.TestCase):
 
     def setUp(self):
@@ -59,4 +73,27 @@ class TestStructureSolve(unittest.TestCase):
         ry = U[6 + 4]  # Node 1, rotation Y
 
         self.assertAlmostEqual(uz, self.expected_uz, delta=1e-4)
-        self.assertAlmostEqual(ry, self.expected_ry, delta=1e-4)
\ No newline at end of file
+        self.assertAlmostEqual(ry, self.expected_ry, delta=1e-4)
+
+    def test_element_results(self):
+        structure = Structure()
+        beamProp = BeamProperties(210e3, 81e3, 475, 1.7e5, 1.7e5, 50, 50)
+        structure.add_nodes([(0, 0, 0), (500, 0, 0), (1000, 0, 0)])
+        structure.add_beams([(0, 1), (1, 2)], beamProp)
+        structure.add_support(0, [0, 1, 2, 3, 4, 5])
+        structure.add_load(2, [100, 0, -1000, 2e4, 0, 0])
+        U = structure.solve()
+
+        results = structure.recover_element_results(U)
+        self.assertEqual(results.shape, (2,))
+        self.assertEqual(results["von_mises"].shape, (2, 2))
+        for k, elem in enumerate(structure.elements):
+            f_local = elem.compute_internal_forces(U, elem.node1.id, elem.node2.id)
+            np.testing.assert_allclose(results["forces"][k], f_local, atol=1e-9 * np.abs(f_local).max())
+            for key, value in elem.compute_stresses(f_local, 25, 25, 25).items():
+                self.assertAlmostEqual(results[key][k, 0], value)
+
+        # Same section forces on both sides of the middle node, none at the free tip
+        for key in ("sigma_axial", "sigma_bending_y", "sigma_bending_z", "tau_torsion", "von_mises"):
+            self.assertAlmostEqual(results[key][0, 1], results[key][1, 0])
+        self.assertAlmostEqual(results["sigma_total"][1, 1], 0.0)
@@ -2,6 +2,7 @@ import unittest
 import numpy as np
 from core.structure import Structure  
 from core.beamProperties import BeamProperties
+from core.dof_ordering import compute_node_ordering, reduced_dof_order, bandwidth
 
 class TestCubeStructure(unittest.TestCase):
 
@@ -50,5 +51,52 @@ class TestCubeStructure(unittest.TestCase):
         self.assertTrue(uz < 0, "Node should move downward under load.")
         self.assertAlmostEqual(uz, -6.62e-6, delta=5e-6)
 
+    def test_node_lookup(self):
+        self.assertIs(self.structure.getNodeById(3), self.nodes[3])
+        self.assertEqual(self.structure.getNodesByIds([7, 0, self.center_node.id]),
+                         [self.nodes[7], self.nodes[0], self.center_node])
+        with self.assertRaises(KeyError):
+            self.structure.getNodeById(len(self.structure.nodes))
+
+    def test_sparse_matches_dense(self):
+        K = self.structure.assemble_global_stiffness()
+        F = self.structure.assemble_load_vector()
+        K_red, F_red, free_dofs = self.structure.apply_boundary_conditions(K, F)
+        U_dense = np.zeros(K.shape[0])
+        U_dense[free_dofs] = np.linalg.solve(K_red, F_red)
+
+        K_sparse = self.structure.assemble_global_stiffness_sparse()
+        self.assertEqual(K_sparse.format, "csr")
+        np.testing.assert_allclose(K_sparse.toarray(), K)
+        np.testing.assert_allclose(self.structure.solve(), U_dense, atol=1e-12)
+
+    def test_solve_many_matches_solve(self):
+        U_ref = self.structure.solve()
+        pinned = {nid: [0, 1, 2] for nid in [0, 1, 2, 3]}
+        load = {self.center_node.id: [0, 0, -1000.0, 0, 0, 0]}
+
+        results = self.structure.solve_many([
+            {"loads": load},
+            {"loads": {nid: 2 * np.asarray(f) for nid, f in load.items()}},
+            {"loads": load, "supports": pinned},
+        ])
+
+        np.testing.assert_allclose(results[0], U_ref)
+        np.testing.assert_allclose(results[1], 2 * U_ref)
+        self.structure.supports = pinned
+        np.testing.assert_allclose(results[2], self.structure.solve())
+
+    def test_rcm_ordering(self):
+        U_ref = self.structure.solve()
+
+        K = self.structure.assemble_global_stiffness_sparse()
+        node_order = compute_node_ordering(self.structure)
+        order = reduced_dof_order(node_order, np.arange(K.shape[0]))
+        self.assertEqual(sorted(node_order), list(range(len(self.structure.nodes))))
+        self.assertLessEqual(bandwidth(K[order][:, order]), bandwidth(K))
+
+        self.structure.dof_ordering = "rcm"
+        np.testing.assert_allclose(self.structure.solve(), U_ref, atol=1e-15)
+
 if __name__ == '__main__':
     unittest.main()
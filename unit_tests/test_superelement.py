@@ -0,0 +1,79 @@
+import unittest
+import numpy as np
+from core.structure import Structure
+from core.beamProperties import BeamProperties
+from core.superelement import Superelement
+
+class TestSuperelement(unittest.TestCase):
+
+    def setUp(self):
+        self.beamProp = BeamProperties(210e3, 81.2e3, 2500, 520833.3, 520833.3, 50, 50)
+
+        # Sub-assembly: three collinear beams, boundary at both ends, interior load
+        self.sub = Structure()
+        sub_nodes = [self.sub.add_node(x, 0, 0) for x in (0, 250, 500, 750)]
+        for n1, n2 in zip(sub_nodes[:-1], sub_nodes[1:]):
+            self.sub.add_beam(n1, n2, self.beamProp)
+        self.sub.add_load(1, [0, -300, 0, 0, 0, 0])
+        self.superelement = Superelement(self.sub, [0, 3])
+
+    def build_parent(self, offsets, inline, sub_load_dof=1):
+        """
+        Cantilever chain with repeated 750 mm segments, either condensed or
+        modeled with beams in line.
+        """
+        s = Structure()
+        ends = [s.add_node(x, 0, 0) for x in offsets]
+        for a, b in zip(ends[:-1], ends[1:]):
+            if inline:
+                mids = [s.add_node(a.coords[0] + dx, 0, 0) for dx in (250, 500)]
+                chain = [a] + mids + [b]
+                for n1, n2 in zip(chain[:-1], chain[1:]):
+                    s.add_beam(n1, n2, self.beamProp)
+                load = [0, 0, 0, 0, 0, 0]
+                load[sub_load_dof] = -300
+                s.add_load(mids[0].id, load)
+        s.add_support(0, [0, 1, 2, 3, 4, 5])
+        s.add_load(ends[-1].id, [0, 0, -1000, 0, 0, 0])
+        return s, ends
+
+    def test_condensed_matches_full_model(self):
+        full, _ = self.build_parent((0, 750, 1500), inline=True)
+        U_full = full.solve()
+
+        parent, ends = self.build_parent((0, 750, 1500), inline=False)
+        instances = [parent.add_superelement(self.superelement, [a, b])
+                     for a, b in zip(ends[:-1], ends[1:])]
+        U = parent.solve()
+
+        for node in ends:
+            np.testing.assert_allclose(U[node.dofs], U_full[node.dofs], rtol=1e-9, atol=1e-12)
+
+        # Interior recovery of the second segment (full-model nodes 3 and 4 lie in the first)
+        U_sub = instances[1].recover(U)
+        np.testing.assert_allclose(U_sub[6:12], U_full[6 * 5:6 * 5 + 6], rtol=1e-9, atol=1e-12)
+
+    def test_rotated_instance(self):
+        # 90 degrees about X: sub-model Y becomes parent Z
+        rotation = [[1, 0, 0], [0, 0, -1], [0, 1, 0]]
+        full, _ = self.build_parent((0, 750), inline=True, sub_load_dof=2)
+        parent, ends = self.build_parent((0, 750), inline=False)
+        parent.add_superelement(self.superelement, ends, rotation)
+
+        np.testing.assert_allclose(parent.solve()[ends[1].dofs], full.solve()[ends[1].dofs],
+                                   rtol=1e-9, atol=1e-12)
+
+    def test_solve_many_matches_solve(self):
+        parent, ends = self.build_parent((0, 750, 1500), inline=False)
+        for a, b in zip(ends[:-1], ends[1:]):
+            parent.add_superelement(self.superelement, [a, b])
+
+        U = parent.solve()
+        np.testing.assert_allclose(parent.solve_many([{"loads": parent.loads}])[0], U, rtol=1e-12, atol=1e-15)
+
+        # Opting out drops exactly the condensed interior loads
+        U_without = parent.solve_many([{"loads": parent.loads, "superelement_loads": False}])[0]
+        self.assertGreater(np.abs(U - U_without).max(), 1e-6)
+
+if __name__ == '__main__':
+    unittest.main()